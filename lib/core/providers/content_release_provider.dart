@@ -0,0 +1,55 @@
+import 'package:cloud_firestore/cloud_firestore.dart';
+import 'package:flutter/foundation.dart';
+import 'package:flutter_riverpod/flutter_riverpod.dart';
+import 'firebase_providers.dart';
+
+// ── Content releases ─────────────────────────────────────────────
+// `python3 seed.py --release` writes every static content doc under
+// releases/{version}/<path> and then flips config/content_release.
+// Released docs never change, so they are served from the local cache when
+// present; only the pointer is listened to, and a new version re-fetches.
+
+/// The live release version, or null while no release has been published.
+final contentReleaseProvider = StreamProvider<String?>((ref) {
+  return ref
+      .watch(firestoreProvider)
+      .collection('config')
+      .doc('content_release')
+      .snapshots()
+      .map((snapshot) => snapshot.data()?['version'] as String?);
+});
+
+/// A static content doc by its live path (e.g. 'config/symptoms'), read once
+/// from the current release, or from the live path when there is no release.
+final contentDocProvider =
+    FutureProvider.family<Map<String, dynamic>?, String>((ref, path) async {
+  final firestore = ref.watch(firestoreProvider);
+  final version = await ref.watch(contentReleaseProvider.future);
+  if (version == null) return (await firestore.doc(path).get()).data();
+  return _releasedDoc(firestore, version, path);
+});
+
+/// Like [contentDocProvider] for providers that used to listen to the live
+/// doc: without a release it keeps streaming live updates, while a pinned
+/// release version is immutable and read once.
+Stream<Map<String, dynamic>?> watchContentDoc(Ref ref, String path) async* {
+  final firestore = ref.watch(firestoreProvider);
+  final version = await ref.watch(contentReleaseProvider.future);
+  if (version == null) {
+    yield* firestore.doc(path).snapshots().map((snapshot) => snapshot.data());
+    return;
+  }
+  yield await _releasedDoc(firestore, version, path);
+}
+
+Future<Map<String, dynamic>?> _releasedDoc(
+    FirebaseFirestore firestore, String version, String path) async {
+  final doc = firestore.doc('releases/$version/$path');
+  try {
+    final cached = await doc.get(const GetOptions(source: Source.cache));
+    if (cached.exists) return cached.data();
+  } on FirebaseException catch (e) {
+    debugPrint('Release cache miss for $path: ${e.code}');
+  }
+  return (await doc.get()).data();
+}
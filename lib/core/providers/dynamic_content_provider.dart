@@ -1,16 +1,13 @@
+import 'package:cloud_firestore/cloud_firestore.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
+import 'content_release_provider.dart';
 import 'firebase_providers.dart';
+import 'mode_provider.dart';
 
 // Symptoms Provider
 final symptomsProvider = StreamProvider<List<Map<String, dynamic>>>((ref) {
-  final firestore = ref.watch(firestoreProvider);
-  return firestore
-      .collection('config')
-      .doc('symptoms')
-      .snapshots()
-      .map((snapshot) {
-    if (!snapshot.exists) return [];
-    final data = snapshot.data() as Map<String, dynamic>;
+  return watchContentDoc(ref, 'config/symptoms').map((data) {
+    if (data == null) return [];
     return (data['items'] as List)
         .map((item) => item as Map<String, dynamic>)
         .toList();
@@ -20,7 +17,11 @@ final symptomsProvider = StreamProvider<List<Map<String, dynamic>>>((ref) {
 // Education Content Provider
 final educationContentProvider =
     StreamProvider<List<Map<String, dynamic>>>((ref) {
-  final firestore = ref.watch(firestoreProvider);
+  return _publishedArticles(ref.watch(firestoreProvider));
+});
+
+Stream<List<Map<String, dynamic>>> _publishedArticles(
+    FirebaseFirestore firestore) {
   return firestore
       .collection('education_articles') // ← correct collection name
       .where('isPublished', isEqualTo: true)
@@ -28,18 +29,39 @@ final educationContentProvider =
       .snapshots()
       .map((snapshot) =>
           snapshot.docs.map((doc) => {...doc.data(), 'id': doc.id}).toList());
+}
+
+// Education Index Provider
+// One summary doc per language + mode (education_index/{language}_{mode})
+// holding only card fields, so the browse list is a single small read.
+// Falls back to the full article query if the index hasn't been seeded.
+final educationIndexProvider =
+    StreamProvider.family<List<Map<String, dynamic>>, String>(
+        (ref, language) {
+  final firestore = ref.watch(firestoreProvider);
+  final mode = ref.watch(modeProvider);
+  return watchContentDoc(ref, 'education_index/${language}_$mode')
+      .asyncExpand((index) {
+    final cards = index?['articles'];
+    if (cards is! List) return _publishedArticles(firestore);
+    return Stream.value(
+        cards.map((card) => Map<String, dynamic>.from(card as Map)).toList());
+  });
+});
+
+// Education Article Provider — full article (body, keyPoints), fetched on open
+final educationArticleProvider =
+    FutureProvider.family<Map<String, dynamic>?, String>((ref, id) async {
+  final data =
+      await ref.watch(contentDocProvider('education_articles/$id').future);
+  if (data == null) return null;
+  return {...data, 'id': id};
 });
 
 // Insights Tips Provider (Dynamic Tips for the Big Insight box)
 final insightTipsProvider = StreamProvider<List<Map<String, dynamic>>>((ref) {
-  final firestore = ref.watch(firestoreProvider);
-  return firestore
-      .collection('config')
-      .doc('insight_tips')
-      .snapshots()
-      .map((snapshot) {
-    if (!snapshot.exists) return [];
-    final data = snapshot.data() as Map<String, dynamic>;
+  return watchContentDoc(ref, 'config/insight_tips').map((data) {
+    if (data == null) return [];
     return (data['tips'] as List)
         .map((item) => item as Map<String, dynamic>)
         .toList();
@@ -1,5 +1,6 @@
 import 'package:cloud_firestore/cloud_firestore.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
+import '../../../core/providers/content_release_provider.dart';
 import '../../../core/providers/firebase_providers.dart';
 import '../../../core/providers/mode_provider.dart';
 
@@ -38,9 +39,32 @@ String _str(Map<String, dynamic> d, List<String> keys, [String fallback = '']) {
   return fallback;
 }
 
+// ── Read-optimised view ──────────────────────────────────────────
+// populate_self_care.py also writes config/self_care/views/{mode}: every
+// phase with its rituals inlined and already in display order. One read
+// replaces the 1 + phases + phases×rituals cascade; the per-phase tree
+// below is only read when the view hasn't been seeded yet.
+final selfCareViewProvider = StreamProvider<Map<String, dynamic>?>((ref) {
+  final currentMode = ref.watch(modeProvider);
+  return watchContentDoc(ref, 'config/self_care/views/$currentMode');
+});
+
+List<Map<String, dynamic>>? _viewPhases(Map<String, dynamic>? view) {
+  final phases = view?['phases'];
+  if (phases is! List) return null;
+  return phases.map((p) => Map<String, dynamic>.from(p as Map)).toList();
+}
+
+Map<String, dynamic>? _viewPhase(Map<String, dynamic>? view, String phase) {
+  for (final p in _viewPhases(view) ?? const <Map<String, dynamic>>[]) {
+    if (p['key'] == phase) return p;
+  }
+  return null;
+}
+
 // ── Phase data provider ──────────────────────────────────────────
 final phaseDataProvider =
-    StreamProvider.family<Map<String, String>, String>((ref, phase) {
+    StreamProvider.family<Map<String, String>, String>((ref, phase) async* {
   final firestore = ref.watch(firestoreProvider);
   final currentMode = ref.watch(modeProvider);
   final collectionName = _collectionFor(currentMode);
@@ -62,7 +86,14 @@ final phaseDataProvider =
     };
   }
 
-  return firestore
+  final view = await ref.watch(selfCareViewProvider.future);
+  if (_viewPhases(view) != null) {
+    final viewPhase = _viewPhase(view, phase);
+    yield viewPhase == null ? <String, String>{} : _parseDoc(viewPhase);
+    return;
+  }
+
+  yield* firestore
       .collection('config')
       .doc('self_care')
       .collection(collectionName)
@@ -85,26 +116,39 @@ final phaseDataProvider =
 
 // ── Ritual list provider ─────────────────────────────────────────
 final ritualListProvider =
-    StreamProvider.family<List<Map<String, String>>, String>((ref, phase) {
+    StreamProvider.family<List<Map<String, String>>, String>(
+        (ref, phase) async* {
   final firestore = ref.watch(firestoreProvider);
   final currentMode = ref.watch(modeProvider);
   final collectionName = _collectionFor(currentMode);
 
+  // Short keys first (HTML prototype format), long keys as fallback
+  Map<String, String> _parseRitual(Map<String, dynamic> d) {
+    return <String, String>{
+      'e': _str(d, ['e', 'emoji']),
+      't': _str(d, ['t', 'title']),
+      's': _str(d, ['s', 'subtitle']),
+      'dur': _str(d, ['dur', 'duration'], '0 min'),
+    };
+  }
+
   List<Map<String, String>> _parseDocs(
       List<QueryDocumentSnapshot<Map<String, dynamic>>> docs) {
-    return _sortByOrder(docs).map((doc) {
-      final d = doc.data();
-      // Short keys first (HTML prototype format), long keys as fallback
-      return <String, String>{
-        'e': _str(d, ['e', 'emoji']),
-        't': _str(d, ['t', 'title']),
-        's': _str(d, ['s', 'subtitle']),
-        'dur': _str(d, ['dur', 'duration'], '0 min'),
-      };
-    }).toList();
+    return _sortByOrder(docs).map((doc) => _parseRitual(doc.data())).toList();
   }
 
-  return firestore
+  final view = await ref.watch(selfCareViewProvider.future);
+  if (_viewPhases(view) != null) {
+    final rituals = _viewPhase(view, phase)?['rituals'];
+    yield rituals is List
+        ? rituals
+            .map((r) => _parseRitual(Map<String, dynamic>.from(r as Map)))
+            .toList()
+        : <Map<String, String>>[];
+    return;
+  }
+
+  yield* firestore
       .collection('config')
       .doc('self_care')
       .collection(collectionName)
@@ -130,33 +174,43 @@ final ritualListProvider =
 });
 
 // ── All phases for current mode provider ────────────────────────
-final phasesForModeProvider = StreamProvider<List<Map<String, dynamic>>>((ref) {
+final phasesForModeProvider =
+    StreamProvider<List<Map<String, dynamic>>>((ref) async* {
   final firestore = ref.watch(firestoreProvider);
   final currentMode = ref.watch(modeProvider);
   final collectionName = _collectionFor(currentMode);
 
+  Map<String, dynamic> _parsePhase(String key, Map<String, dynamic> d) {
+    // HTML prototype nests emoji+label under 'tab': {e:'🩸', l:'Menstrual'}
+    // Firestore may store them flat at root or still nested under 'tab'
+    final tabMap = d['tab'] as Map<String, dynamic>?;
+    final emoji = tabMap != null
+        ? _str(tabMap, ['e', 'emoji'])
+        : _str(d, ['e', 'emoji', 'hero_e']);
+    final label = tabMap != null
+        ? _str(tabMap, ['l', 'label'])
+        : _str(d, ['l', 'label']);
+    return <String, dynamic>{
+      'key': key,
+      'emoji': emoji,
+      'label': label,
+    };
+  }
+
   List<Map<String, dynamic>> _parseDocs(
       List<QueryDocumentSnapshot<Map<String, dynamic>>> docs) {
-    return _sortByOrder(docs).map((doc) {
-      final d = doc.data();
-      // HTML prototype nests emoji+label under 'tab': {e:'🩸', l:'Menstrual'}
-      // Firestore may store them flat at root or still nested under 'tab'
-      final tabMap = d['tab'] as Map<String, dynamic>?;
-      final emoji = tabMap != null
-          ? _str(tabMap, ['e', 'emoji'])
-          : _str(d, ['e', 'emoji', 'hero_e']);
-      final label = tabMap != null
-          ? _str(tabMap, ['l', 'label'])
-          : _str(d, ['l', 'label']);
-      return <String, dynamic>{
-        'key': doc.id,
-        'emoji': emoji,
-        'label': label,
-      };
-    }).toList();
+    return _sortByOrder(docs)
+        .map((doc) => _parsePhase(doc.id, doc.data()))
+        .toList();
   }
 
-  return firestore
+  final viewPhases = _viewPhases(await ref.watch(selfCareViewProvider.future));
+  if (viewPhases != null) {
+    yield viewPhases.map((p) => _parsePhase(p['key'] as String, p)).toList();
+    return;
+  }
+
+  yield* firestore
       .collection('config')
       .doc('self_care')
       .collection(collectionName)
@@ -39,43 +39,61 @@ class ArticleDetailScreen extends StatelessWidget {
     return spans;
   }
 
+  // ── Body blocks ─────────────────────────────────────────────
+  // Shared by the pre-rendered bodyTree and the raw markdown fallback.
+
+  // ### Sub-heading — colored with modeColor
+  Widget _subHeading(String text) {
+    return Padding(
+      padding: const EdgeInsets.only(top: 20, bottom: 4),
+      child: Text(
+        text,
+        style: GoogleFonts.nunito(
+          fontSize: 15,
+          fontWeight: FontWeight.w900,
+          color: modeColor,
+          height: 1.4,
+        ),
+      ),
+    );
+  }
+
+  // ## Section heading — dark text, larger
+  Widget _heading(String text) {
+    return Padding(
+      padding: const EdgeInsets.only(top: 24, bottom: 6),
+      child: Text(
+        text,
+        style: GoogleFonts.nunito(
+          fontSize: 18,
+          fontWeight: FontWeight.w900,
+          color: AppColors.textDark,
+          height: 1.3,
+        ),
+      ),
+    );
+  }
+
+  TextStyle get _paragraphStyle => GoogleFonts.nunito(
+        fontSize: 15,
+        fontWeight: FontWeight.w600,
+        color: AppColors.textDark,
+        height: 1.65,
+      );
+
   // Render full body string — handles ## / ### headings and **bold**
   List<Widget> _buildBodyWidgets(String body, Color tagColor) {
     final lines = body.split('\n');
     final widgets = <Widget>[];
 
     for (final line in lines) {
-      // ### Sub-heading — colored with modeColor
       if (line.startsWith('### ')) {
-        widgets.add(Padding(
-          padding: const EdgeInsets.only(top: 20, bottom: 4),
-          child: Text(
-            line.substring(4).trim(),
-            style: GoogleFonts.nunito(
-              fontSize: 15,
-              fontWeight: FontWeight.w900,
-              color: modeColor,
-              height: 1.4,
-            ),
-          ),
-        ));
+        widgets.add(_subHeading(line.substring(4).trim()));
         continue;
       }
 
-      // ## Section heading — dark text, larger
       if (line.startsWith('## ')) {
-        widgets.add(Padding(
-          padding: const EdgeInsets.only(top: 24, bottom: 6),
-          child: Text(
-            line.substring(3).trim(),
-            style: GoogleFonts.nunito(
-              fontSize: 18,
-              fontWeight: FontWeight.w900,
-              color: AppColors.textDark,
-              height: 1.3,
-            ),
-          ),
-        ));
+        widgets.add(_heading(line.substring(3).trim()));
         continue;
       }
 
@@ -86,20 +104,69 @@ class ArticleDetailScreen extends StatelessWidget {
       }
 
       // Normal paragraph with inline **bold** support
-      final baseStyle = GoogleFonts.nunito(
-        fontSize: 15,
-        fontWeight: FontWeight.w600,
-        color: AppColors.textDark,
-        height: 1.65,
-      );
       widgets.add(RichText(
-        text: TextSpan(children: _parseInline(line, baseStyle)),
+        text: TextSpan(children: _parseInline(line, _paragraphStyle)),
       ));
     }
 
     return widgets;
   }
 
+  // Render a bodyTree built at seed time (seeding/render_tree.py, v1):
+  // {"v": 1, "blocks": [{"t": "h2"|"h3"|"p"|"quote"|"li"|"gap",
+  //                      "n": 1, "c": [{"s": "text", "b": true}]}]}
+  List<Widget> _buildTreeWidgets(Map<String, dynamic> tree, Color tagColor) {
+    final widgets = <Widget>[];
+    final base = _paragraphStyle;
+
+    for (final raw in tree['blocks'] as List<dynamic>) {
+      final block = Map<String, dynamic>.from(raw as Map);
+      final spans = (block['c'] as List<dynamic>? ?? [])
+          .map((s) => Map<String, dynamic>.from(s as Map));
+      final text = spans.map((s) => s['s'] as String).join();
+      final inline = spans
+          .map((s) => TextSpan(
+              text: s['s'] as String,
+              style: s['b'] == true
+                  ? base.copyWith(fontWeight: FontWeight.w900)
+                  : base))
+          .toList();
+
+      switch (block['t']) {
+        case 'h2':
+          widgets.add(_heading(text));
+          break;
+        case 'h3':
+          widgets.add(_subHeading(text));
+          break;
+        case 'gap':
+          widgets.add(const SizedBox(height: 8));
+          break;
+        case 'quote':
+          widgets.add(Container(
+            margin: const EdgeInsets.symmetric(vertical: 4),
+            padding: const EdgeInsets.only(left: 12),
+            decoration: BoxDecoration(
+              border: Border(left: BorderSide(color: tagColor, width: 3)),
+            ),
+            child: RichText(text: TextSpan(children: inline)),
+          ));
+          break;
+        case 'li':
+          final marker = block['n'] != null ? '${block['n']}. ' : '• ';
+          widgets.add(RichText(
+            text: TextSpan(
+                children: [TextSpan(text: marker, style: base), ...inline]),
+          ));
+          break;
+        default:
+          widgets.add(RichText(text: TextSpan(children: inline)));
+      }
+    }
+
+    return widgets;
+  }
+
   @override
   Widget build(BuildContext context) {
     final tagColor = _getColorFromHex(article['tag_color'] ?? '#F7A8B8');
@@ -107,6 +174,10 @@ class ArticleDetailScreen extends StatelessWidget {
     final title = article['title'] ?? 'Untitled';
     final icon = article['icon'] ?? '📖';
     final body = article['body'] ?? '';
+    final rawTree = article['bodyTree'];
+    final bodyTree = rawTree is Map && rawTree['v'] == 1
+        ? Map<String, dynamic>.from(rawTree)
+        : null;
     final duration = article['duration'] ?? '';
     final isPremium = article['isPremium'] == true;
     final keyPoints = article['keyPoints'] as List<dynamic>? ?? [];
@@ -325,8 +396,13 @@ class ArticleDetailScreen extends StatelessWidget {
                     const SizedBox(height: 20),
                   ],
 
-                  // Body text — ## / ### / **bold**
-                  if (body.isNotEmpty)
+                  // Body — pre-rendered tree when present, else markdown
+                  if (bodyTree != null)
+                    Column(
+                      crossAxisAlignment: CrossAxisAlignment.start,
+                      children: _buildTreeWidgets(bodyTree, tagColor),
+                    )
+                  else if (body.isNotEmpty)
                     Column(
                       crossAxisAlignment: CrossAxisAlignment.start,
                       children: _buildBodyWidgets(body, tagColor),
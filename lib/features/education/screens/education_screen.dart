@@ -28,6 +28,28 @@ Color _colorForMode(String mode) {
   }
 }
 
+// Index cards carry no body; fetch the full article when it is opened.
+class _ArticleLoader extends ConsumerWidget {
+  final Map<String, dynamic> card;
+  final Color modeColor;
+
+  const _ArticleLoader({required this.card, required this.modeColor});
+
+  @override
+  Widget build(BuildContext context, WidgetRef ref) {
+    final articleAsync =
+        ref.watch(educationArticleProvider(card['id'] as String));
+    return articleAsync.when(
+      data: (article) => ArticleDetailScreen(
+          article: {...card, ...?article}, modeColor: modeColor),
+      loading: () => Scaffold(
+          body: Center(child: CircularProgressIndicator(color: modeColor))),
+      error: (err, _) =>
+          Scaffold(body: Center(child: Text('Error loading article: $err'))),
+    );
+  }
+}
+
 class EducationScreen extends ConsumerStatefulWidget {
   const EducationScreen({super.key});
 
@@ -75,8 +97,9 @@ class _EducationScreenState extends ConsumerState<EducationScreen> {
       BuildContext context, Map<String, dynamic> article, Color modeColor) {
     Navigator.of(context).push(
       PageRouteBuilder(
-        pageBuilder: (_, __, ___) =>
-            ArticleDetailScreen(article: article, modeColor: modeColor),
+        pageBuilder: (_, __, ___) => article.containsKey('body')
+            ? ArticleDetailScreen(article: article, modeColor: modeColor)
+            : _ArticleLoader(card: article, modeColor: modeColor),
         transitionsBuilder: (_, animation, __, child) => SlideTransition(
           position: Tween<Offset>(
             begin: const Offset(1.0, 0.0),
@@ -92,7 +115,8 @@ class _EducationScreenState extends ConsumerState<EducationScreen> {
 
   @override
   Widget build(BuildContext context) {
-    final educationAsync = ref.watch(educationContentProvider);
+    final educationAsync =
+        ref.watch(educationIndexProvider(context.locale.languageCode));
     final mode = ref.watch(modeProvider);
     final modeColor = _colorForMode(mode);
 
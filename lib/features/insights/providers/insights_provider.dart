@@ -1,7 +1,7 @@
 import 'dart:math';
 import 'package:flutter/material.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
-import '../../../core/providers/firebase_providers.dart';
+import '../../../core/providers/content_release_provider.dart';
 import '../../../core/utils/prediction_engine.dart';
 import '../../../features/home/providers/home_provider.dart';
 import '../../../features/logging/providers/log_provider.dart';
@@ -25,10 +25,8 @@ class SymptomConfig {
 
 final symptomConfigProvider =
     FutureProvider<Map<String, SymptomConfig>>((ref) async {
-  final firestore = ref.read(firestoreProvider);
   try {
-    final doc = await firestore.collection('config').doc('data').get();
-    final data = doc.data();
+    final data = await ref.watch(contentDocProvider('config/data').future);
     if (data == null) return {};
 
     final list = List<Map<String, dynamic>>.from(
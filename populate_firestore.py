@@ -1,295 +1,98 @@
-import firebase_admin
-from firebase_admin import credentials, firestore
-import os
-import json
+import argparse
+import sys
 
-print("Starting Firestore population script for MeTrustual...")
+from seeding.bulk_writer import open_writer
+from seeding.client import CredentialsError, get_db, server_timestamp
+from seeding.content import load_bundle
+from seeding.doc_size import document_size
+from seeding.dry_run import DryRunClient
 
-# Initialize Firebase Admin SDK
-try:
-    firebase_admin.get_app()
-except ValueError:
-    # App not initialized, initialize it
-    cred = credentials.Certificate(os.environ.get('GOOGLE_APPLICATION_CREDENTIALS'))
-    firebase_admin.initialize_app(cred)
+# Journey steps and config live in content/journeys.yaml and content/config.yaml
 
-db = firestore.client()
-
-# Define journey steps for all three modes
-journey_steps = {
-    "period": [
-        {
-            "icon": "🩸",
-            "q": "When did your last period start?",
-            "sub": "This helps us predict your next period and fertile window accurately.",
-            "type": "date",
-            "key": "lastPeriod",
-            "required": False,
-            "skip": "Not sure / this is my first time tracking"
-        },
-        {
-            "icon": "📅",
-            "q": "How long is your cycle usually?",
-            "sub": "Day 1 of one period to Day 1 of the next. Most cycles are 21–35 days.",
-            "type": "stepper",
-            "key": "cycleLen",
-            "min": 18,
-            "max": 45,
-            "def": 28,
-            "unit": "days",
-            "skip": "Not sure yet — we'll learn!"
-        },
-        {
-            "icon": "🗓️",
-            "q": "How many days does your period last?",
-            "sub": "Include light spotting days. Most periods last 3–7 days.",
-            "type": "stepper",
-            "key": "periodLen",
-            "min": 1,
-            "max": 10,
-            "def": 5,
-            "unit": "days"
-        },
-        {
-            "icon": "💧",
-            "q": "How would you describe your usual flow?",
-            "sub": "Helps us give you better predictions and product recommendations.",
-            "type": "chips-single",
-            "key": "flow",
-            "required": True,
-            "opts": [
-                {"e": "💧", "l": "Light", "v": "light"},
-                {"e": "🟠", "l": "Medium", "v": "medium"},
-                {"e": "🔴", "l": "Heavy", "v": "heavy"},
-                {"e": "🔀", "l": "Varies", "v": "varies"}
-            ]
-        },
-        {
-            "icon": "🌀",
-            "q": "Symptoms you often get?",
-            "sub": "Select all that apply — we'll personalise your care tips each phase.",
-            "type": "chips-multi",
-            "key": "symptoms",
-            "opts": [
-                {"e": "🌀", "l": "Cramps"},
-                {"e": "🤕", "l": "Headache"},
-                {"e": "😴", "l": "Fatigue"},
-                {"e": "🤢", "l": "Nausea"},
-                {"e": "🌊", "l": "Bloating"},
-                {"e": "💆", "l": "Back Pain"},
-                {"e": "🍫", "l": "Cravings"},
-                {"e": "😤", "l": "Mood Swings"},
-                {"e": "✨", "l": "None of these"}
-            ]
-        }
-    ],
-    "preg": [
-        {
-            "icon": "🤰",
-            "q": "Are you currently pregnant?",
-            "sub": "This helps us set up the right tracker for you. No judgement either way.",
-            "type": "chips-big-single",
-            "key": "isPreg",
-            "required": True,
-            "opts": [
-                {"e": "✅", "l": "Yes, I'm pregnant!", "v": "yes"},
-                {"e": "🤔", "l": "I think I might be", "v": "maybe"},
-                {"e": "🔄", "l": "Actually, I'm not — switch tracker", "v": "switch", "special": True}
-            ],
-            "warn": "You can switch back to Period or Ovulation tracker anytime from your home screen."
-        },
-        {
-            "icon": "📅",
-            "q": "Do you know your due date?",
-            "sub": "If yes, enter it. If not, enter your last period start date and we'll calculate.",
-            "type": "due-date",
-            "key": "dueDate",
-            "required": False
-        },
-        {
-            "icon": "👶",
-            "q": "Is this your first pregnancy?",
-            "sub": "This personalises your week-by-week tips and what to expect.",
-            "type": "chips-big-single",
-            "key": "firstPreg",
-            "required": True,
-            "opts": [
-                {"e": "🌱", "l": "Yes — my first!", "v": "first"},
-                {"e": "👧", "l": "I have one child", "v": "second"},
-                {"e": "👨‍👩‍👧‍👦", "l": "Two or more children", "v": "multiple"}
-            ]
-        },
-        {
-            "icon": "🩺",
-            "q": "Any conditions to track together?",
-            "sub": "Optional — select any for extra personalised support and reminders.",
-            "type": "chips-multi",
-            "key": "conditions",
-            "opts": [
-                {"e": "🩺", "l": "Gestational Diabetes"},
-                {"e": "💓", "l": "High Blood Pressure"},
-                {"e": "🤢", "l": "Severe Morning Sickness"},
-                {"e": "🩸", "l": "Anaemia"},
-                {"e": "🧠", "l": "Prenatal Anxiety"},
-                {"e": "😴", "l": "Sleep Issues"},
-                {"e": "✨", "l": "All good — none"}
-            ]
-        },
-        {
-            "icon": "💙",
-            "q": "What support do you want from us?",
-            "sub": "We'll send you the content that matters most. Adjust anytime.",
-            "type": "chips-multi",
-            "key": "support",
-            "opts": [
-                {"e": "📋", "l": "Weekly baby updates"},
-                {"e": "🩺", "l": "Appointment reminders"},
-                {"e": "👶", "l": "Kick counter alerts"},
-                {"e": "🌿", "l": "Nutrition & wellness tips"},
-                {"e": "🧘", "l": "Mental health & mindfulness"},
-                {"e": "📖", "l": "Birth & newborn prep"}
-            ]
-        }
-    ],
-    "ovul": [
-        {
-            "icon": "🌿",
-            "q": "What's your main goal?",
-            "sub": "This shapes your insights, alerts, and what tools we highlight for you.",
-            "type": "chips-big-single",
-            "key": "goal",
-            "required": True,
-            "opts": [
-                {"e": "👶", "l": "Trying to conceive (TTC)", "v": "ttc"},
-                {"e": "🌿", "l": "Natural family planning", "v": "nfp"},
-                {"e": "🔬", "l": "Understanding my body & cycle", "v": "understand"}
-            ]
-        },
-        {
-            "icon": "📅",
-            "q": "When did your last period start?",
-            "sub": "We calculate your fertile window from this. Ovulation is usually ~14 days before your next period.",
-            "type": "date",
-            "key": "lastPeriod",
-            "required": True,
-            "skip": "Skip for now"
-        },
-        {
-            "icon": "🔁",
-            "q": "How long is your cycle usually?",
-            "sub": "Knowing this makes ovulation predictions much more accurate.",
-            "type": "stepper",
-            "key": "cycleLen",
-            "min": 18,
-            "max": 45,
-            "def": 28,
-            "unit": "days",
-            "skip": "Not sure yet"
-        },
-        {
-            "icon": "🌡️",
-            "q": "What do you currently track?",
-            "sub": "Select all that apply — we'll guide you on using each method together.",
-            "type": "chips-multi",
-            "key": "methods",
-            "opts": [
-                {"e": "🌡️", "l": "BBT (Basal Body Temp)"},
-                {"e": "💊", "l": "OPK / LH Test Strips"},
-                {"e": "💧", "l": "Cervical Mucus"},
-                {"e": "📅", "l": "Period dates only"},
-                {"e": "🩸", "l": "Mid-cycle spotting"},
-                {"e": "🆕", "l": "Nothing yet — just starting!"}
-            ]
-        },
-        {
-            "icon": "🔔",
-            "q": "How should we alert you?",
-            "sub": "We only send what you choose. You can change this anytime.",
-            "type": "chips-multi",
-            "key": "alerts",
-            "opts": [
-                {"e": "🟢", "l": "Fertile window opens"},
-                {"e": "🎯", "l": "Peak ovulation day"},
-                {"e": "📉", "l": "Fertile window closing"},
-                {"e": "📅", "l": "Period due reminder"},
-                {"e": "🌡️", "l": "BBT reminder each morning"},
-                {"e": "💊", "l": "OPK test reminder"}
-            ]
-        }
-    ]
-}
-
-def populate_journey_steps():
+def populate_journey_steps(db):
     """Populate journey steps into Firestore"""
     try:
+        journey_steps = load_bundle()["data"]["journeys"]
+        writer = open_writer(db)
         for mode, steps in journey_steps.items():
-            print(f"\nPopulating journey steps for mode: {mode}")
-            
-            # Create a document in the 'journeys' collection
-            db.collection('journeys').document(mode).set({
+            # One document per mode in the 'journeys' collection
+            writer.set(f"journeys/{mode}", {
                 'steps': steps,
                 'mode': mode,
-                'createdAt': firestore.SERVER_TIMESTAMP,
-                'updatedAt': firestore.SERVER_TIMESTAMP
+                'createdAt': server_timestamp(),
+                'updatedAt': server_timestamp()
             })
-            
-            print(f"✓ Successfully populated {len(steps)} steps for {mode} mode")
+            print(f"  → {mode}: {len(steps)} steps")
+        writer.close()
         
-        print("\n✓ All journey steps have been successfully populated to Firestore!")
+        print(f"✓ All journey steps have been successfully populated to Firestore! ({writer.summary()})")
         return True
     except Exception as e:
         print(f"✗ Error populating journey steps: {e}")
         return False
 
-def populate_config_data():
+# Client read path → the exact document its reader expects. One config.yaml
+# fans out into every view so each screen loads with a single small read.
+CONFIG_READ_PATHS = {
+    # symptomsProvider — lib/core/providers/dynamic_content_provider.dart
+    "config/symptoms": lambda config: {"items": config["symptoms"]},
+    # insightTipsProvider — lib/core/providers/dynamic_content_provider.dart
+    "config/insight_tips": lambda config: {"tips": config["insight_tips"]},
+    # symptomConfigProvider — lib/features/insights/providers/insights_provider.dart
+    "config/data": lambda config: {"symptoms": config["symptoms"]},
+}
+
+
+def config_documents(config):
+    """{path: data} for every config read path"""
+    return {path: view(config) for path, view in CONFIG_READ_PATHS.items()}
+
+
+def populate_config_data(db):
     """Populate configuration data (symptoms, tips, etc.)"""
     try:
-        config_data = {
-            "symptoms": [
-                {"icon": "🔴", "label": "Heavy Flow", "key": "heavy"},
-                {"icon": "🟠", "label": "Medium Flow", "key": "medium"},
-                {"icon": "🟡", "label": "Light Flow", "key": "light"},
-                {"icon": "😫", "label": "Cramps", "key": "cramps"},
-                {"icon": "😴", "label": "Fatigue", "key": "fatigue"},
-                {"icon": "🤕", "label": "Headache", "key": "headache"},
-                {"icon": "😊", "label": "Good Mood", "key": "good_mood"},
-                {"icon": "😔", "label": "Low Mood", "key": "low_mood"}
-            ],
-            "insight_tips": [
-                {"text": "Your average cycle is 28 days. Your body knows what it's doing 💕"},
-                {"text": "Drink plenty of water today to stay hydrated! 💧"},
-                {"text": "Gentle stretching can help relieve cramps. 🧘‍♀️"},
-                {"text": "You're in your fertile window. Take care! 🌿"}
-            ]
-        }
+        documents = config_documents(load_bundle()["data"]["config"])
         
         print("\nPopulating configuration data...")
-        db.collection('config').document('data').set(config_data)
-        print("✓ Configuration data populated successfully!")
+        # Well under one batch, so every view lands in the same commit.
+        writer = open_writer(db)
+        for path, data in documents.items():
+            writer.set(path, data)
+            print(f"  → {path}: {document_size(path, data):,} bytes")
+        writer.close()
+        print(f"✓ Configuration data populated successfully! ({writer.summary()})")
         return True
     except Exception as e:
         print(f"✗ Error populating config data: {e}")
         return False
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Populate journey steps and config data")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="build every payload and report writes, bytes and cost without sending")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("MeTrustual Firestore Population Script")
     print("=" * 60)
     
-    # Check if Firebase is initialized
-    try:
-        app = firebase_admin.get_app()
-        print("✓ Firebase initialized successfully")
-    except ValueError:
-        print("✗ Firebase not initialized. Please ensure GOOGLE_APPLICATION_CREDENTIALS is set.")
-        print("  To set it up:")
-        print("  1. Download your service account JSON from Firebase Console")
-        print("  2. Set: export GOOGLE_APPLICATION_CREDENTIALS=/path/to/serviceAccountKey.json")
-        exit(1)
+    # Connect to Firestore (or the emulator)
+    if args.dry_run:
+        db = DryRunClient()
+    else:
+        try:
+            db = get_db()
+            print("✓ Firebase initialized successfully")
+        except CredentialsError as e:
+            print(f"✗ Firebase not initialized. {e}")
+            sys.exit(1)
     
     # Populate data
-    success = populate_journey_steps()
-    success = populate_config_data() and success
+    success = populate_journey_steps(db)
+    success = populate_config_data(db) and success
+    
+    if args.dry_run:
+        print("\n" + db.plan.report())
     
     if success:
         print("\n" + "=" * 60)
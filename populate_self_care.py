@@ -1,7 +1,18 @@
-import firebase_admin
-from firebase_admin import credentials
-from firebase_admin import firestore
-import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import argparse
+import time
+
+from seeding import changes
+from seeding.bulk_writer import DEFAULT_WORKERS, open_writer
+from seeding.client import CredentialsError, get_db
+from seeding.content import ContentError, load_bundle
+from seeding.dry_run import DryRunClient
+from seeding.schema import ValidationError
+from seeding.sync import QueuedWrites, content_hash, format_result, sync_collection
+
+# Read-optimised copy of each mode: config/self_care/views/{mode}
+VIEW_PATH = "config/self_care/views"
 
 # 1. DOWNLOAD YOUR SERVICE ACCOUNT KEY FROM FIREBASE CONSOLE:
 # Project Settings -> Service Accounts -> Generate New Private Key
@@ -9,178 +20,135 @@ import os
 
 def initialize_firebase():
     try:
-        # Try to use environment variable if set, otherwise look for local file
-        service_account_path = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS', 'serviceAccountKey.json')
-        
-        if not os.path.exists(service_account_path) and 'GOOGLE_APPLICATION_CREDENTIALS' not in os.environ:
-            print("\n✗ Error: 'serviceAccountKey.json' not found.")
-            print("Please download your service account key from Firebase Console and place it here.")
-            return None
-
-        cred = credentials.Certificate(service_account_path)
-        firebase_admin.initialize_app(cred)
-        return firestore.client()
+        # GOOGLE_APPLICATION_CREDENTIALS if set, otherwise the local key file
+        return get_db()
+    except CredentialsError as e:
+        print(f"\n✗ Error: {e}")
+        return None
     except Exception as e:
         print(f"✗ Error initializing Firebase: {e}")
         return None
 
-def populate_self_care(db):
+def _by_order(item):
+    return item.get("order", float("inf"))
+
+def self_care_view(mode, phases):
+    """One document with every phase and its rituals inlined, in display order"""
+    ordered = sorted(phases.items(), key=lambda entry: _by_order(entry[1]))
+    view = {
+        'mode': mode,
+        'phases': [
+            {'key': name,
+             **{k: v for k, v in phase.items() if k != 'rituals'},
+             'rituals': sorted(phase['rituals'], key=_by_order)}
+            for name, phase in ordered
+        ],
+    }
+    view['version'] = content_hash(view)
+    return view
+
+def populate_mode(db, mode, phases, workers=DEFAULT_WORKERS):
+    """Queue one mode's phase docs and ritual subcollections as batched writes"""
+    started = time.perf_counter()
+    writer = open_writer(db, workers)
+    mode_path = f"config/self_care/{mode}"
+
+    for phase_name, phase_data in phases.items():
+        phase_doc = {k: v for k, v in phase_data.items() if k != 'rituals'}
+        writer.set(f"{mode_path}/{phase_name}", phase_doc)
+        for i, ritual in enumerate(phase_data['rituals']):
+            writer.set(f"{mode_path}/{phase_name}/rituals/{i+1}", ritual)
+    # The tree above stays the source of truth; the view is derived from it.
+    writer.set(f"{VIEW_PATH}/{mode}", self_care_view(mode, phases))
+
+    writer.close()
+    return writer, time.perf_counter() - started
+
+def populate_self_care(db, workers=DEFAULT_WORKERS):
     print("Starting Firestore population for Self Care...")
     
-    data = {
-        'period': {
-            'Menstrual': {
-                'badge': 'PHASE 1: RESTORE', 'emoji': '🩸', 'hero_e': '🩸', 'hero_t': 'Winter Season', 'order': 1,
-                'hero_d': 'Focus on rest, warmth, and gentle nourishment. Your body is clearing space for a new cycle.',
-                'label': 'Menstrual',
-                'rituals': [
-                    {'emoji': '🍵', 'title': 'Warm Raspberry Tea', 'subtitle': 'Soothe uterine muscles and relax', 'duration': '5 min', 'order': 1},
-                    {'emoji': '🧘', 'title': "Gentle Child's Pose", 'subtitle': 'Release lower back tension', 'duration': '10 min', 'order': 2},
-                    {'emoji': '📓', 'title': 'Release Journaling', 'subtitle': "Write down what you're letting go of", 'duration': '5 min', 'order': 3},
-                    {'emoji': '🛌', 'title': '9 PM Digital Detox', 'subtitle': 'Early rest to support recovery', 'duration': 'All night', 'order': 4},
-                ]
-            },
-            'Follicular': {
-                'badge': 'PHASE 2: RENEW', 'emoji': '🌱', 'hero_e': '🌱', 'hero_t': 'Spring Season', 'order': 2,
-                'hero_d': 'Energy is rising. Focus on planning, light movement, and fresh beginnings.',
-                'label': 'Follicular',
-                'rituals': [
-                    {'emoji': '🏃', 'title': 'Brisk Morning Walk', 'subtitle': 'Boost cortisol and wake up your body', 'duration': '20 min', 'order': 1},
-                    {'emoji': '🥑', 'title': 'Hormone-Healthy Fats', 'subtitle': 'Support oestrogen production', 'duration': 'Daily', 'order': 2},
-                    {'emoji': '🎯', 'title': 'Set 3 Intentions', 'subtitle': 'Plan your cycle goals now', 'duration': '5 min', 'order': 3},
-                ]
-            },
-            'Ovulatory': {
-                'badge': 'PHASE 3: RADIATE', 'emoji': '✨', 'hero_e': '✨', 'hero_t': 'Summer Season', 'order': 3,
-                'hero_d': 'Your peak energy and confidence. Perfect for socializing and high-intensity movement.',
-                'label': 'Ovulatory',
-                'rituals': [
-                    {'emoji': '💃', 'title': 'High-Energy Movement', 'subtitle': 'Channel your peak vitality', 'duration': '30 min', 'order': 1},
-                    {'emoji': '🥗', 'title': 'Raw Veggie Fiber', 'subtitle': 'Help your liver process oestrogen', 'duration': 'Daily', 'order': 2},
-                    {'emoji': '✨', 'title': 'Social Connection', 'subtitle': 'Call a friend or attend an event', 'duration': 'Evening', 'order': 3},
-                ]
-            },
-            'Luteal': {
-                'badge': 'PHASE 4: REFLECT', 'emoji': '🌙', 'hero_e': '🌙', 'hero_t': 'Autumn Season', 'order': 4,
-                'hero_d': 'Turn inward. Focus on completion, nesting, and managing PMS with care.',
-                'label': 'Luteal',
-                'rituals': [
-                    {'emoji': '🧂', 'title': 'Reduce Sodium intake', 'subtitle': 'Minimize bloating and water retention', 'duration': 'Daily', 'order': 1},
-                    {'emoji': '🧘', 'title': 'Restorative Yoga', 'subtitle': 'Calm the nervous system', 'duration': '15 min', 'order': 2},
-                    {'emoji': '🛀', 'title': 'Epsom Salt Bath', 'subtitle': 'Magnesium for mood and cramps', 'duration': '20 min', 'order': 3},
-                ]
-            }
-        },
-        'preg': {
-            '1st Trim': {
-                'badge': 'FOUNDATION', 'emoji': '💙', 'hero_e': '💙', 'hero_t': 'The Beginning', 'order': 1,
-                'hero_d': 'Nurture the seed. Focus on hydration, folic acid, and plenty of rest.',
-                'label': '1st Trim',
-                'rituals': [
-                    {'emoji': '💧', 'title': 'Morning Hydration', 'subtitle': 'Small sips to manage nausea', 'duration': 'Daily', 'order': 1},
-                    {'emoji': '💊', 'title': 'Prenatal Vitamin', 'subtitle': 'Essential folic acid & iron', 'duration': '1 min', 'order': 2},
-                    {'emoji': '😴', 'title': 'Mid-day Power Nap', 'subtitle': 'Combat fatigue with 20–30 min rest', 'duration': '30 min', 'order': 3},
-                ]
-            },
-            '2nd Trim': {
-                'badge': 'BLOOMING', 'emoji': '🌸', 'hero_e': '🌸', 'hero_t': 'The Golden Phase', 'order': 2,
-                'hero_d': 'Feel the glow. Focus on bonding, gentle prenatal yoga, and baby prep.',
-                'label': '2nd Trim',
-                'rituals': [
-                    {'emoji': '🧘', 'title': 'Prenatal Yoga', 'subtitle': 'Strengthen and prepare your body', 'duration': '20 min', 'order': 1},
-                    {'emoji': '🤰', 'title': 'Belly Massage', 'subtitle': 'Soothe skin and connect with baby', 'duration': '10 min', 'order': 2},
-                    {'emoji': '🍎', 'title': 'Iron-Rich Snack', 'subtitle': 'Support blood volume increase', 'duration': 'Daily', 'order': 3},
-                ]
-            },
-            '3rd Trim': {
-                'badge': 'PREPARATION', 'emoji': '🌟', 'hero_e': '🌟', 'hero_t': 'The Home Stretch', 'order': 3,
-                'hero_d': 'Prepare for arrival. Focus on nesting, birth prep, and managing discomfort.',
-                'label': '3rd Trim',
-                'rituals': [
-                    {'emoji': '🚶', 'title': 'Pelvic Floor Walks', 'subtitle': 'Prepare for labor with gentle movement', 'duration': '15 min', 'order': 1},
-                    {'emoji': '🌿', 'title': 'Perineal Massage', 'subtitle': 'Tone the uterus for labor', 'duration': '5 min', 'order': 2},
-                    {'emoji': '🦶', 'title': 'Foot Soak & Elevate', 'subtitle': 'Reduce swelling and relax', 'duration': '15 min', 'order': 3},
-                ]
-            },
-            'Newborn': {
-                'badge': 'POSTPARTUM', 'emoji': '👼', 'hero_e': '👼', 'hero_t': 'The 4th Trimester', 'order': 4,
-                'hero_d': "Healing and bonding. Focus on recovery, support, and learning baby's cues.",
-                'label': 'Newborn',
-                'rituals': [
-                    {'emoji': '🤱', 'title': 'Skin-to-Skin Time', 'subtitle': 'Regulate baby and boost oxytocin', 'duration': '30 min', 'order': 1},
-                    {'emoji': '🍲', 'title': 'Warm, Soft Foods', 'subtitle': 'Easy digestion for recovery', 'duration': 'Daily', 'order': 2},
-                    {'emoji': '💤', 'title': 'Sleep When Baby Sleeps', 'subtitle': 'Prioritize rest over chores', 'duration': 'Daily', 'order': 3},
-                ]
-            }
-        },
-        'ovul': {
-            'Early': {
-                'badge': 'PREPARATION', 'emoji': '📅', 'hero_e': '📅', 'hero_t': 'Cycle Start', 'order': 1,
-                'hero_d': 'Laying the groundwork. Focus on baseline health and cycle tracking.',
-                'label': 'Early',
-                'rituals': [
-                    {'emoji': '🧘', 'title': 'Grounding Yoga', 'subtitle': 'Center yourself', 'duration': '15 min', 'order': 1},
-                    {'emoji': '💧', 'title': 'Hydration Ritual', 'subtitle': 'Start hydrating well', 'duration': 'All day', 'order': 2},
-                    {'emoji': '📓', 'title': 'Fertility Journal', 'subtitle': 'Note your observations', 'duration': '5 min', 'order': 3},
-                ]
-            },
-            'Pre-Ovul': {
-                'badge': 'FERTILE WINDOW', 'emoji': '🌱', 'hero_e': '🌱', 'hero_t': 'Energy Rising', 'order': 2,
-                'hero_d': 'Your body is preparing. Focus on cervical mucus signs and vitality.',
-                'label': 'Pre-Ovul',
-                'rituals': [
-                    {'emoji': '🧘', 'title': 'Core & Hip Yoga Flow', 'subtitle': 'Boost blood flow to reproductive organs', 'duration': '10 min', 'order': 1},
-                    {'emoji': '🌿', 'title': 'Seed Cycling — Flax & Pumpkin', 'subtitle': 'Day 1–14: oestrogen-supporting seeds', 'duration': '2 min', 'order': 2},
-                    {'emoji': '🌡️', 'title': 'BBT Journaling', 'subtitle': 'Log your temp trend and cervical signs', 'duration': '3 min', 'order': 3},
-                    {'emoji': '💧', 'title': 'Hydration Ritual', 'subtitle': 'Cervical mucus loves water — drink up!', 'duration': 'All day', 'order': 4},
-                ]
-            },
-            'Peak': {
-                'badge': 'OVULATION', 'emoji': '🎯', 'hero_e': '🎯', 'hero_t': 'Peak Fertility', 'order': 3,
-                'hero_d': 'The key moment. Focus on timing, BBT confirmation, and wellness.',
-                'label': 'Peak',
-                'rituals': [
-                    {'emoji': '🌡️', 'title': 'Confirm BBT Spike', 'subtitle': 'Temp rises 0.2–0.5°C after ovulation — log it!', 'duration': '2 min', 'order': 1},
-                    {'emoji': '💊', 'title': 'Check OPK Result', 'subtitle': 'Look for blazing positive LH strip today', 'duration': '2 min', 'order': 2},
-                    {'emoji': '🏃', 'title': 'Light Walk After Intimacy', 'subtitle': 'Gentle movement — no intense exercise today', 'duration': '15 min', 'order': 3},
-                    {'emoji': '🫐', 'title': 'Antioxidant-Rich Smoothie', 'subtitle': 'Protect egg quality: berries, CoQ10, maca', 'duration': '5 min', 'order': 4},
-                ]
-            },
-            'Post-Ovul': {
-                'badge': 'THE WAIT', 'emoji': '📉', 'hero_e': '📉', 'hero_t': 'Implantation Window', 'order': 4,
-                'hero_d': 'Support progesterone. Focus on calm, warmth, and mindful waiting.',
-                'label': 'Post-Ovul',
-                'rituals': [
-                    {'emoji': '🌿', 'title': 'Seed Cycling — Sesame & Sunflower', 'subtitle': 'Switch to Phase 2 seeds for progesterone support', 'duration': 'Daily', 'order': 1},
-                    {'emoji': '🧘', 'title': 'Restorative Yoga', 'subtitle': 'Support progesterone with gentle, calming movement', 'duration': '12 min', 'order': 2},
-                    {'emoji': '🌡️', 'title': 'Track BBT Stay Elevated', 'subtitle': 'If temp stays high 18+ days — take a test!', 'duration': 'Daily', 'order': 3},
-                    {'emoji': '🫖', 'title': 'Raspberry Leaf Tea', 'subtitle': 'Uterine toner to prepare for either outcome', 'duration': '5 min', 'order': 4},
-                ]
-            }
+    # Phases and rituals live in content/self_care.yaml
+    data = load_bundle()["data"]["self_care"]
+
+    # Mode trees are independent, so write them in parallel.
+    with ThreadPoolExecutor(max_workers=len(data)) as pool:
+        futures = {
+            mode: pool.submit(populate_mode, db, mode, phases, workers)
+            for mode, phases in data.items()
         }
-    }
+        for mode, future in futures.items():
+            writer, elapsed = future.result()
+            print(f"  ✓ {mode}: {len(data[mode])} phases in {elapsed:.2f}s — {writer.summary()}")
+
+    print("\n✓ ALL SELF CARE DATA POPULATED SUCCESSFULLY!")
 
-    base_ref = db.collection('config').document('self_care')
+def sync_mode(db, writer, mode, phases, now):
+    """Queue only the changed docs of one mode's tree; returns {collection: result}"""
+    mode_path = f"config/self_care/{mode}"
+    phase_docs = {name: {k: v for k, v in phase.items() if k != 'rituals'}
+                  for name, phase in phases.items()}
+    results = {mode_path: sync_collection(db, writer, mode_path, phase_docs, now)}
+    for phase_name, phase_data in phases.items():
+        rituals = {str(i + 1): ritual for i, ritual in enumerate(phase_data['rituals'])}
+        path = f"{mode_path}/{phase_name}/rituals"
+        results[path] = sync_collection(db, writer, path, rituals, now)
+    # A removed phase takes its rituals with it.
+    for phase_name in results[mode_path]["deleted"]:
+        path = f"{mode_path}/{phase_name}/rituals"
+        results[path] = sync_collection(db, writer, path, {}, now)
+    return results
 
+def sync_self_care(db, workers=DEFAULT_WORKERS):
+    """Write only changed phases, rituals and views and log them to the change feed"""
+    data = load_bundle()["data"]["self_care"]
+    now = datetime.now(timezone.utc)
+    queued = QueuedWrites()
+    results = {}
     for mode, phases in data.items():
-        print(f"  → Populating mode: {mode}")
-        mode_ref = base_ref.collection(mode)
-        
-        for phase_name, phase_data in phases.items():
-            rituals = phase_data.pop('rituals')
-            # Set phase document
-            mode_ref.document(phase_name).set(phase_data)
-            
-            # Set rituals subcollection
-            rituals_ref = mode_ref.document(phase_name).collection('rituals')
-            for i, ritual in enumerate(rituals):
-                rituals_ref.document(str(i+1)).set(ritual)
-            
-            print(f"    ✓ Phase '{phase_name}' and its rituals added.")
+        results.update(sync_mode(db, queued, mode, phases, now))
+    views = {mode: self_care_view(mode, phases) for mode, phases in data.items()}
+    results[VIEW_PATH] = sync_collection(db, queued, VIEW_PATH, views, now)
+    # Journal the change before any data lands (see seeding.changes).
+    changes.mark_pending(db, results)
+    writer = open_writer(db, workers)
+    queued.replay(writer)
+    writer.close()
 
-    print("\n✓ ALL SELF CARE DATA POPULATED SUCCESSFULLY!")
+    if writer.writes:
+        print(f"  Committed {writer.summary()}")
+    for collection, result in results.items():
+        if result["created"] or result["changed"] or result["deleted"]:
+            print(f"  ✓ {collection}: {format_result(result)}")
+    seq = changes.record_changes(db, results, load_bundle()["version"])
+    if seq:
+        print(f"\n✓ Self care synced, changes logged as {changes.entry_path(seq)}")
+    elif not changes.logs_changes(db):
+        print("\n✓ Self care synced (dry run, nothing logged)")
+    else:
+        print("\n✓ Self care synced (no changes)")
+    return results
 
 if __name__ == "__main__":
-    client = initialize_firebase()
+    parser = argparse.ArgumentParser(description="Populate self care phases and rituals")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="concurrent batch commits per mode (default: %(default)s)")
+    parser.add_argument("--sync", action="store_true",
+                        help="diff against Firestore and write only what changed")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="build every payload and report writes, bytes and cost without sending")
+    args = parser.parse_args()
+
+    try:
+        load_bundle()   # validates phases and rituals before anything is sent
+    except (ContentError, ValidationError) as e:
+        print(f"✗ {e}")
+        raise SystemExit(1)
+
+    client = DryRunClient() if args.dry_run else initialize_firebase()
     if client:
-        populate_self_care(client)
+        if args.sync:
+            sync_self_care(client, workers=args.workers)
+        else:
+            populate_self_care(client, workers=args.workers)
+        if args.dry_run:
+            print("\n" + client.plan.report())
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# ═══════════════════════════════════════════════════════════════
+#  MeTrustual — Unified Firestore seeder
+#
+#  Runs every dataset seeder on one shared client. Tasks that write
+#  disjoint paths run concurrently; overlapping ones run in order.
+#
+#  Usage:
+#    export GOOGLE_APPLICATION_CREDENTIALS="/path/to/serviceAccountKey.json"
+#    python3 seed.py                       # everything
+#    python3 seed.py --only education --sync
+#    python3 seed.py --skip self_care
+#    python3 seed.py --list
+#    python3 seed.py --emulator localhost:8080
+#    python3 seed.py --dry-run             # writes, bytes and cost; no network
+#    python3 seed.py --bundles build/bundles --project metrustual
+#    python3 seed.py --release             # immutable snapshot + pointer flip
+#    python3 seed.py --trace build/trace.json   # RPC spans + latency table
+#    python3 seed.py --engine async        # overlap commits on the async client
+#    python3 seed.py --ramp                # 500/50/5 ramp-up for a cold project
+# ═══════════════════════════════════════════════════════════════
+
+import argparse
+import sys
+import time
+
+import populate_firestore
+import populate_self_care
+import seed_education
+from seeding.bulk_writer import DEFAULT_WORKERS, ENGINES, use_engine, use_ramp
+from seeding import releases, tracing
+from seeding.bundles import write_bundles
+from seeding.client import CredentialsError, get_db, project_id, use_emulator
+from seeding.content import ContentError, load_bundle
+from seeding.dry_run import DryRunClient
+from seeding.ramp import START_RATE, RampController
+from seeding.schema import ValidationError
+from seeding.tasks import Task, format_timing_table, run_tasks, select_tasks
+
+
+def build_tasks(args):
+    education = seed_education.sync if args.sync else seed_education.seed
+    self_care = populate_self_care.sync_self_care if args.sync else populate_self_care.populate_self_care
+    return [
+        Task("journeys", populate_firestore.populate_journey_steps,
+             targets=["journeys"],
+             description="onboarding journey steps per mode"),
+        Task("config", populate_firestore.populate_config_data,
+             targets=list(populate_firestore.CONFIG_READ_PATHS),
+             description="symptoms and insight tips"),
+        Task("self_care", lambda db: self_care(db, workers=args.workers),
+             targets=["config/self_care"],
+             description="self care phases and rituals"),
+        Task("education", lambda db: education(db, workers=args.workers),
+             targets=[seed_education.COLLECTION, seed_education.INDEX_COLLECTION,
+                      seed_education.search.COLLECTION],
+             description="education articles, card summaries and search index"),
+    ]
+
+
+def split_names(values):
+    return {name.strip() for value in values or () for name in value.split(",") if name.strip()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed all MeTrustual Firestore content")
+    parser.add_argument("--only", action="append", metavar="TASK",
+                        help="run only these tasks (comma-separated or repeated)")
+    parser.add_argument("--skip", action="append", metavar="TASK",
+                        help="skip these tasks (comma-separated or repeated)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="concurrent batch commits per writer (default: %(default)s)")
+    parser.add_argument("--engine", choices=ENGINES,
+                        help="writer engine: thread-pool BulkWriter or the asyncio AsyncWriter "
+                             "(default: SEED_ENGINE or threads)")
+    parser.add_argument("--ramp", type=int, nargs="?", const=START_RATE, metavar="OPS",
+                        help="pace writes from OPS/s (default %(const)s), +50%% every 5 minutes, "
+                             "halving on throttling")
+    parser.add_argument("--sync", action="store_true",
+                        help="sync education and self care instead of overwriting them, "
+                             "logging what changed to the content_changes feed")
+    parser.add_argument("--emulator", metavar="HOST:PORT",
+                        help="seed a local Firestore emulator instead of production")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="build every payload and report writes, bytes and cost without sending")
+    parser.add_argument("--bundles", metavar="DIR",
+                        help="write Firestore data bundles of the seeded content instead of seeding")
+    parser.add_argument("--project", help="project ID for bundle document names "
+                                          "(default: GOOGLE_CLOUD_PROJECT or the service account's)")
+    parser.add_argument("--release", action="store_true",
+                        help="publish everything as a versioned release and flip config/content_release")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="record a span per Firestore call to FILE (OTLP JSON) and "
+                             "print latency percentiles per operation")
+    parser.add_argument("--list", action="store_true", help="list tasks and exit")
+    args = parser.parse_args()
+
+    tasks = build_tasks(args)
+    if args.list:
+        width = max(len(", ".join(task.targets)) for task in tasks)
+        for task in tasks:
+            print(f"  {task.name:<10} → {', '.join(task.targets):<{width}}  {task.description}")
+        return
+
+    if args.release and (args.only or args.skip or args.sync or args.dry_run or args.bundles):
+        print("✗ --release publishes a complete snapshot; it cannot be combined with "
+              "--only, --skip, --sync, --dry-run or --bundles")
+        sys.exit(2)
+    try:
+        tasks = select_tasks(tasks, only=split_names(args.only), skip=split_names(args.skip))
+    except ValueError as e:
+        print(f"✗ {e}")
+        sys.exit(2)
+
+    try:
+        # Compiling the bundle validates every document before any client exists.
+        bundle = load_bundle()
+    except (ContentError, ValidationError) as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    if args.emulator:
+        use_emulator(args.emulator)
+    if args.engine:
+        use_engine(args.engine)
+    if args.trace:
+        tracing.enable(args.trace)
+    ramp = use_ramp(RampController(start=args.ramp)) if args.ramp else None
+    try:
+        if args.bundles:
+            project = args.project or project_id()
+            db = DryRunClient(keep_documents=True)
+        elif args.release:
+            # Seeders plan into memory; the snapshot is written by releases.publish.
+            target = get_db()
+            db = DryRunClient(keep_documents=True)
+        else:
+            db = DryRunClient() if args.dry_run else get_db()
+    except CredentialsError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print(f"Seeding: {', '.join(task.name for task in tasks)}  (content {bundle['version']})")
+    print("=" * 60)
+
+    started = time.perf_counter()
+    results = run_tasks(tasks, db)
+    print("\n" + format_timing_table(results, time.perf_counter() - started))
+    if ramp is not None:
+        print("\n" + ramp.report())
+    if args.dry_run:
+        print("\n" + db.plan.report())
+    if args.bundles:
+        index = write_bundles(db.plan.documents, args.bundles, project, bundle["version"])
+        print()
+        for entry in index["bundles"]:
+            print(f"  ✓ {entry['file']:<16} {entry['documents']:>4} docs  "
+                  f"{len(entry['queries']):>2} queries  {entry['bytes'] / 1024:>7.1f} KiB")
+
+    if any(result["status"] != "ok" for result in results.values()):
+        sys.exit(1)
+    if args.release:
+        print("\nPublishing release...")
+        try:
+            releases.publish(target, db.plan.documents, args.workers)
+        except RuntimeError as e:
+            print(f"✗ {e}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
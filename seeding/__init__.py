@@ -0,0 +1 @@
+"""Shared Firestore seeding helpers used by the populate_* / seed_* scripts."""
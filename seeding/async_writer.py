@@ -0,0 +1,354 @@
+"""Asyncio seeding engine on Firestore's AsyncClient.
+
+AsyncWriter is a drop-in for BulkWriter (same set/delete/close/summary and
+counters), so seeders stay synchronous and just queue documents. Commits run
+as coroutines on one event loop per client, in a background thread:
+
+  - at most MAX_IN_FLIGHT commits run at once across every writer,
+  - at most `workers` per top-level collection, so one large import cannot
+    starve the rest,
+  - writes are chunked per collection under the usual 500 writes / 9 MiB,
+  - transient errors back off and retry; the first fatal error cancels the
+    writer's other commits and is re-raised from set()/close().
+
+Real clients are mirrored by an AsyncClient with the same project and
+credentials. Anything else (MemoryClient, DryRunClient) commits its batches
+on worker threads through asyncio.to_thread, so the same engine runs in tests
+and dry runs. An engine lives as long as its client: when the client is
+garbage-collected (or at exit) its loop thread stops and the AsyncClient
+channel closes.
+
+Selected with SEED_ENGINE=async or seed.py --engine async (see open_writer).
+"""
+
+import asyncio
+import concurrent.futures
+import random
+import threading
+import time
+import weakref
+
+from seeding import tracing
+from seeding.bulk_writer import (DEFAULT_WORKERS, MAX_BATCH_BYTES, MAX_BATCH_WRITES,
+                                 retryable_errors)
+from seeding.doc_size import document_name_size, document_size
+from seeding.ramp import spread_key, throttling_errors
+
+MAX_IN_FLIGHT = 64
+
+
+def _is_sdk_client(db):
+    return type(db).__module__.startswith("google.cloud.firestore")
+
+
+class Engine:
+    """Event loop thread that owns the async client and admits every commit"""
+
+    def __init__(self, db):
+        # Weak, so the engine never keeps its client alive (see engine_for).
+        self._db = weakref.ref(db)
+        self._client = None
+        self._limits = {}
+        self.loop = asyncio.new_event_loop()
+        self.slots = None
+        self._thread = threading.Thread(target=self.loop.run_forever, name="seed-async", daemon=True)
+        self._thread.start()
+        self.run(self._start()).result()
+
+    async def _start(self):
+        # Loop-bound primitives and the gRPC channel belong to the engine thread.
+        self.slots = asyncio.Semaphore(MAX_IN_FLIGHT)
+        db = self._db()
+        if _is_sdk_client(db):
+            from google.cloud import firestore
+            self._client = firestore.AsyncClient(project=db.project,
+                                                 credentials=db._credentials,
+                                                 database=db._database)
+
+    def run(self, coro):
+        """Run `coro` on the engine loop from any other thread; returns a future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def limit(self, collection, size):
+        if collection not in self._limits:
+            self._limits[collection] = asyncio.Semaphore(size)
+        return self._limits[collection]
+
+    async def commit(self, chunk):
+        if self._client is None:
+            db = self._db()
+            if db is None:
+                raise RuntimeError("The client this engine writes to is gone")
+            await asyncio.to_thread(_commit_sync, db, chunk)
+            return
+        batch = self._client.batch()
+        for kind, path, data, merge in chunk:
+            ref = self._client.document(path)
+            if kind == "set":
+                batch.set(ref, data, merge=merge)
+            else:
+                batch.delete(ref)
+        await batch.commit()
+
+    def close(self):
+        if not self._thread.is_alive():
+            return
+        if threading.current_thread() is self._thread:
+            # Collected on the loop itself: nothing may block here.
+            if self._client is not None:
+                self.loop.create_task(_close_client(self._client))
+            self.loop.call_soon(self.loop.stop)
+            return
+        if self._client is not None:
+            self.run(_close_client(self._client)).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+
+
+def _commit_sync(db, chunk):
+    batch = db.batch()
+    for kind, path, data, merge in chunk:
+        ref = db.document(path)
+        if kind == "set":
+            batch.set(ref, data, merge=merge)
+        else:
+            batch.delete(ref)
+    batch.commit()
+
+
+async def _close_client(client):
+    close = getattr(client, "close", None)
+    if close is not None:
+        result = close()
+        if asyncio.iscoroutine(result):
+            await result
+
+
+_engines = weakref.WeakKeyDictionary()     # client → Engine
+_engines_lock = threading.Lock()
+
+
+def engine_for(db):
+    """The engine for `db`, started on first use and stopped with the client"""
+    if isinstance(db, tracing.TracedClient):
+        db = db._target         # the engine records its own spans
+    with _engines_lock:
+        engine = _engines.get(db)
+        if engine is None:
+            engine = _engines[db] = Engine(db)
+            # Runs when the client is collected, or at exit if it never is.
+            weakref.finalize(db, engine.close)
+    return engine
+
+
+def _collection(path):
+    return path.split("/", 1)[0]
+
+
+class AsyncWriter:
+    """Queue set/delete writes and commit them as overlapping async batches.
+
+    Usage matches BulkWriter:
+        writer = AsyncWriter(db, workers=8)
+        writer.set("education_articles/abc", {...})
+        writer.close()
+        print(writer.summary())
+    """
+
+    def __init__(self, db, workers=DEFAULT_WORKERS, max_writes=MAX_BATCH_WRITES,
+                 max_bytes=MAX_BATCH_BYTES, max_retries=5, backoff=0.5, ramp=None):
+        self._db = db               # the engine only holds it weakly
+        self._engine = engine_for(db)
+        self._ramp = ramp           # RampController pacing commits, if any
+        self._workers = workers
+        self._max_writes = max_writes
+        self._max_bytes = max_bytes
+        self._max_retries = max_retries
+        self._backoff = backoff
+
+        # Bound the number of queued batches so memory stays flat on big runs.
+        self._queued = threading.BoundedSemaphore(MAX_IN_FLIGHT * 2)
+        self._lock = threading.Lock()
+        self._pending = []
+        self._tasks = set()         # asyncio tasks, touched only on the engine loop
+        self._chunks = {}           # collection → (ops, bytes)
+        # With a ramp, writes are reordered a window at a time (see seeding.ramp).
+        self._window = []
+        self._window_size = max_writes * workers
+        self._error = None
+        self._closed = False
+
+        self.writes = 0
+        self.batches = 0
+        self.bytes = 0
+        self.retries = 0
+        self.elapsed = 0.0
+        self._started = time.perf_counter()
+
+    # ── Queueing ────────────────────────────────────────────────
+    def set(self, path, data, merge=False):
+        self._add(("set", path, data, merge), document_size(path, data))
+
+    def delete(self, path):
+        self._add(("delete", path, None, False), document_name_size(path))
+
+    def _add(self, op, size):
+        if self._closed:
+            raise RuntimeError("AsyncWriter is closed")
+        self._raise_pending_error()
+        if self._ramp is not None:
+            self._window.append((op, size))
+            if len(self._window) >= self._window_size:
+                self._drain_window()
+            return
+        self._queue(op, size)
+
+    def _drain_window(self):
+        window, self._window = self._window, []
+        for op, size in sorted(window, key=lambda item: spread_key(item[0])):
+            self._queue(op, size)
+
+    def _queue(self, op, size):
+        collection = _collection(op[1])
+        chunk, nbytes = self._chunks.get(collection, ([], 0))
+        if chunk and (len(chunk) >= self._max_writes or nbytes + size > self._max_bytes):
+            self._dispatch(collection)
+            chunk, nbytes = [], 0
+        chunk.append(op)
+        self._chunks[collection] = (chunk, nbytes + size)
+
+    def _dispatch(self, collection):
+        chunk, nbytes = self._chunks.pop(collection)
+        self._queued.acquire()
+        future = self._engine.run(self._commit(collection, chunk, nbytes, tracing.current()))
+        future.add_done_callback(self._on_done)
+        self._pending = [f for f in self._pending if not f.done()]
+        self._pending.append(future)
+
+    def _on_done(self, future):
+        self._queued.release()
+
+    def _raise_pending_error(self):
+        if self._error is not None:
+            raise self._error
+
+    # ── Committing (engine loop) ────────────────────────────────
+    async def _commit(self, collection, chunk, nbytes, parent):
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        tracer = tracing.tracer()
+        span = tracer.start("async_writer.batch", parent=parent, collection=collection,
+                            documents=len(chunk), bytes=nbytes, retries=0) if tracer else None
+        error = None
+        try:
+            # Collection first: a commit queued behind a busy collection must not
+            # hold a global slot that another collection could use.
+            async with self._engine.limit(collection, self._workers), self._engine.slots:
+                if self._error is not None:
+                    return      # another commit already failed; stop sending
+                await self._send(collection, chunk, nbytes, tracer, span)
+        except asyncio.CancelledError as e:
+            error = e
+            raise
+        except Exception as e:
+            error = e
+            self._fail(e)
+            raise
+        finally:
+            self._tasks.discard(task)
+            if span is not None:
+                tracer.finish(span, error)
+
+        if self._ramp is not None:
+            self._ramp.record(len(chunk))
+        with self._lock:
+            self.writes += len(chunk)
+            self.batches += 1
+            self.bytes += nbytes
+
+    async def _send(self, collection, chunk, nbytes, tracer, span):
+        retryable = retryable_errors()
+        throttling = throttling_errors()
+        for attempt in range(self._max_retries + 1):
+            if self._ramp is not None:
+                await asyncio.sleep(self._ramp.reserve(len(chunk)))
+            rpc = tracer.start("firestore.commit", tracing.CLIENT, parent=span,
+                               collection=collection, documents=len(chunk),
+                               bytes=nbytes) if tracer else None
+            try:
+                await self._engine.commit(chunk)
+                if rpc is not None:
+                    tracer.finish(rpc)
+                return
+            except retryable as e:
+                if rpc is not None:
+                    tracer.finish(rpc, e)
+                if self._ramp is not None and isinstance(e, throttling):
+                    self._ramp.throttled()
+                if attempt == self._max_retries:
+                    raise
+                with self._lock:
+                    self.retries += 1
+                if span is not None:
+                    span.set(retries=attempt + 1)
+                delay = self._backoff * (2 ** attempt)
+                await asyncio.sleep(delay / 2 + random.uniform(0, delay / 2))
+
+    def _fail(self, error):
+        """First fatal error: remember it and cancel every other commit"""
+        with self._lock:
+            if self._error is not None:
+                return
+            self._error = error
+        for task in list(self._tasks):
+            if task is not asyncio.current_task():
+                task.cancel()
+
+    def flush(self):
+        """Send the partially filled batches and wait for everything in flight"""
+        self._drain_window()
+        for collection in list(self._chunks):
+            self._dispatch(collection)
+        pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                future.result()
+            except concurrent.futures.CancelledError:
+                pass        # cancelled by the first fatal error, raised below
+            except Exception as e:
+                with self._lock:
+                    self._error = self._error or e
+        self._raise_pending_error()
+
+    def close(self):
+        """Flush all queued writes and re-raise any failure"""
+        if self._closed:
+            return self
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self.elapsed = time.perf_counter() - self._started
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._closed = True
+            for future in self._pending:
+                future.cancel()
+
+    # ── Reporting ───────────────────────────────────────────────
+    @property
+    def rate(self):
+        """Committed writes per second"""
+        return self.writes / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        return (f"{self.writes} writes in {self.batches} batches · "
+                f"{self.bytes / 1024:.1f} KiB · {self.elapsed:.2f}s · "
+                f"{self.rate:.0f} writes/s · {self.retries} retries")
@@ -0,0 +1,273 @@
+"""Benchmarks for the seeding pipelines, with a history file and a baseline.
+
+    python3 -m seeding.bench                              # in-memory client
+    python3 -m seeding.bench --emulator localhost:8080    # plus the emulator
+    python3 -m seeding.bench --sizes 30,1000,50000 --pipelines education
+    python3 -m seeding.bench --save-baseline              # accept this run
+
+Each pipeline (journeys, config, self_care, education) runs in its own
+process, so peak RSS belongs to that run alone. Education runs once per
+synthetic corpus size: 30 and 1k by default, so the regression check stays
+quick, and larger corpora opt in through --sizes. The other pipelines use
+the real content. Every run records wall time, RPCs (commits, gets,
+queries), bytes sent (document payloads, sized as Firestore bills them) and
+peak RSS. Results are appended to build/bench/history.json. The run fails if
+any metric exceeds the baseline in build/bench/baseline.json by more than
+--threshold and by more than that metric's noise floor.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from seeding.content import ROOT
+from seeding import tracing
+
+BENCH_DIR = os.path.join(ROOT, "build", "bench")
+HISTORY_PATH = os.path.join(BENCH_DIR, "history.json")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+PIPELINES = ("journeys", "config", "self_care", "education")
+SIZED = ("education",)
+DEFAULT_SIZES = (30, 1000)
+DEFAULT_THRESHOLD = 0.20
+# A regression must also exceed these absolute amounts, so timer and
+# allocator noise on small runs never fails the build.
+NOISE_FLOORS = {"wall_s": 0.05, "rpcs": 0, "bytes_sent": 1024, "peak_rss_mib": 8}
+
+
+# ═══════════════════════════════════════════════════════════════
+#  SYNTHETIC CORPUS
+# ═══════════════════════════════════════════════════════════════
+def synthetic_articles(count, seed=0):
+    """`count` valid articles assembled from paragraphs of the real ones"""
+    from seeding.content import load_bundle
+    from seeding.render_tree import render_tree
+
+    templates = [article for article in load_bundle()["data"]["education_articles"]
+                 if article["isPublished"]]
+    paragraphs = [block for article in templates for block in article["body"].split("\n\n")
+                  if block.strip()]
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        template = templates[i % len(templates)]
+        body = "\n\n".join(rng.sample(paragraphs, min(6, len(paragraphs))))
+        articles.append({
+            **template,
+            "title": f"{template['title']} {i + 1}",
+            "body": body,
+            "bodyTree": render_tree(body),
+            "keyPoints": rng.sample(template["keyPoints"], len(template["keyPoints"])),
+            "order": i,
+            "relatedIds": [],
+        })
+    return articles
+
+
+# ═══════════════════════════════════════════════════════════════
+#  ONE RUN  (child process)
+# ═══════════════════════════════════════════════════════════════
+def _peak_rss_mib():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / (1024 * 1024) if platform.system() == "Darwin" else peak / 1024
+
+
+def run_pipeline(pipeline, size):
+    """Run one pipeline on get_db() and return its metrics"""
+    import populate_firestore
+    import populate_self_care
+    import seed_education
+    from seeding.client import get_db
+
+    tracer = tracing.Tracer()
+    db = tracing.TracedClient(get_db(), tracer)
+    if pipeline == "education":
+        now = datetime.now(timezone.utc)
+        articles = [{**article, "createdAt": now, "updatedAt": now}
+                    for article in synthetic_articles(size)]
+        run = lambda: seed_education.seed(db, articles=articles)
+    else:
+        run = {
+            "journeys": lambda: populate_firestore.populate_journey_steps(db),
+            "config": lambda: populate_firestore.populate_config_data(db),
+            "self_care": lambda: populate_self_care.populate_self_care(db),
+        }[pipeline]
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        started = time.perf_counter()
+        ok = run() is not False
+        wall = time.perf_counter() - started
+    rpcs = [span for span in tracer.spans if span.kind == tracing.CLIENT]
+    return {"ok": ok, "wall_s": round(wall, 4), "rpcs": len(rpcs),
+            "bytes_sent": sum(span.attributes.get("bytes", 0) for span in rpcs),
+            "peak_rss_mib": round(_peak_rss_mib(), 1)}
+
+
+def _clear_emulator(host, project):
+    from urllib.request import Request, urlopen
+    url = f"http://{host}/emulator/v1/projects/{project}/databases/(default)/documents"
+    urlopen(Request(url, method="DELETE"), timeout=30).read()
+
+
+def run_child(pipeline, size, backend, emulator):
+    """Run one benchmark in a fresh interpreter; returns its metrics"""
+    from seeding.client import EMULATOR_PROJECT
+
+    env = dict(os.environ)
+    env.pop("FIRESTORE_EMULATOR_HOST", None)
+    env.pop("SEED_FIRESTORE", None)
+    env.pop(tracing.TRACE_ENV, None)
+    if backend == "memory":
+        env["SEED_FIRESTORE"] = "memory"
+    else:
+        env["FIRESTORE_EMULATOR_HOST"] = emulator
+        env.setdefault("GOOGLE_CLOUD_PROJECT", EMULATOR_PROJECT)
+        _clear_emulator(emulator, env["GOOGLE_CLOUD_PROJECT"])
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env["SEED_CACHE_DIR"] = cache_dir      # cold caches, and the real ones stay untouched
+        out = subprocess.run(
+            [sys.executable, "-m", "seeding.bench", "--child", pipeline, str(size or 0)],
+            cwd=ROOT, env=env, capture_output=True, text=True)
+    if out.returncode != 0:
+        return {"ok": False, "error": (out.stderr.strip().splitlines() or ["failed"])[-1]}
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+# ═══════════════════════════════════════════════════════════════
+#  HISTORY AND BASELINE
+# ═══════════════════════════════════════════════════════════════
+def run_key(result):
+    return f"{result['pipeline']}/{result['size'] or '-'}/{result['backend']}"
+
+
+def _load(path, default):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def _save(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def regressions(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """[(key, metric, baseline value, current value)] past the threshold"""
+    found = []
+    for result in results:
+        before = baseline.get("runs", {}).get(run_key(result))
+        if not before or not result.get("ok"):
+            continue
+        for metric, floor in NOISE_FLOORS.items():
+            old, new = before.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + threshold) and new - old > floor:
+                found.append((run_key(result), metric, old, new))
+    return found
+
+
+def _change(result, baseline):
+    before = baseline.get("runs", {}).get(run_key(result))
+    if not before or not before.get("wall_s"):
+        return ""
+    return f"{(result['wall_s'] / before['wall_s'] - 1) * 100:+.0f}%"
+
+
+def format_results(results, baseline):
+    lines = [f"  {'pipeline':<10} {'size':>7}  {'backend':<8} {'wall':>8} {'vs base':>8} "
+             f"{'rpcs':>6} {'sent':>10} {'peak rss':>9}"]
+    for result in results:
+        size = f"{result['size']:,}" if result["size"] else "-"
+        head = f"{result['pipeline']:<10} {size:>7}  {result['backend']:<8}"
+        if not result.get("ok"):
+            lines.append(f"✗ {head} {result.get('error', 'failed')}")
+            continue
+        lines.append(f"✓ {head} {result['wall_s']:>7.3f}s {_change(result, baseline):>8} "
+                     f"{result['rpcs']:>6,} {result['bytes_sent'] / 1024:>6.1f} KiB "
+                     f"{result['peak_rss_mib']:>5.0f} MiB")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the seeding pipelines")
+    parser.add_argument("--child", nargs=2, metavar=("PIPELINE", "SIZE"), help=argparse.SUPPRESS)
+    parser.add_argument("--pipelines", default=",".join(PIPELINES),
+                        help="comma-separated (default: %(default)s)")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="synthetic article counts for education (default: %(default)s)")
+    parser.add_argument("--emulator", metavar="HOST:PORT",
+                        help="also run against this emulator (cleared before each run)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the in-memory client")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed fractional slowdown vs the baseline (default: %(default)s)")
+    parser.add_argument("--history", default=HISTORY_PATH)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this run as the new baseline")
+    args = parser.parse_args()
+
+    if args.child:
+        pipeline, size = args.child
+        print(json.dumps(run_pipeline(pipeline, int(size))))
+        return
+
+    pipelines = [name.strip() for name in args.pipelines.split(",") if name.strip()]
+    unknown = set(pipelines) - set(PIPELINES)
+    if unknown:
+        print(f"✗ Unknown pipeline(s): {', '.join(sorted(unknown))}. Available: {', '.join(PIPELINES)}")
+        sys.exit(2)
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    backends = ([] if args.no_memory else ["memory"]) + (["emulator"] if args.emulator else [])
+
+    results = []
+    for backend in backends:
+        for pipeline in pipelines:
+            for size in sizes if pipeline in SIZED else [None]:
+                print(f"  … {pipeline} {size or ''} on {backend}".ljust(60), end="\r", flush=True)
+                result = run_child(pipeline, size, backend, args.emulator)
+                results.append({"pipeline": pipeline, "size": size, "backend": backend, **result})
+
+    baseline = _load(args.baseline, {})
+    print(" " * 60, end="\r")
+    print(format_results(results, baseline))
+
+    history = _load(args.history, [])
+    history.append({"at": datetime.now(timezone.utc).isoformat(), "python": platform.python_version(),
+                    "machine": platform.machine(), "results": results})
+    _save(args.history, history)
+    print(f"✓ Appended to {os.path.relpath(args.history)} ({len(history)} runs)")
+
+    if args.save_baseline:
+        _save(args.baseline, {"at": history[-1]["at"],
+                              "runs": {run_key(result): result for result in results if result.get("ok")}})
+        print(f"✓ Saved baseline {os.path.relpath(args.baseline)}")
+        return
+
+    failed = [result for result in results if not result.get("ok")]
+    found = regressions(results, baseline, args.threshold)
+    for key, metric, old, new in found:
+        print(f"✗ {key}: {metric} {old:,} → {new:,} (> {args.threshold:.0%} regression)")
+    if not baseline:
+        print("  No baseline yet; run with --save-baseline to record one")
+    if failed or found:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
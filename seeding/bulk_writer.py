@@ -0,0 +1,250 @@
+"""Chunked, concurrent batch writer shared by the seeders.
+
+Writes are queued by document path and grouped into batches that stay under
+Firestore's per-commit limits (500 writes, 10 MiB request). Full batches are
+committed on a thread pool while the caller keeps queueing, and transient
+errors are retried with exponential backoff and jitter.
+
+Works unchanged against the local emulator: export FIRESTORE_EMULATOR_HOST.
+Seeders get their writer from open_writer(), which hands out the asyncio
+engine's AsyncWriter instead with SEED_ENGINE=async (seeding.async_writer)
+and paces both with the RampController set by use_ramp() (seeding.ramp).
+"""
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from seeding import tracing
+from seeding.ramp import spread_key, throttling_errors
+from seeding.doc_size import document_name_size, document_size
+
+MAX_BATCH_WRITES = 500
+# Commit requests are capped at 10 MiB; leave headroom for the RPC envelope.
+MAX_BATCH_BYTES = 9 * 1024 * 1024
+DEFAULT_WORKERS = 8
+ENGINE_ENV = "SEED_ENGINE"
+ENGINES = ("threads", "async")
+
+_retryable_errors = None
+
+
+def retryable_errors():
+    """Transient API errors worth retrying; imported on first commit"""
+    global _retryable_errors
+    if _retryable_errors is None:
+        try:
+            from google.api_core import exceptions as api_exceptions
+            _retryable_errors = (
+                api_exceptions.Aborted,
+                api_exceptions.DeadlineExceeded,
+                api_exceptions.InternalServerError,
+                api_exceptions.ResourceExhausted,
+                api_exceptions.ServiceUnavailable,
+            )
+        except ImportError:
+            _retryable_errors = ()
+    return _retryable_errors
+
+
+class BulkWriter:
+    """Queue set/delete writes and commit them as bounded, parallel batches.
+
+    Usage:
+        writer = BulkWriter(db, workers=8)
+        writer.set("education_articles/abc", {...})
+        writer.close()
+        print(writer.summary())
+    """
+
+    def __init__(self, db, workers=DEFAULT_WORKERS, max_writes=MAX_BATCH_WRITES,
+                 max_bytes=MAX_BATCH_BYTES, max_retries=5, backoff=0.5, ramp=None):
+        self._db = db
+        self._ramp = ramp           # RampController pacing commits, if any
+        self._max_writes = max_writes
+        self._max_bytes = max_bytes
+        self._max_retries = max_retries
+        self._backoff = backoff
+
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        # Bound the number of queued batches so memory stays flat on big runs.
+        self._slots = threading.BoundedSemaphore(workers * 2)
+        self._lock = threading.Lock()
+        self._pending = []
+        self._chunk = []
+        self._chunk_bytes = 0
+        # With a ramp, writes are reordered a window at a time (see seeding.ramp).
+        self._window = []
+        self._window_size = max_writes * workers
+        self._error = None
+        self._closed = False
+
+        self.writes = 0
+        self.batches = 0
+        self.bytes = 0
+        self.retries = 0
+        self.elapsed = 0.0
+        self._started = time.perf_counter()
+
+    # ── Queueing ────────────────────────────────────────────────
+    def set(self, path, data, merge=False):
+        self._add(("set", path, data, merge), document_size(path, data))
+
+    def delete(self, path):
+        self._add(("delete", path, None, False), document_name_size(path))
+
+    def _add(self, op, size):
+        if self._closed:
+            raise RuntimeError("BulkWriter is closed")
+        self._raise_pending_error()
+        if self._ramp is not None:
+            self._window.append((op, size))
+            if len(self._window) >= self._window_size:
+                self._drain_window()
+            return
+        self._queue(op, size)
+
+    def _drain_window(self):
+        window, self._window = self._window, []
+        for op, size in sorted(window, key=lambda item: spread_key(item[0])):
+            self._queue(op, size)
+
+    def _queue(self, op, size):
+        full = len(self._chunk) >= self._max_writes
+        if self._chunk and (full or self._chunk_bytes + size > self._max_bytes):
+            self._dispatch()
+        self._chunk.append(op)
+        self._chunk_bytes += size
+
+    def _dispatch(self):
+        chunk, nbytes = self._chunk, self._chunk_bytes
+        self._chunk, self._chunk_bytes = [], 0
+        self._slots.acquire()
+        future = self._pool.submit(self._commit, chunk, nbytes, tracing.current())
+        future.add_done_callback(self._on_done)
+        self._pending = [f for f in self._pending if not f.done()]
+        self._pending.append(future)
+
+    def _on_done(self, future):
+        self._slots.release()
+        if future.cancelled():
+            return  # dropped by __exit__; the error that caused it propagates there
+        error = future.exception()
+        if error is not None:
+            with self._lock:
+                self._error = self._error or error
+
+    def _raise_pending_error(self):
+        if self._error is not None:
+            raise self._error
+
+    # ── Committing ──────────────────────────────────────────────
+    def _commit(self, chunk, nbytes, parent=None):
+        retryable = retryable_errors()
+        throttling = throttling_errors()
+        with tracing.span("bulk_writer.batch", parent=parent, documents=len(chunk),
+                          bytes=nbytes, retries=0) as span:
+            for attempt in range(self._max_retries + 1):
+                if self._error is not None:
+                    return  # another batch already failed; stop sending
+                batch = self._db.batch()
+                for kind, path, data, merge in chunk:
+                    ref = self._db.document(path)
+                    if kind == "set":
+                        batch.set(ref, data, merge=merge)
+                    else:
+                        batch.delete(ref)
+                if self._ramp is not None:
+                    self._ramp.acquire(len(chunk))
+                try:
+                    batch.commit()
+                    break
+                except retryable as e:
+                    if self._ramp is not None and isinstance(e, throttling):
+                        self._ramp.throttled()
+                    if attempt == self._max_retries:
+                        raise
+                    with self._lock:
+                        self.retries += 1
+                    span.set(retries=attempt + 1)
+                    delay = self._backoff * (2 ** attempt)
+                    time.sleep(delay / 2 + random.uniform(0, delay / 2))
+
+        if self._ramp is not None:
+            self._ramp.record(len(chunk))
+        with self._lock:
+            self.writes += len(chunk)
+            self.batches += 1
+            self.bytes += nbytes
+
+    def flush(self):
+        """Send the partially filled batch and wait for everything in flight"""
+        self._drain_window()
+        if self._chunk:
+            self._dispatch()
+        pending, self._pending = self._pending, []
+        for future in pending:
+            error = future.exception()
+            if error is not None:
+                raise error
+        self._raise_pending_error()
+
+    def close(self):
+        """Flush all queued writes, stop the workers and re-raise any failure"""
+        if self._closed:
+            return self
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._pool.shutdown(wait=True)
+            self.elapsed = time.perf_counter() - self._started
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._closed = True
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    # ── Reporting ───────────────────────────────────────────────
+    @property
+    def rate(self):
+        """Committed writes per second"""
+        return self.writes / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        return (f"{self.writes} writes in {self.batches} batches · "
+                f"{self.bytes / 1024:.1f} KiB · {self.elapsed:.2f}s · "
+                f"{self.rate:.0f} writes/s · {self.retries} retries")
+
+
+_ramp = None
+
+
+def use_ramp(ramp):
+    """Pace every writer open_writer() hands out from now on with `ramp`"""
+    global _ramp
+    _ramp = ramp
+    return ramp
+
+
+def use_engine(name):
+    """Make open_writer() hand out `name` writers from now on"""
+    if name not in ENGINES:
+        raise ValueError(f"Unknown engine '{name}'. Available: {', '.join(ENGINES)}")
+    os.environ[ENGINE_ENV] = name
+
+
+def open_writer(db, workers=DEFAULT_WORKERS):
+    """A BulkWriter, or an AsyncWriter when SEED_ENGINE=async"""
+    if os.getenv(ENGINE_ENV) == "async":
+        from seeding.async_writer import AsyncWriter
+        return AsyncWriter(db, workers=workers, ramp=_ramp)
+    return BulkWriter(db, workers=workers, ramp=_ramp)
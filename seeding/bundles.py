@@ -0,0 +1,257 @@
+"""Firestore data bundles for the static content, one per language and mode.
+
+A bundle is the format clients pass to loadBundle(): a sequence of JSON
+elements, each prefixed with its UTF-8 byte length. It starts with bundle
+metadata, then named queries, then a documentMetadata/document pair per
+document. Loading one puts every static document into the client cache, so
+the app can read them with no billed reads and resolve the named queries
+from cache.
+
+Bundles are built from the seeders' planned writes (a DryRunClient with
+keep_documents=True), so they hold exactly what seeding would write:
+
+    python3 seed.py --bundles build/bundles --project metrustual
+
+writes build/bundles/{language}-{mode}.bundle plus an index.json listing
+each file's size and SHA-256 for the CDN.
+"""
+
+import base64
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+
+from seeding.client import server_timestamp
+from seeding.ndjson import sdk_types
+
+BUNDLE_VERSION = 1
+EDUCATION = "education_articles"
+EDUCATION_INDEX = "education_index"
+SEARCH_INDEX = "search_index"
+SELF_CARE_VIEWS = "config/self_care/views"   # written by populate_self_care.py
+INDEX_FILE = "index.json"
+
+
+# ═══════════════════════════════════════════════════════════════
+#  ENCODING
+# ═══════════════════════════════════════════════════════════════
+def _timestamp(moment):
+    return {"seconds": int(moment.timestamp()), "nanos": moment.microsecond * 1000}
+
+
+def _rfc3339(moment):
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class Encoder:
+    """Turns Python document data into Firestore's JSON Value form"""
+
+    def __init__(self, project, read_time, database="(default)"):
+        self.root = f"projects/{project}/databases/{database}/documents"
+        self.read_time = read_time
+        self._server_timestamp = server_timestamp()
+
+    def name(self, path):
+        return f"{self.root}/{path}"
+
+    def fields(self, data):
+        return {key: self.value(item) for key, item in data.items()}
+
+    def value(self, value):
+        if value is None:
+            return {"nullValue": None}
+        if isinstance(value, bool):
+            return {"booleanValue": value}
+        if isinstance(value, int):
+            return {"integerValue": str(value)}
+        if isinstance(value, float):
+            return {"doubleValue": value}
+        if isinstance(value, str):
+            return {"stringValue": value}
+        if isinstance(value, datetime):
+            return {"timestampValue": _rfc3339(value)}
+        if isinstance(value, bytes):
+            return {"bytesValue": base64.b64encode(value).decode("ascii")}
+        if isinstance(value, dict):
+            return {"mapValue": {"fields": self.fields(value)}}
+        if isinstance(value, (list, tuple)):
+            return {"arrayValue": {"values": [self.value(item) for item in value]}}
+        if value is self._server_timestamp:
+            return {"timestampValue": _rfc3339(self.read_time)}
+
+        geo_point, reference = sdk_types()
+        if geo_point is not None and isinstance(value, geo_point):
+            return {"geoPointValue": {"latitude": value.latitude, "longitude": value.longitude}}
+        if reference is not None and isinstance(value, reference):
+            return {"referenceValue": self.name(value.path)}
+        raise TypeError(f"Cannot encode {type(value).__name__} in a bundle")
+
+
+def _element(payload):
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return str(len(data)).encode("ascii") + data
+
+
+# ═══════════════════════════════════════════════════════════════
+#  QUERIES
+# ═══════════════════════════════════════════════════════════════
+def _field_filter(field, op, value):
+    return {"fieldFilter": {"field": {"fieldPath": field}, "op": op, "value": value}}
+
+
+def _structured_query(collection, filters=(), order_by=()):
+    query = {"from": [{"collectionId": collection}]}
+    if len(filters) == 1:
+        query["where"] = filters[0]
+    elif filters:
+        query["where"] = {"compositeFilter": {"op": "AND", "filters": list(filters)}}
+    if order_by:
+        query["orderBy"] = [{"field": {"fieldPath": field}, "direction": "ASCENDING"}
+                            for field in order_by]
+    return query
+
+
+def _is_visible(article, mode):
+    modes = article.get("mode") or []
+    return article.get("isPublished") is True and (mode in modes or "all" in modes)
+
+
+def bundle_contents(documents, language, mode):
+    """Documents and named queries for one language/mode bundle.
+
+    Returns (paths, queries) where queries maps a name to
+    (parent path, structured query, member paths).
+    """
+    articles = sorted(path for path, data in documents.items()
+                      if path.startswith(EDUCATION + "/")
+                      and data.get("language") == language and _is_visible(data, mode))
+    self_care = f"config/self_care/{mode}/"
+    phases = sorted(path for path in documents
+                    if path.startswith(self_care) and path.count("/") == 3)
+    paths = set(articles) | {path for path in documents if path.startswith(self_care)}
+    paths |= {path for path in documents if path.startswith("config/") and path.count("/") == 1}
+    paths |= {path for path in documents
+              if path == f"{SEARCH_INDEX}/{language}" or path.startswith(f"{SEARCH_INDEX}/{language}_")}
+    for path in (f"{SELF_CARE_VIEWS}/{mode}", f"{EDUCATION_INDEX}/{language}_{mode}", f"journeys/{mode}"):
+        if path in documents:
+            paths.add(path)
+
+    published = _field_filter("isPublished", "EQUAL", {"booleanValue": True})
+    # Only queries scoped to this bundle's language and mode: a bundle holds
+    # just those articles, so an unscoped query would resolve to a subset.
+    queries = {
+        f"education-{language}-{mode}": ("", _structured_query(EDUCATION, [
+            published,
+            _field_filter("language", "EQUAL", {"stringValue": language}),
+            _field_filter("mode", "ARRAY_CONTAINS_ANY", {"arrayValue": {"values": [
+                {"stringValue": mode}, {"stringValue": "all"}]}}),
+        ], ["order"]), articles),
+        f"self_care-{mode}": ("config/self_care", _structured_query(mode), phases),
+    }
+    for phase_path in phases:
+        phase = phase_path.rsplit("/", 1)[-1]
+        rituals = sorted(path for path in documents if path.startswith(phase_path + "/rituals/"))
+        queries[f"self_care-{mode}-{phase}-rituals"] = (phase_path, _structured_query("rituals"), rituals)
+    return sorted(paths), queries
+
+
+def build_bundle(bundle_id, documents, paths, queries, encoder):
+    """Serialise one bundle; returns its bytes"""
+    read_time = _timestamp(encoder.read_time)
+    member_of = {}
+    for name, (_, _, members) in queries.items():
+        for path in members:
+            member_of.setdefault(path, []).append(name)
+
+    body = []
+    for name, (parent, structured_query, _) in sorted(queries.items()):
+        body.append(_element({"namedQuery": {
+            "name": name,
+            "bundledQuery": {
+                "parent": encoder.name(parent) if parent else encoder.root,
+                "structuredQuery": structured_query,
+                "limitType": "FIRST",
+            },
+            "readTime": read_time,
+        }}))
+    for path in paths:
+        name = encoder.name(path)
+        metadata = {"name": name, "readTime": read_time, "exists": True}
+        if path in member_of:
+            metadata["queries"] = sorted(member_of[path])
+        body.append(_element({"documentMetadata": metadata}))
+        body.append(_element({"document": {
+            "name": name,
+            "fields": encoder.fields(documents[path]),
+            "createTime": read_time,
+            "updateTime": read_time,
+        }}))
+
+    total_bytes = sum(len(element) for element in body)
+    header = _element({"metadata": {
+        "id": bundle_id,
+        "createTime": read_time,
+        "version": BUNDLE_VERSION,
+        "totalDocuments": len(paths),
+        "totalBytes": total_bytes,
+    }})
+    return header + b"".join(body)
+
+
+def bundle_modes(documents):
+    """Modes with journeys or self care content"""
+    modes = set()
+    for path in documents:
+        parts = path.split("/")
+        if parts[0] == "journeys" and len(parts) == 2:
+            modes.add(parts[1])
+        elif parts[:2] == ["config", "self_care"] and len(parts) > 2 and parts[2] != "views":
+            modes.add(parts[2])
+    return sorted(modes)
+
+
+def write_bundles(documents, out_dir, project, version, read_time=None):
+    """Write one bundle per language × mode plus index.json; returns the index"""
+    encoder = Encoder(project, read_time or datetime.now(timezone.utc))
+    languages = sorted({data["language"] for path, data in documents.items()
+                        if path.startswith(EDUCATION + "/")})
+    os.makedirs(out_dir, exist_ok=True)
+
+    index = {"version": version, "project": project, "bundles": []}
+    for language in languages:
+        for mode in bundle_modes(documents):
+            bundle_id = f"{language}-{mode}"
+            paths, queries = bundle_contents(documents, language, mode)
+            data = build_bundle(f"{bundle_id}-{version}", documents, paths, queries, encoder)
+            file_name = f"{bundle_id}.bundle"
+            with open(os.path.join(out_dir, file_name), "wb") as f:
+                f.write(data)
+            index["bundles"].append({
+                "id": bundle_id,
+                "language": language,
+                "mode": mode,
+                "file": file_name,
+                "documents": len(paths),
+                "queries": sorted(queries),
+                "bytes": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+            })
+    with open(os.path.join(out_dir, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+    return index
+
+
+def read_elements(data):
+    """Split bundle bytes back into its JSON elements"""
+    elements, offset = [], 0
+    while offset < len(data):
+        start = offset
+        while data[offset:offset + 1].isdigit():
+            offset += 1
+        length = int(data[start:offset])
+        elements.append(json.loads(data[offset:offset + length]))
+        offset += length
+    return elements
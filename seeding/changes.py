@@ -0,0 +1,194 @@
+"""Content change feed: which documents each sync added, modified or removed.
+
+Every sync that changes something appends one entry,
+content_changes/{seq:08d}:
+
+    {"seq": 42, "version": <content bundle version>, "createdAt": …,
+     "collections": {"education_articles": {"added": [IDs], "modified": [IDs],
+                                            "removed": [IDs]}, …}}
+
+and bumps config/content_changes {"seq": 42}. A client that last synced at
+seq N reads the head, and if it moved, queries
+
+    content_changes where seq > N order by seq
+
+then re-fetches only the upserted IDs and evicts the removed ones, instead of
+re-pulling whole collections. changes_since() is the reference
+implementation:
+
+    python3 -m seeding.changes since 40
+
+A sync's data spans many batches, so it cannot commit atomically with its
+entry. Instead mark_pending() stores the change on the head doc before any
+data is sent, and record_changes() folds whatever is still pending into the
+next entry. A run that dies between its data commits and its entry is
+therefore logged by the next sync, even though that sync finds nothing left
+to write. Dry runs send nothing and log nothing.
+"""
+
+import argparse
+import sys
+import threading
+
+from seeding.client import CredentialsError, get_db, server_timestamp, use_emulator
+from seeding.dry_run import DryRunClient
+
+COLLECTION = "content_changes"
+HEAD = "config/content_changes"
+PENDING_FIELD = "pending"
+ATTEMPTS = 5
+CHANGE_KINDS = ("added", "modified", "removed")
+
+_lock = threading.Lock()
+
+
+def entry_path(seq):
+    return f"{COLLECTION}/{seq:08d}"
+
+
+def changelog(results):
+    """{collection: {"added", "modified", "removed"}} from sync_collection results,
+    leaving out collections where nothing changed"""
+    collections = {}
+    for collection, result in results.items():
+        entry = {"added": sorted(result["created"]), "modified": sorted(result["changed"]),
+                 "removed": sorted(result["deleted"])}
+        if any(entry.values()):
+            collections[collection] = entry
+    return collections
+
+
+def combine(older, newer):
+    """One changelog covering `older` then `newer`; each ID keeps its latest change"""
+    combined = {}
+    for collection in sorted(older.keys() | newer.keys()):
+        old, new = older.get(collection, {}), newer.get(collection, {})
+        renewed = {doc_id for kind in CHANGE_KINDS for doc_id in new.get(kind, [])}
+        entry = {kind: sorted({doc_id for doc_id in old.get(kind, []) if doc_id not in renewed}
+                              | set(new.get(kind, [])))
+                 for kind in CHANGE_KINDS}
+        if any(entry.values()):
+            combined[collection] = entry
+    return combined
+
+
+def logs_changes(db):
+    """Dry runs send no data, so there is no change to log"""
+    return not isinstance(db, DryRunClient)
+
+
+def _head(db):
+    head = db.document(HEAD).get()
+    return (head.to_dict() if head.exists else None) or {}
+
+
+def mark_pending(db, results):
+    """Note `results` on the head before their data is written (see module doc)"""
+    collections = changelog(results)
+    if not collections or not logs_changes(db):
+        return
+    with _lock:
+        pending = combine(_head(db).get(PENDING_FIELD) or {}, collections)
+        db.document(HEAD).set({PENDING_FIELD: pending}, merge=True)
+
+
+def _already_exists():
+    try:
+        from google.api_core.exceptions import AlreadyExists
+        return AlreadyExists
+    except ImportError:
+        return ()
+
+
+def record_changes(db, results, version=None):
+    """Append a change entry for `results` ({collection: sync result}); returns its seq.
+
+    Changes still pending on the head from an interrupted run are included.
+    Returns None when nothing changed, or on a dry run. The entry is created
+    with a must-not-exist precondition in the same batch that moves the head
+    (and clears the pending change), so two seeders racing for a seq never
+    overwrite each other; the loser retries.
+    """
+    if not logs_changes(db):
+        return None
+    with _lock:
+        for _ in range(ATTEMPTS):
+            head = _head(db)
+            collections = combine(head.get(PENDING_FIELD) or {}, changelog(results))
+            if not collections:
+                return None
+            seq = head.get("seq", 0) + 1
+            batch = db.batch()
+            batch.create(db.document(entry_path(seq)), {
+                "seq": seq,
+                "version": version,
+                "collections": collections,
+                "createdAt": server_timestamp(),
+            })
+            batch.set(db.document(HEAD), {"seq": seq, "updatedAt": server_timestamp()})
+            try:
+                batch.commit()
+                return seq
+            except _already_exists():
+                continue
+    raise RuntimeError(f"Could not append to {COLLECTION} after {ATTEMPTS} attempts")
+
+
+def merge_entries(entries):
+    """Net effect of change entries, applied in seq order:
+    {"seq": latest, "collections": {collection: {"upserted": [IDs], "removed": [IDs]}}}"""
+    seq, net = None, {}
+    for entry in sorted(entries, key=lambda entry: entry["seq"]):
+        seq = entry["seq"]
+        for collection, change in entry["collections"].items():
+            upserted, removed = net.setdefault(collection, (set(), set()))
+            for doc_id in change.get("added", []) + change.get("modified", []):
+                upserted.add(doc_id)
+                removed.discard(doc_id)
+            for doc_id in change.get("removed", []):
+                removed.add(doc_id)
+                upserted.discard(doc_id)
+    return {"seq": seq, "collections": {
+        collection: {"upserted": sorted(upserted), "removed": sorted(removed)}
+        for collection, (upserted, removed) in sorted(net.items())}}
+
+
+def changes_since(db, seq):
+    """Everything changed after `seq`, merged (see merge_entries)"""
+    from google.cloud.firestore_v1.base_query import FieldFilter
+
+    query = (db.collection(COLLECTION)
+             .where(filter=FieldFilter("seq", ">", seq))
+             .order_by("seq"))
+    delta = merge_entries(snapshot.to_dict() for snapshot in query.stream())
+    if delta["seq"] is None:
+        delta["seq"] = seq
+    return delta
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Read the content change feed")
+    commands = parser.add_subparsers(dest="command", required=True)
+    since_cmd = commands.add_parser("since", help="documents changed after a seq")
+    since_cmd.add_argument("seq", type=int)
+    parser.add_argument("--emulator", metavar="HOST:PORT", help="read from a Firestore emulator")
+    args = parser.parse_args()
+
+    if args.emulator:
+        use_emulator(args.emulator)
+    try:
+        delta = changes_since(get_db(), args.seq)
+    except CredentialsError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    for collection, change in delta["collections"].items():
+        print(f"  {collection}: {len(change['upserted'])} upserted, {len(change['removed'])} removed")
+        for doc_id in change["upserted"]:
+            print(f"    + {doc_id}")
+        for doc_id in change["removed"]:
+            print(f"    - {doc_id}")
+    print(f"✓ Up to seq {delta['seq']}")
+
+
+if __name__ == "__main__":
+    main()
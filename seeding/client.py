@@ -0,0 +1,98 @@
+"""Lazily created Firestore client shared by every seeder in the process.
+
+Nothing here imports the Firestore SDK or opens a channel until get_db() is
+first called, so content modules stay cheap to import from tools and tests.
+
+Credentials, in order:
+  SEED_FIRESTORE=memory            → in-process MemoryClient (seeding.memory)
+  FIRESTORE_EMULATOR_HOST          → local emulator, no credentials needed
+  GOOGLE_APPLICATION_CREDENTIALS   → service account JSON path
+  ./serviceAccountKey.json         → fallback next to the scripts
+
+With SEED_TRACE set the client comes wrapped in RPC spans (seeding.tracing).
+"""
+
+import json
+import os
+import threading
+
+from seeding import tracing
+
+DEFAULT_CREDENTIALS = "serviceAccountKey.json"
+EMULATOR_PROJECT = "demo-metrustual"
+
+_lock = threading.Lock()
+_client = None
+
+
+class CredentialsError(RuntimeError):
+    """Raised when no emulator or service account key is configured"""
+
+
+def use_emulator(host, project=None):
+    """Point every client created from now on at a local emulator"""
+    os.environ["FIRESTORE_EMULATOR_HOST"] = host
+    if project:
+        os.environ["GOOGLE_CLOUD_PROJECT"] = project
+    reset()
+
+
+def reset():
+    """Drop the cached client; the next get_db() builds a fresh one"""
+    global _client
+    with _lock:
+        _client = None
+
+
+def get_db():
+    """Return the shared Firestore client, creating it on first use"""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                tracing.enable_from_env()
+                with tracing.span("client.create"):
+                    _client = tracing.wrap(_create_client())
+    return _client
+
+
+def _create_client():
+    if os.getenv("SEED_FIRESTORE") == "memory":
+        from seeding.memory import MemoryClient
+        return MemoryClient(project=os.getenv("GOOGLE_CLOUD_PROJECT", EMULATOR_PROJECT))
+
+    if os.getenv("FIRESTORE_EMULATOR_HOST"):
+        from google.cloud import firestore
+        return firestore.Client(project=os.getenv("GOOGLE_CLOUD_PROJECT", EMULATOR_PROJECT))
+
+    path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", DEFAULT_CREDENTIALS)
+    if not os.path.exists(path):
+        raise CredentialsError(
+            f"Service account key not found at '{path}'.\n"
+            "  1. Download your service account JSON from Firebase Console\n"
+            "     (Project Settings → Service Accounts → Generate New Private Key)\n"
+            "  2. export GOOGLE_APPLICATION_CREDENTIALS=/path/to/serviceAccountKey.json\n"
+            "  Or run against the emulator: export FIRESTORE_EMULATOR_HOST=localhost:8080"
+        )
+
+    from google.cloud import firestore
+    return firestore.Client.from_service_account_json(path)
+
+
+def project_id():
+    """GOOGLE_CLOUD_PROJECT, else the project of the service account key"""
+    if os.getenv("GOOGLE_CLOUD_PROJECT"):
+        return os.environ["GOOGLE_CLOUD_PROJECT"]
+    path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", DEFAULT_CREDENTIALS)
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            project = json.load(f).get("project_id")
+        if project:
+            return project
+    raise CredentialsError("No project configured: pass --project or export GOOGLE_CLOUD_PROJECT")
+
+
+def server_timestamp():
+    """Firestore's SERVER_TIMESTAMP sentinel, imported on demand"""
+    from google.cloud.firestore import SERVER_TIMESTAMP
+    return SERVER_TIMESTAMP
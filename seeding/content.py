@@ -0,0 +1,255 @@
+"""Content sources → one compiled, versioned bundle.
+
+Sources live under content/:
+
+    content/journeys.yaml                    journeys/{mode}.steps
+    content/config.yaml                      symptoms + insight tips
+    content/self_care.yaml                   config/self_care/{mode}/{phase} + rituals
+    content/education/{language}/{id}.md     YAML front-matter + markdown body
+                                             (+ bodyTree, see seeding.render_tree)
+
+`python3 -m seeding.content` validates them (seeding.schema) and writes build/content_bundle.json:
+
+    {"format": 1, "version": <content hash>, "sourceHash": <hash of the
+     source files and the compiler>, "data": {"journeys": …, "config": …, "self_care": …,
+     "education_articles": [...]}}
+
+Seeders call load_bundle(), which reuses the compiled file when it matches
+the sources and recompiles otherwise.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+import yaml
+
+from seeding.render_tree import MarkupError, body_hash, render_tree, reusable_trees
+from seeding.schema import ValidationError, validate_content
+from seeding.sync import slugify
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONTENT_DIR = os.path.join(ROOT, "content")
+BUNDLE_PATH = os.path.join(ROOT, "build", "content_bundle.json")
+# Derived data keyed by content hashes; SEED_CACHE_DIR points it elsewhere.
+CACHE_DIR = os.getenv("SEED_CACHE_DIR") or os.path.join(ROOT, "build", "cache")
+BUNDLE_FORMAT = 1
+# Modules that shape the bundle: editing one invalidates compiled bundles.
+COMPILER_MODULES = ("content.py", "schema.py", "render_tree.py")
+
+ARTICLE_FIELDS = ("icon", "tag", "tagColor", "title", "meta", "readTime", "mode",
+                  "isPremium", "isPublished", "order", "keyPoints", "relatedIds")
+
+
+class ContentError(ValueError):
+    """Raised when a content source file cannot be compiled"""
+
+
+def article_id(article):
+    """Stable document ID derived from language + title"""
+    return f"{article['language']}-{slugify(article['title'])}"
+
+
+# ═══════════════════════════════════════════════════════════════
+#  SOURCES
+# ═══════════════════════════════════════════════════════════════
+def source_files(content_dir=CONTENT_DIR):
+    """Every source file, relative to content_dir, in a stable order"""
+    found = []
+    for dirpath, _, filenames in os.walk(content_dir):
+        for name in filenames:
+            if name.endswith((".yaml", ".md")):
+                found.append(os.path.relpath(os.path.join(dirpath, name), content_dir))
+    return sorted(found)
+
+
+def source_hash(content_dir=CONTENT_DIR):
+    """Hash of the sources, the bundle format and the compiler modules"""
+    digest = hashlib.sha256(f"format {BUNDLE_FORMAT}\0".encode("utf-8"))
+    for name in COMPILER_MODULES:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), name), "rb") as f:
+            digest.update(f.read() + b"\0")
+    for rel in source_files(content_dir):
+        digest.update(rel.replace(os.sep, "/").encode("utf-8") + b"\0")
+        with open(os.path.join(content_dir, rel), "rb") as f:
+            digest.update(f.read() + b"\0")
+    return digest.hexdigest()[:16]
+
+
+def _load_yaml(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return yaml.safe_load(f)
+    except FileNotFoundError:
+        raise ContentError(f"{path}: missing")
+    except yaml.YAMLError as e:
+        raise ContentError(f"{path}: {e}")
+
+
+def parse_article(path, language, trees=None):
+    """Split a markdown file into its front-matter fields, `body` and `bodyTree`.
+
+    Building the tree is what validates the markup; `trees` ({body hash:
+    tree}, see reusable_trees) skips the parse for bodies seen before.
+    """
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if not text.startswith("---\n"):
+        raise ContentError(f"{path}: missing '---' front-matter")
+    end = text.find("\n---\n", 4)
+    if end == -1:
+        raise ContentError(f"{path}: unterminated front-matter")
+
+    try:
+        meta = yaml.safe_load(text[4:end]) or {}
+    except yaml.YAMLError as e:
+        raise ContentError(f"{path}: {e}")
+    missing = [field for field in ARTICLE_FIELDS if field not in meta]
+    if missing:
+        raise ContentError(f"{path}: missing front-matter field(s) {', '.join(missing)}")
+    unknown = set(meta) - set(ARTICLE_FIELDS)
+    if unknown:
+        raise ContentError(f"{path}: unknown front-matter field(s) {', '.join(sorted(unknown))}")
+
+    body = text[end + len("\n---\n"):]
+    if body.endswith("\n"):
+        body = body[:-1]
+    if not body.strip():
+        raise ContentError(f"{path}: empty body")
+    tree = (trees or {}).get(body_hash(body))
+    if tree is None:
+        try:
+            tree = render_tree(body)
+        except MarkupError as e:
+            raise ContentError(f"{path}: {e}")
+
+    article = {field: meta[field] for field in ARTICLE_FIELDS}
+    article["language"] = language
+    article["body"] = body
+    article["bodyTree"] = tree
+    return article
+
+
+def load_articles(content_dir=CONTENT_DIR, trees=None):
+    education_dir = os.path.join(content_dir, "education")
+    articles = []
+    for language in sorted(os.listdir(education_dir)):
+        language_dir = os.path.join(education_dir, language)
+        if not os.path.isdir(language_dir):
+            continue
+        for name in sorted(os.listdir(language_dir)):
+            if name.endswith(".md"):
+                articles.append(parse_article(os.path.join(language_dir, name), language, trees))
+    return articles
+
+
+def load_sources(content_dir=CONTENT_DIR, trees=None):
+    """Parse every source file into the bundle's `data` section"""
+    data = {
+        "journeys": _load_yaml(os.path.join(content_dir, "journeys.yaml")),
+        "config": _load_yaml(os.path.join(content_dir, "config.yaml")),
+        "self_care": _load_yaml(os.path.join(content_dir, "self_care.yaml")),
+        "education_articles": load_articles(content_dir, trees),
+    }
+    for key in ("journeys", "config", "self_care"):
+        if not isinstance(data[key], dict):
+            raise ContentError(f"{key}.yaml: expected a mapping at the top level")
+    return data
+
+
+# ═══════════════════════════════════════════════════════════════
+#  BUNDLE
+# ═══════════════════════════════════════════════════════════════
+def _encode(value):
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def _previous_trees(path):
+    try:
+        articles = read_bundle(path)["data"]["education_articles"]
+    except (FileNotFoundError, KeyError, ValueError):
+        return {}
+    return reusable_trees(article.get("bodyTree") for article in articles)
+
+
+def compile_bundle(content_dir=CONTENT_DIR, out_path=BUNDLE_PATH):
+    """Validate the sources and write the compiled bundle; returns it"""
+    # Each body is parsed once, into its tree; unchanged bodies reuse the
+    # previous bundle's tree without parsing at all.
+    data = load_sources(content_dir, _previous_trees(out_path) if out_path else None)
+    validate_content(data, article_id)
+    bundle = {
+        "format": BUNDLE_FORMAT,
+        "version": hashlib.sha256(_encode(data).encode("utf-8")).hexdigest()[:16],
+        "sourceHash": source_hash(content_dir),
+        "data": data,
+    }
+    if out_path:
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        tmp_path = out_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(_encode(bundle))
+        os.replace(tmp_path, out_path)
+    return bundle
+
+
+def read_bundle(path=BUNDLE_PATH):
+    with open(path, encoding="utf-8") as f:
+        bundle = json.load(f)
+    if bundle.get("format") != BUNDLE_FORMAT:
+        raise ContentError(f"{path}: unsupported bundle format {bundle.get('format')!r}")
+    return bundle
+
+
+_cache = {}     # (content_dir, path) → bundle
+
+
+def load_bundle(content_dir=CONTENT_DIR, path=BUNDLE_PATH):
+    """The compiled bundle, recompiled first if the sources changed"""
+    key = (os.path.abspath(content_dir), os.path.abspath(path) if path else None)
+    if key in _cache:
+        return _cache[key]
+    current = source_hash(content_dir)
+    try:
+        bundle = read_bundle(path)
+        if bundle.get("sourceHash") != current:
+            bundle = None
+    except (FileNotFoundError, ValueError):
+        bundle = None
+    _cache[key] = bundle or compile_bundle(content_dir, path)
+    return _cache[key]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile content/ into a content bundle")
+    parser.add_argument("--out", default=BUNDLE_PATH, help="bundle path (default: %(default)s)")
+    parser.add_argument("--check", action="store_true",
+                        help="fail if the compiled bundle is missing or out of date")
+    args = parser.parse_args()
+
+    if args.check:
+        try:
+            fresh = read_bundle(args.out).get("sourceHash") == source_hash()
+        except (FileNotFoundError, ValueError):
+            fresh = False
+        print("✓ Content bundle is up to date" if fresh else "✗ Content bundle is stale")
+        sys.exit(0 if fresh else 1)
+
+    try:
+        bundle = compile_bundle(out_path=args.out)
+    except (ContentError, ValidationError) as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    data = bundle["data"]
+    print(f"✓ Compiled content bundle {bundle['version']} → {os.path.relpath(args.out)}")
+    print(f"   {sum(len(steps) for steps in data['journeys'].values())} journey steps, "
+          f"{sum(len(phases) for phases in data['self_care'].values())} self care phases, "
+          f"{len(data['education_articles'])} articles, "
+          f"{os.path.getsize(args.out) / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
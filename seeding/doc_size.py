@@ -0,0 +1,56 @@
+"""Firestore storage-size rules for documents, field names and values.
+
+https://firebase.google.com/docs/firestore/storage-size
+"""
+
+from datetime import date, datetime
+
+MAX_DOCUMENT_BYTES = 1024 * 1024  # 1 MiB
+
+
+def string_size(value):
+    """Strings cost their UTF-8 length plus one byte"""
+    return len(value.encode("utf-8")) + 1
+
+
+def document_name_size(path):
+    """Size of a document name such as 'users/jeff/tasks/my_task_id'"""
+    return sum(string_size(segment) for segment in path.strip("/").split("/")) + 16
+
+
+def value_size(value):
+    """Size of a single field value"""
+    if value is None:
+        return 1
+    if isinstance(value, bool):
+        return 1
+    if isinstance(value, (int, float)):
+        return 8
+    if isinstance(value, str):
+        return string_size(value)
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, (datetime, date)):
+        return 8
+    if isinstance(value, dict):
+        return fields_size(value)
+    if isinstance(value, (list, tuple)):
+        return sum(value_size(item) for item in value)
+    if hasattr(value, "latitude") and hasattr(value, "longitude"):
+        return 16
+    if hasattr(value, "path") and hasattr(value, "parent"):
+        return document_name_size(value.path)
+    if type(value).__name__ == "Sentinel":
+        # SERVER_TIMESTAMP resolves to a timestamp on the server.
+        return 8
+    raise TypeError(f"Unsupported Firestore value: {value!r}")
+
+
+def fields_size(data):
+    """Size of a map: every field name plus its value"""
+    return sum(string_size(key) + value_size(val) for key, val in data.items())
+
+
+def document_size(path, data):
+    """Stored size of the document at `path` holding `data`"""
+    return document_name_size(path) + fields_size(data) + 32
@@ -0,0 +1,171 @@
+"""Dry-run client: build every payload, send nothing, report what it would cost.
+
+DryRunClient stands in for the Firestore client. Batches committed through it
+are tallied into a WritePlan using Firestore's storage-size rules, so seeders
+run their normal code path (including BulkWriter chunking) with no network.
+
+Reads return nothing, so a --sync dry run reports the upper bound of a sync
+into an empty collection. With keep_documents=True the plan also keeps the
+final payload of every path, for tools that build on the planned writes.
+"""
+
+import threading
+from collections import defaultdict
+
+from seeding.doc_size import MAX_DOCUMENT_BYTES, document_name_size, document_size
+
+# Standard-edition list prices (USD per 100k operations, nam5/us multi-region).
+PRICE_PER_100K_WRITES = 0.18
+PRICE_PER_100K_DELETES = 0.02
+NEAR_LIMIT_RATIO = 0.9
+
+
+def collection_group(path):
+    """'config/self_care/period/Menstrual/rituals/1' → 'config/*/period/*/rituals'"""
+    segments = path.strip("/").split("/")[:-1]
+    return "/".join(seg if i % 2 == 0 else "*" for i, seg in enumerate(segments))
+
+
+def index_entries(data):
+    """Automatic single-field index entries a document creates.
+
+    Scalars (and scalar map subfields) get ascending + descending entries;
+    arrays get one array-contains entry per distinct element.
+    """
+    total = 0
+    for value in data.values():
+        if isinstance(value, dict):
+            total += index_entries(value)
+        elif isinstance(value, (list, tuple)):
+            total += len({repr(item) for item in value})
+        else:
+            total += 2
+    return total
+
+
+class WritePlan:
+    def __init__(self, keep_documents=False):
+        self._lock = threading.Lock()
+        self.documents = {} if keep_documents else None   # path → data
+        self.groups = defaultdict(lambda: {"writes": 0, "deletes": 0, "bytes": 0, "index_entries": 0})
+        self.largest = []   # (size, path), the biggest documents seen
+        self.near_limit = []
+
+    def record_set(self, path, data):
+        size = document_size(path, data)
+        with self._lock:
+            group = self.groups[collection_group(path)]
+            group["writes"] += 1
+            group["bytes"] += size
+            group["index_entries"] += index_entries(data)
+            if size >= MAX_DOCUMENT_BYTES * NEAR_LIMIT_RATIO:
+                self.near_limit.append((size, path))
+            self.largest = sorted(self.largest + [(size, path)], reverse=True)[:5]
+            if self.documents is not None:
+                self.documents[path] = data
+
+    def record_delete(self, path):
+        with self._lock:
+            group = self.groups[collection_group(path)]
+            group["deletes"] += 1
+            group["bytes"] += document_name_size(path)
+            if self.documents is not None:
+                self.documents.pop(path, None)
+
+    def totals(self):
+        keys = ("writes", "deletes", "bytes", "index_entries")
+        return {key: sum(group[key] for group in self.groups.values()) for key in keys}
+
+    def cost(self):
+        totals = self.totals()
+        return (totals["writes"] / 100_000 * PRICE_PER_100K_WRITES
+                + totals["deletes"] / 100_000 * PRICE_PER_100K_DELETES)
+
+    def report(self):
+        width = max([len("collection")] + [len(name) for name in self.groups])
+        lines = [
+            "DRY RUN — nothing was written",
+            f"  {'collection':<{width}}  {'writes':>7}  {'deletes':>7}  {'index entries':>13}  {'size':>10}",
+            f"  {'─' * width}  {'─' * 7}  {'─' * 7}  {'─' * 13}  {'─' * 10}",
+        ]
+        for name, group in sorted(self.groups.items()):
+            lines.append(f"  {name:<{width}}  {group['writes']:>7}  {group['deletes']:>7}  "
+                         f"{group['index_entries']:>13}  {group['bytes'] / 1024:>7.1f} KiB")
+        totals = self.totals()
+        lines.append(f"  {'total':<{width}}  {totals['writes']:>7}  {totals['deletes']:>7}  "
+                     f"{totals['index_entries']:>13}  {totals['bytes'] / 1024:>7.1f} KiB")
+        lines.append(f"  estimated cost ${self.cost():.6f} "
+                     f"(${PRICE_PER_100K_WRITES}/100k writes, ${PRICE_PER_100K_DELETES}/100k deletes)")
+        if self.largest:
+            lines.append("  largest documents:")
+            lines.extend(f"    {size / 1024:>7.1f} KiB  {path}" for size, path in self.largest)
+        for size, path in sorted(self.near_limit, reverse=True):
+            mark = "✗ over" if size > MAX_DOCUMENT_BYTES else "⚠ near"
+            lines.append(f"  {mark} the 1 MiB document limit: {path} ({size:,} bytes)")
+        return "\n".join(lines)
+
+
+# ═══════════════════════════════════════════════════════════════
+#  CLIENT STAND-IN
+# ═══════════════════════════════════════════════════════════════
+class _Missing:
+    exists = False
+
+    def to_dict(self):
+        return None
+
+
+class _Ref:
+    def __init__(self, path):
+        self.path = path.strip("/")
+        self.id = self.path.rsplit("/", 1)[-1]
+
+    def get(self):
+        return _Missing()
+
+
+class _Batch:
+    def __init__(self, plan):
+        self._plan = plan
+        self._ops = []
+
+    def set(self, ref, data, merge=False):
+        self._ops.append((ref.path, data))
+
+    def create(self, ref, data):
+        self._ops.append((ref.path, data))
+
+    def delete(self, ref):
+        self._ops.append((ref.path, None))
+
+    def commit(self):
+        for path, data in self._ops:
+            if data is None:
+                self._plan.record_delete(path)
+            else:
+                self._plan.record_set(path, data)
+        return []
+
+
+class _EmptyQuery:
+    def select(self, field_paths):
+        return self
+
+    def stream(self):
+        return iter(())
+
+
+class DryRunClient:
+    """Just enough of the Firestore client for the seeders' write paths"""
+
+    def __init__(self, keep_documents=False):
+        self.plan = WritePlan(keep_documents)
+
+    def document(self, path):
+        return _Ref(path)
+
+    def collection(self, path):
+        return _EmptyQuery()
+
+    def batch(self):
+        return _Batch(self.plan)
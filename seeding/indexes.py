@@ -0,0 +1,388 @@
+"""Composite indexes derived from a catalogue of the app's Firestore queries.
+
+Every query the app (or a bundle's named query) runs is declared in QUERIES.
+From those the tool works out which ones need a composite index, picks the
+smallest set of indexes that serves them all and writes firestore.indexes.json:
+
+    python3 -m seeding.indexes                          # regenerate the file
+    python3 -m seeding.indexes --check                  # exit 1 if it is stale
+    python3 -m seeding.indexes --emulator localhost:8080 --repeat 5
+
+With --emulator or --production every catalogued query is also run against
+seeded data and its result count and latency reported. The emulator never
+requires indexes, so only --production surfaces a missing one as an error;
+the static plan shows which index each query is expected to use.
+
+Index rules (https://firebase.google.com/docs/firestore/query-data/index-overview):
+equality and array-contains clauses merge across single-field indexes, and a
+query over one field needs none; anything ordering or ranging over one field
+after filtering on another needs a composite index of the equality fields (in
+any order), then the range/order fields in query order. An index whose leading
+fields match a query's equality set followed by its order fields serves it,
+so one index can serve several queries.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from itertools import permutations
+
+from seeding.client import CredentialsError, get_db, use_emulator
+from seeding.content import ROOT
+
+INDEXES_PATH = os.path.join(ROOT, "firestore.indexes.json")
+COLLECTION = "COLLECTION"
+COLLECTION_GROUP = "COLLECTION_GROUP"
+ASCENDING, DESCENDING, CONTAINS = "ASCENDING", "DESCENDING", "CONTAINS"
+
+EQUALITY_OPS = ("==", "in")
+ARRAY_OPS = ("array_contains", "array_contains_any")
+RANGE_OPS = ("<", "<=", ">", ">=", "!=", "not-in")
+
+
+def _utc_day(text):
+    """'2024-01-31' → that day's UTC midnight, the form log `date` fields take"""
+    day = date.fromisoformat(text)
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+
+def _last_month():
+    end = datetime.now(timezone.utc).date().replace(day=1) - timedelta(days=1)
+    return _utc_day(end.replace(day=1).isoformat()), _utc_day(end.isoformat())
+
+
+# Values substituted into {placeholders} in parents and filter values when
+# queries are run; uid defaults to the first user document found. Filter
+# values must have the stored field's type, or the query matches nothing.
+_month_start, _month_end = _last_month()
+DEFAULT_PARAMS = {"language": "en", "mode": "period", "seq": 0,
+                  "month_start": _month_start, "month_end": _month_end}
+# How --param KEY=VALUE strings are converted.
+PARAM_TYPES = {"seq": int, "month_start": _utc_day, "month_end": _utc_day}
+
+
+class Query:
+    def __init__(self, name, collection, where=(), order_by=(), limit=None,
+                 parent="", scope=COLLECTION, source=""):
+        self.name = name
+        self.collection = collection    # collection ID
+        self.where = list(where)        # (field, op, value) with SDK op strings
+        self.order_by = [(item, ASCENDING) if isinstance(item, str) else item
+                         for item in order_by]
+        self.limit = limit
+        self.parent = parent            # document path template for subcollections
+        self.scope = scope
+        self.source = source            # where the app runs it
+
+
+# ═══════════════════════════════════════════════════════════════
+#  CATALOGUE  (keep in step with the Dart providers)
+# ═══════════════════════════════════════════════════════════════
+QUERIES = [
+    Query("education", "education_articles",
+          where=[("isPublished", "==", True)], order_by=["order"],
+          source="lib/core/providers/dynamic_content_provider.dart _publishedArticles"),
+    Query("education-language-mode", "education_articles",
+          where=[("isPublished", "==", True), ("language", "==", "{language}"),
+                 ("mode", "array_contains_any", ["{mode}", "all"])],
+          order_by=["order"],
+          source="seeding/bundles.py named query education-<lang>-<mode>"),
+    Query("cycles", "cycles", parent="users/{uid}",
+          order_by=[("startDate", DESCENDING)],
+          source="lib/features/home/providers/home_provider.dart cycleListProvider"),
+    Query("period-logs", "entries", parent="users/{uid}/logs/period",
+          order_by=["date"],
+          source="lib/core/providers/period_journey_provider.dart"),
+    Query("month-logs", "entries", parent="users/{uid}/logs/{mode}",
+          where=[("date", ">=", "{month_start}"), ("date", "<=", "{month_end}")],
+          source="lib/features/home/providers/calendar_provider.dart, widgets/mini_calendar.dart"),
+    Query("recent-logs", "entries", parent="users/{uid}/logs/{mode}",
+          order_by=[("date", DESCENDING)], limit=7,
+          source="lib/features/home/screens/luna_screen.dart _buildLogCtx"),
+    Query("content-changes", "content_changes",
+          where=[("seq", ">", "{seq}")], order_by=["seq"],
+          source="seeding/changes.py changes_since"),
+]
+
+
+# ═══════════════════════════════════════════════════════════════
+#  PLANNING
+# ═══════════════════════════════════════════════════════════════
+class Shape:
+    """The index a query needs: an unordered equality prefix, then ordered fields"""
+
+    def __init__(self, collection, scope, equality, ordered):
+        self.collection = collection
+        self.scope = scope
+        self.equality = frozenset(equality)   # {(field, ASCENDING | CONTAINS)}
+        self.ordered = tuple(ordered)         # ((field, ASCENDING | DESCENDING), …)
+
+    def __len__(self):
+        return len(self.equality) + len(self.ordered)
+
+    def served_by(self, index):
+        fields = index["fields"]
+        k = len(self.equality)
+        return (index["collectionGroup"] == self.collection and index["queryScope"] == self.scope
+                and set(fields[:k]) == self.equality
+                and tuple(fields[k:k + len(self.ordered)]) == self.ordered)
+
+
+def required_shape(query):
+    """The composite index `query` needs, or None if single-field indexes serve it"""
+    equality, ordered = set(), []
+    ranged = []
+    for field, op, _ in query.where:
+        if op in EQUALITY_OPS:
+            equality.add((field, ASCENDING))
+        elif op in ARRAY_OPS:
+            equality.add((field, CONTAINS))
+        elif op in RANGE_OPS:
+            if field not in ranged:
+                ranged.append(field)
+        else:
+            raise ValueError(f"Query '{query.name}': unsupported operator '{op}'")
+
+    order_by = list(query.order_by)
+    if order_by and order_by[-1] == ("__name__", ASCENDING):
+        order_by.pop()            # every index ends in __name__ implicitly
+    # The range field is ordered first unless the query orders it explicitly.
+    ordered_fields = [field for field, _ in order_by]
+    ordered = [(field, ASCENDING) for field in ranged if field not in ordered_fields] + order_by
+    equal_fields = {field for field, _ in equality}
+    ordered = [item for item in ordered if item[0] not in equal_fields]
+
+    if not ordered:
+        return None               # equality and array-contains merge
+    if not equality and len({field for field, _ in ordered}) == 1:
+        return None               # one field: its single-field index
+    return Shape(query.collection, query.scope, equality, ordered)
+
+
+def _index(shape, equality):
+    return {"collectionGroup": shape.collection, "queryScope": shape.scope,
+            "fields": list(equality) + list(shape.ordered)}
+
+
+def plan_indexes(queries):
+    """(indexes, {query name: index position or None}) serving every query.
+
+    Queries needing the longest indexes go first; a query already served by a
+    chosen index adds nothing, and a new index takes the equality order that
+    serves the most queries still waiting.
+    """
+    shapes = {query.name: required_shape(query) for query in queries}
+    waiting = sorted((name for name, shape in shapes.items() if shape),
+                     key=lambda name: (-len(shapes[name]), name))
+    indexes = []
+    for name in waiting:
+        shape = shapes[name]
+        if any(shape.served_by(index) for index in indexes):
+            continue
+        equality = sorted(shape.equality)
+        orders = permutations(equality) if len(equality) <= 5 else [equality]
+        candidates = [_index(shape, order) for order in orders]
+        indexes.append(max(candidates, key=lambda index: sum(
+            shapes[other].served_by(index) for other in waiting)))
+
+    indexes.sort(key=lambda index: (index["collectionGroup"], index["queryScope"],
+                                    index["fields"]))
+    served = {}
+    for name, shape in shapes.items():
+        served[name] = None if shape is None else next(
+            i for i, index in enumerate(indexes) if shape.served_by(index))
+    return indexes, served
+
+
+# ═══════════════════════════════════════════════════════════════
+#  firestore.indexes.json
+# ═══════════════════════════════════════════════════════════════
+def _encode(index):
+    fields = [{"fieldPath": field, "arrayConfig": CONTAINS} if mode == CONTAINS
+              else {"fieldPath": field, "order": mode} for field, mode in index["fields"]]
+    return {"collectionGroup": index["collectionGroup"], "queryScope": index["queryScope"],
+            "fields": fields}
+
+
+def _decode(entry):
+    fields = [(field["fieldPath"], field.get("order") or field.get("arrayConfig"))
+              for field in entry["fields"]]
+    return {"collectionGroup": entry["collectionGroup"],
+            "queryScope": entry.get("queryScope", COLLECTION), "fields": fields}
+
+
+def load_indexes(path=INDEXES_PATH):
+    """The current file as {"indexes": [decoded], "fieldOverrides": [...]}"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        data = {}
+    return {"indexes": [_decode(entry) for entry in data.get("indexes", [])],
+            "fieldOverrides": data.get("fieldOverrides", [])}
+
+
+def render_indexes(indexes, field_overrides=()):
+    return json.dumps({"indexes": [_encode(index) for index in indexes],
+                       "fieldOverrides": list(field_overrides)}, indent=2) + "\n"
+
+
+def describe(index):
+    fields = ", ".join(f"{field} {mode}" for field, mode in index["fields"])
+    scope = " (group)" if index["queryScope"] == COLLECTION_GROUP else ""
+    return f"{index['collectionGroup']}{scope}: {fields}"
+
+
+def dropped_indexes(existing, planned, queries):
+    """[(index, reason)] for indexes in the file the plan leaves out"""
+    shapes = [shape for shape in map(required_shape, queries) if shape]
+    dropped = []
+    for index in existing:
+        if index in planned:
+            continue
+        if not any(shape.served_by(index) for shape in shapes):
+            dropped.append((index, "no catalogued query uses it"))
+        else:
+            dropped.append((index, "its queries are served by the planned indexes"))
+    return dropped
+
+
+# ═══════════════════════════════════════════════════════════════
+#  RUNNING QUERIES
+# ═══════════════════════════════════════════════════════════════
+def _fill(value, params):
+    if isinstance(value, str) and value.startswith("{") and value.endswith("}"):
+        return params[value[1:-1]]
+    if isinstance(value, list):
+        return [_fill(item, params) for item in value]
+    return value
+
+
+def build_query(db, query, params):
+    """The SDK query for a catalogue entry, with placeholders filled from params"""
+    from google.cloud.firestore_v1.base_query import FieldFilter
+
+    if query.scope == COLLECTION_GROUP:
+        sdk_query = db.collection_group(query.collection)
+    else:
+        parent = query.parent.format(**params)
+        sdk_query = db.collection(f"{parent}/{query.collection}" if parent else query.collection)
+    for field, op, value in query.where:
+        sdk_query = sdk_query.where(filter=FieldFilter(field, op, _fill(value, params)))
+    for field, direction in query.order_by:
+        sdk_query = sdk_query.order_by(field, direction=direction)
+    if query.limit:
+        sdk_query = sdk_query.limit(query.limit)
+    return sdk_query
+
+
+def run_queries(db, queries, params, repeat=3):
+    """{query name: {"count", "ms": [per run], "error"}}"""
+    results = {}
+    for query in queries:
+        result = {"count": 0, "ms": [], "error": None}
+        try:
+            for _ in range(repeat):
+                started = time.perf_counter()
+                result["count"] = sum(1 for _ in build_query(db, query, params).stream())
+                result["ms"].append((time.perf_counter() - started) * 1000)
+        except KeyError as e:
+            result["error"] = f"no value for {e}"
+        except Exception as e:      # FailedPrecondition carries the index link
+            result["error"] = str(e).splitlines()[0]
+        results[query.name] = result
+    return results
+
+
+def first_user(db):
+    for snapshot in db.collection("users").limit(1).stream():
+        return snapshot.id
+    return None
+
+
+def format_results(queries, results, served):
+    width = max(len(query.name) for query in queries)
+    lines = [f"  {'query':<{width}}  {'docs':>6}  {'median':>8}  {'max':>8}  index"]
+    for query in queries:
+        result = results[query.name]
+        index = "single-field" if served[query.name] is None else f"#{served[query.name] + 1}"
+        if result["error"]:
+            lines.append(f"✗ {query.name:<{width}}  {result['error']}")
+        else:
+            lines.append(f"✓ {query.name:<{width}}  {result['count']:>6}  "
+                         f"{statistics.median(result['ms']):>6.1f}ms  "
+                         f"{max(result['ms']):>6.1f}ms  {index}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate composite indexes from the query catalogue")
+    parser.add_argument("--out", default=INDEXES_PATH, help="indexes file (default: %(default)s)")
+    parser.add_argument("--check", action="store_true",
+                        help="fail if the indexes file differs from the plan instead of writing it")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--emulator", metavar="HOST:PORT", help="run every query against an emulator")
+    target.add_argument("--production", action="store_true",
+                        help="run every query against the configured production project")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per query (default: %(default)s)")
+    parser.add_argument("--param", action="append", default=[], metavar="KEY=VALUE",
+                        help="placeholder values, e.g. --param uid=abc --param month_start=2024-01-01")
+    args = parser.parse_args()
+
+    indexes, served = plan_indexes(QUERIES)
+    current = load_indexes(args.out)
+    for position, index in enumerate(indexes, 1):
+        users = ", ".join(name for name, i in served.items() if i == position - 1)
+        marker = " " if index in current["indexes"] else "+"
+        print(f"  {marker} #{position} {describe(index)}\n        ← {users}")
+    for index, reason in dropped_indexes(current["indexes"], indexes, QUERIES):
+        print(f"  - {describe(index)}\n        ({reason})")
+
+    rendered = render_indexes(indexes, current["fieldOverrides"])
+    try:
+        with open(args.out, encoding="utf-8") as f:
+            stale = f.read() != rendered
+    except FileNotFoundError:
+        stale = True
+    if args.check:
+        if stale:
+            print(f"✗ {os.path.relpath(args.out)} is out of date; run python3 -m seeding.indexes")
+            sys.exit(1)
+        print(f"✓ {os.path.relpath(args.out)} is up to date ({len(indexes)} indexes)")
+    elif stale:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(rendered)
+        print(f"✓ Wrote {len(indexes)} indexes to {os.path.relpath(args.out)}")
+    else:
+        print(f"✓ {os.path.relpath(args.out)} unchanged ({len(indexes)} indexes)")
+
+    if not (args.emulator or args.production):
+        return
+    if args.emulator:
+        use_emulator(args.emulator)
+    try:
+        db = get_db()
+    except CredentialsError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    params = dict(DEFAULT_PARAMS)
+    for item in args.param:
+        key, value = item.split("=", 1)
+        params[key] = PARAM_TYPES.get(key, str)(value)
+    if "uid" not in params:
+        uid = first_user(db)
+        if uid:
+            params["uid"] = uid
+    print()
+    results = run_queries(db, QUERIES, params, args.repeat)
+    print(format_results(QUERIES, results, served))
+    if any(result["error"] for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
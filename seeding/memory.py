@@ -0,0 +1,602 @@
+"""In-process, in-memory stand-in for the Firestore client.
+
+    SEED_FIRESTORE=memory python3 seed.py          # no credentials, no JVM
+
+get_db() returns a MemoryClient when SEED_FIRESTORE=memory. It covers the
+part of the google-cloud-firestore API the seeders and tools use:
+
+    db.collection(path) / db.document(path) / db.collection_group(id)
+    collection.document(id) / .add() / .list_documents(); document.collection(id)
+    / .collections() / .get() / .set(merge=) / .create() / .update() / .delete()
+    db.batch() with set/create/update/delete/commit, db.get_all(refs)
+    where (positional or filter=FieldFilter; ==, !=, <, <=, >, >=, in, not-in,
+    array_contains, array_contains_any), order_by, limit, limit_to_last,
+    offset, select, start_at/start_after/end_at/end_before
+    SERVER_TIMESTAMP and DELETE_FIELD sentinels
+
+Documents live in one dict keyed by path. Each collection keeps an index of
+its child IDs and each collection ID an index of its document paths, so
+listing a collection or a collection group never scans the whole store.
+Batches are atomic: preconditions (create on an existing doc, update on a
+missing one) are checked before anything is applied, and more than 500 writes
+is rejected just as the real service does.
+
+`stats` counts commits, writes, queries and documents read, for benchmarks.
+"""
+
+import copy
+import random
+import string
+import threading
+from datetime import datetime, timezone
+
+MAX_BATCH_WRITES = 500
+_AUTO_ID_CHARS = string.ascii_letters + string.digits
+
+
+def _sentinels():
+    try:
+        from google.cloud.firestore_v1 import DELETE_FIELD, SERVER_TIMESTAMP
+        return SERVER_TIMESTAMP, DELETE_FIELD
+    except ImportError:
+        return object(), object()
+
+
+def _errors():
+    """(AlreadyExists, NotFound, InvalidArgument), the SDK's when installed"""
+    try:
+        from google.api_core import exceptions
+        return exceptions.AlreadyExists, exceptions.NotFound, exceptions.InvalidArgument
+    except ImportError:
+        return FileExistsError, KeyError, ValueError
+
+
+def _auto_id():
+    return "".join(random.choice(_AUTO_ID_CHARS) for _ in range(20))
+
+
+def _split(path):
+    return [segment for segment in path.strip("/").split("/") if segment]
+
+
+# ═══════════════════════════════════════════════════════════════
+#  VALUES
+# ═══════════════════════════════════════════════════════════════
+def _utc(moment):
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def order_key(value):
+    """Sort key following Firestore's cross-type value ordering"""
+    if value is None:
+        return (0,)
+    if isinstance(value, bool):
+        return (1, value)
+    if isinstance(value, (int, float)):
+        return (2, value)
+    if isinstance(value, datetime):
+        return (3, _utc(value))
+    if isinstance(value, str):
+        return (4, value)
+    if isinstance(value, (bytes, bytearray)):
+        return (5, bytes(value))
+    if isinstance(value, (list, tuple)):
+        return (8, tuple(order_key(item) for item in value))
+    if isinstance(value, dict):
+        return (9, tuple(sorted((key, order_key(item)) for key, item in value.items())))
+    if hasattr(value, "path") and hasattr(value, "id"):
+        return (6, tuple(_split(value.path)))
+    if hasattr(value, "latitude") and hasattr(value, "longitude"):
+        return (7, (value.latitude, value.longitude))
+    raise TypeError(f"Unsupported value type {type(value).__name__}")
+
+
+def _compare(a, b):
+    a, b = order_key(a), order_key(b)
+    return (a > b) - (a < b)
+
+
+_MISSING = object()
+
+
+def _lookup(data, field_path):
+    for part in field_path.split("."):
+        if not isinstance(data, dict) or part not in data:
+            return _MISSING
+        data = data[part]
+    return data
+
+
+def _assign(data, field_path, value):
+    parts = field_path.split(".")
+    for part in parts[:-1]:
+        if not isinstance(data.get(part), dict):
+            data[part] = {}
+        data = data[part]
+    data[parts[-1]] = value
+
+
+def _discard(data, field_path):
+    parts = field_path.split(".")
+    for part in parts[:-1]:
+        data = data.get(part)
+        if not isinstance(data, dict):
+            return
+    data.pop(parts[-1], None)
+
+
+def _project(data, field_paths):
+    projected = {}
+    for field_path in field_paths:
+        value = _lookup(data, field_path)
+        if value is not _MISSING:
+            _assign(projected, field_path, copy.deepcopy(value))
+    return projected
+
+
+def _matches(value, op, operand):
+    if value is _MISSING:
+        return False
+    if op == "==":
+        return _compare(value, operand) == 0
+    if op == "!=":
+        return value is not None and _compare(value, operand) != 0
+    if op in ("<", "<=", ">", ">="):
+        if order_key(value)[0] != order_key(operand)[0]:
+            return False        # range filters only match values of the same type
+        result = _compare(value, operand)
+        return {"<": result < 0, "<=": result <= 0, ">": result > 0, ">=": result >= 0}[op]
+    if op == "in":
+        return any(_compare(value, item) == 0 for item in operand)
+    if op == "not-in":
+        return value is not None and all(_compare(value, item) != 0 for item in operand)
+    if op == "array_contains":
+        return isinstance(value, list) and any(_compare(item, operand) == 0 for item in value)
+    if op == "array_contains_any":
+        return isinstance(value, list) and any(
+            _compare(item, wanted) == 0 for item in value for wanted in operand)
+    raise ValueError(f"Unsupported operator '{op}'")
+
+
+# ═══════════════════════════════════════════════════════════════
+#  SNAPSHOTS AND REFERENCES
+# ═══════════════════════════════════════════════════════════════
+class DocumentSnapshot:
+    def __init__(self, reference, data, create_time=None, update_time=None, read_time=None):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+        self.exists = data is not None
+        self.create_time = create_time
+        self.update_time = update_time
+        self.read_time = read_time
+
+    def to_dict(self):
+        return copy.deepcopy(self._data)
+
+    def get(self, field_path):
+        value = _lookup(self._data or {}, field_path)
+        if value is _MISSING:
+            raise KeyError(field_path)
+        return copy.deepcopy(value)
+
+
+class DocumentReference:
+    def __init__(self, client, path):
+        self._client = client
+        self.path = "/".join(_split(path))
+        self.id = self.path.rsplit("/", 1)[-1]
+
+    def __eq__(self, other):
+        return isinstance(other, DocumentReference) and other.path == self.path
+
+    def __hash__(self):
+        return hash(self.path)
+
+    def __repr__(self):
+        return f"<DocumentReference {self.path}>"
+
+    @property
+    def parent(self):
+        return CollectionReference(self._client, self.path.rsplit("/", 1)[0])
+
+    def collection(self, collection_id):
+        return CollectionReference(self._client, f"{self.path}/{collection_id}")
+
+    def collections(self):
+        return [self.collection(collection_id)
+                for collection_id in sorted(self._client._subcollections_of(self.path))]
+
+    def get(self, field_paths=None, transaction=None):
+        return self._client._get(self.path, field_paths)
+
+    def set(self, document_data, merge=False):
+        return self._client._commit([("set", self.path, document_data, merge)])[0]
+
+    def create(self, document_data):
+        return self._client._commit([("create", self.path, document_data, False)])[0]
+
+    def update(self, field_updates):
+        return self._client._commit([("update", self.path, field_updates, False)])[0]
+
+    def delete(self):
+        return self._client._commit([("delete", self.path, None, False)])[0]
+
+
+class WriteResult:
+    def __init__(self, update_time):
+        self.update_time = update_time
+
+
+# ═══════════════════════════════════════════════════════════════
+#  QUERIES
+# ═══════════════════════════════════════════════════════════════
+class Query:
+    ASCENDING = "ASCENDING"
+    DESCENDING = "DESCENDING"
+
+    def __init__(self, client, path, all_descendants=False):
+        self._client = client
+        self._path = path                 # collection path, or collection ID for a group
+        self._all_descendants = all_descendants
+        self._filters = []
+        self._orders = []
+        self._limit = None
+        self._limit_to_last = False
+        self._offset = 0
+        self._projection = None
+        self._start = None                # (values, inclusive)
+        self._end = None
+
+    def _copy(self, **changes):
+        query = Query(self._client, self._path, self._all_descendants)
+        query.__dict__.update({key: value for key, value in self.__dict__.items()
+                               if key not in ("_client", "_path", "_all_descendants")})
+        query._filters = list(self._filters)
+        query._orders = list(self._orders)
+        query.__dict__.update(changes)
+        return query
+
+    def where(self, field_path=None, op_string=None, value=None, filter=None):
+        if filter is not None:
+            if not hasattr(filter, "op_string"):
+                raise ValueError("Only FieldFilter filters are supported")
+            field_path, op_string, value = filter.field_path, filter.op_string, filter.value
+        return self._copy(_filters=self._filters + [(field_path, op_string, value)])
+
+    def order_by(self, field_path, direction=ASCENDING):
+        return self._copy(_orders=self._orders + [(field_path, direction)])
+
+    def limit(self, count):
+        return self._copy(_limit=count, _limit_to_last=False)
+
+    def limit_to_last(self, count):
+        return self._copy(_limit=count, _limit_to_last=True)
+
+    def offset(self, count):
+        return self._copy(_offset=count)
+
+    def select(self, field_paths):
+        return self._copy(_projection=list(field_paths))
+
+    def start_at(self, document_fields_or_snapshot):
+        return self._copy(_start=(document_fields_or_snapshot, True))
+
+    def start_after(self, document_fields_or_snapshot):
+        return self._copy(_start=(document_fields_or_snapshot, False))
+
+    def end_at(self, document_fields_or_snapshot):
+        return self._copy(_end=(document_fields_or_snapshot, True))
+
+    def end_before(self, document_fields_or_snapshot):
+        return self._copy(_end=(document_fields_or_snapshot, False))
+
+    # ── Execution ───────────────────────────────────────────────
+    def _effective_orders(self):
+        orders = list(self._orders)
+        ordered = {field for field, _ in orders}
+        if not orders:
+            # An inequality filter orders by its field first.
+            for field, op, _ in self._filters:
+                if op in ("<", "<=", ">", ">=", "!=", "not-in") and field not in ordered:
+                    orders.append((field, self.ASCENDING))
+                    ordered.add(field)
+        if "__name__" not in ordered:
+            direction = orders[-1][1] if orders else self.ASCENDING
+            orders.append(("__name__", direction))
+        return orders
+
+    def _cursor_values(self, cursor, orders):
+        if isinstance(cursor, DocumentSnapshot):
+            return [cursor.reference if field == "__name__" else _lookup(cursor._data or {}, field)
+                    for field, _ in orders]
+        if isinstance(cursor, dict):
+            values = []
+            for field, _ in orders:
+                if field not in cursor:
+                    break
+                values.append(cursor[field])
+            return values
+        return list(cursor)
+
+    def _name_value(self, value):
+        if isinstance(value, str):
+            if self._all_descendants or "/" in value:
+                return DocumentReference(self._client, value)
+            return DocumentReference(self._client, f"{self._path}/{value}")
+        return value
+
+    def _position(self, path, data, cursor, orders):
+        """-1/0/1: where a document sorts relative to a cursor"""
+        values = self._cursor_values(cursor, orders)
+        for (field, direction), wanted in zip(orders, values):
+            if field == "__name__":
+                result = _compare(DocumentReference(self._client, path), self._name_value(wanted))
+            else:
+                result = _compare(_lookup(data, field), wanted)
+            if direction == self.DESCENDING:
+                result = -result
+            if result:
+                return result
+        return 0
+
+    def _run(self):
+        client = self._client
+        with client._lock:
+            client.stats["queries"] += 1
+            paths = client._candidate_paths(self._path, self._all_descendants)
+            rows = [(path, client._docs[path]) for path in paths]
+            for field, op, value in self._filters:
+                if field == "__name__":
+                    rows = [(path, data) for path, data in rows
+                            if _matches(DocumentReference(client, path), op, self._name_value(value))]
+                else:
+                    rows = [(path, data) for path, data in rows if _matches(_lookup(data, field), op, value)]
+
+            orders = self._effective_orders()
+            # Documents missing an ordered field never match.
+            rows = [(path, data) for path, data in rows
+                    if all(field == "__name__" or _lookup(data, field) is not _MISSING
+                           for field, _ in orders)]
+            for field, direction in reversed(orders):
+                rows.sort(key=lambda row: order_key(DocumentReference(client, row[0]))
+                          if field == "__name__" else order_key(_lookup(row[1], field)),
+                          reverse=direction == self.DESCENDING)
+
+            if self._start is not None:
+                cursor, inclusive = self._start
+                rows = [row for row in rows
+                        if self._position(row[0], row[1], cursor, orders) >= (0 if inclusive else 1)]
+            if self._end is not None:
+                cursor, inclusive = self._end
+                rows = [row for row in rows
+                        if self._position(row[0], row[1], cursor, orders) <= (0 if inclusive else -1)]
+            rows = rows[self._offset:]
+            if self._limit is not None:
+                rows = rows[-self._limit:] if self._limit_to_last else rows[:self._limit]
+            return [client._snapshot(path, self._projection) for path, _ in rows]
+
+    def stream(self, transaction=None):
+        return iter(self._run())
+
+    def get(self, transaction=None):
+        return self._run()
+
+
+class CollectionGroup(Query):
+    def __init__(self, client, collection_id):
+        super().__init__(client, collection_id, all_descendants=True)
+
+
+class CollectionReference(Query):
+    def __init__(self, client, path):
+        super().__init__(client, "/".join(_split(path)))
+        self.path = self._path
+        self.id = self.path.rsplit("/", 1)[-1]
+
+    @property
+    def parent(self):
+        if "/" not in self.path:
+            return None
+        return DocumentReference(self._client, self.path.rsplit("/", 1)[0])
+
+    def document(self, document_id=None):
+        return DocumentReference(self._client, f"{self.path}/{document_id or _auto_id()}")
+
+    def add(self, document_data, document_id=None):
+        reference = self.document(document_id)
+        result = reference.create(document_data)
+        return result.update_time, reference
+
+    def list_documents(self, page_size=None):
+        """Every child document, including ones that only hold subcollections"""
+        with self._client._lock:
+            ids = sorted(self._client._children.get(self.path, ()))
+        return [self.document(doc_id) for doc_id in ids]
+
+
+# ═══════════════════════════════════════════════════════════════
+#  CLIENT
+# ═══════════════════════════════════════════════════════════════
+class WriteBatch:
+    def __init__(self, client):
+        self._client = client
+        self._writes = []
+
+    def set(self, reference, document_data, merge=False):
+        self._writes.append(("set", reference.path, document_data, merge))
+
+    def create(self, reference, document_data):
+        self._writes.append(("create", reference.path, document_data, False))
+
+    def update(self, reference, field_updates):
+        self._writes.append(("update", reference.path, field_updates, False))
+
+    def delete(self, reference):
+        self._writes.append(("delete", reference.path, None, False))
+
+    def __len__(self):
+        return len(self._writes)
+
+    def commit(self):
+        results = self._client._commit(self._writes)
+        self._writes = []
+        return results
+
+
+class MemoryClient:
+    """Firestore client API over plain dicts; see the module docstring"""
+
+    def __init__(self, project="memory"):
+        self.project = project
+        self._lock = threading.RLock()
+        self._docs = {}             # document path → data
+        self._times = {}            # document path → (create_time, update_time)
+        self._children = {}         # collection path → child IDs, incl. parents of subcollections
+        self._subcollections = {}   # document path ("" for the root) → collection IDs
+        self._groups = {}           # collection ID → paths of existing documents
+        self._server_timestamp, self._delete_field = _sentinels()
+        self.stats = {"commits": 0, "writes": 0, "queries": 0, "reads": 0}
+
+    # ── Client API ──────────────────────────────────────────────
+    def collection(self, *path):
+        return CollectionReference(self, "/".join(path))
+
+    def document(self, *path):
+        return DocumentReference(self, "/".join(path))
+
+    def collection_group(self, collection_id):
+        return CollectionGroup(self, collection_id)
+
+    def collections(self):
+        return [self.collection(collection_id) for collection_id in sorted(self._subcollections_of(""))]
+
+    def batch(self):
+        return WriteBatch(self)
+
+    def get_all(self, references, field_paths=None, transaction=None):
+        for reference in references:
+            yield self._get(reference.path, field_paths)
+
+    def close(self):
+        pass
+
+    # ── Reads ───────────────────────────────────────────────────
+    def _subcollections_of(self, path):
+        with self._lock:
+            return set(self._subcollections.get(path, ()))
+
+    def _snapshot(self, path, field_paths=None):
+        data = self._docs.get(path)
+        if data is not None:
+            self.stats["reads"] += 1
+            data = _project(data, field_paths) if field_paths is not None else data
+        created, updated = self._times.get(path, (None, None))
+        return DocumentSnapshot(DocumentReference(self, path), data, created, updated,
+                                datetime.now(timezone.utc))
+
+    def _get(self, path, field_paths=None):
+        with self._lock:
+            return self._snapshot("/".join(_split(path)), field_paths)
+
+    def _candidate_paths(self, path, all_descendants):
+        if all_descendants:
+            return list(self._groups.get(path, ()))
+        return [f"{path}/{doc_id}" for doc_id in self._children.get(path, ())
+                if f"{path}/{doc_id}" in self._docs]
+
+    # ── Writes ──────────────────────────────────────────────────
+    def _resolve(self, value, now):
+        if value is self._server_timestamp:
+            return now
+        if isinstance(value, dict):
+            return {key: self._resolve(item, now) for key, item in value.items()
+                    if item is not self._delete_field}
+        if isinstance(value, (list, tuple)):
+            return [self._resolve(item, now) for item in value]
+        return copy.deepcopy(value)
+
+    def _merge(self, target, data, now):
+        for key, value in data.items():
+            if value is self._delete_field:
+                target.pop(key, None)
+            elif isinstance(value, dict) and isinstance(target.get(key), dict):
+                self._merge(target[key], value, now)
+            else:
+                target[key] = self._resolve(value, now)
+
+    def _link(self, path):
+        segments = _split(path)
+        for depth in range(1, len(segments), 2):
+            parent = "/".join(segments[:depth - 1])
+            collection = "/".join(segments[:depth])
+            self._subcollections.setdefault(parent, set()).add(segments[depth - 1])
+            self._children.setdefault(collection, set()).add(segments[depth])
+        self._groups.setdefault(segments[-2], set()).add(path)
+
+    def _unlink(self, path):
+        self._groups.get(path.split("/")[-2], set()).discard(path)
+        while path and path not in self._docs and not self._subcollections.get(path):
+            collection, doc_id = path.rsplit("/", 1)
+            self._children[collection].discard(doc_id)
+            if self._children[collection]:
+                return
+            del self._children[collection]
+            parent, _, collection_id = collection.rpartition("/")
+            self._subcollections[parent].discard(collection_id)
+            if self._subcollections[parent]:
+                return
+            del self._subcollections[parent]
+            path = parent
+
+    def _commit(self, writes):
+        already_exists, not_found, invalid = _errors()
+        if len(writes) > MAX_BATCH_WRITES:
+            raise invalid(f"maximum {MAX_BATCH_WRITES} writes allowed per request")
+        for kind, path, _, _ in writes:
+            if len(_split(path)) % 2:
+                raise invalid(f"'{path}' is not a document path")
+
+        with self._lock:
+            now = datetime.now(timezone.utc)
+            staged = {}
+            for kind, path, data, merge in writes:
+                path = "/".join(_split(path))
+                current = staged[path] if path in staged else self._docs.get(path)
+                if kind == "create":
+                    if current is not None:
+                        raise already_exists(f"Document already exists: {path}")
+                    staged[path] = self._resolve(data, now)
+                elif kind == "set":
+                    if merge and current is not None:
+                        merged = copy.deepcopy(current)
+                        self._merge(merged, data, now)
+                        staged[path] = merged
+                    else:
+                        staged[path] = self._resolve(data, now)
+                elif kind == "update":
+                    if current is None:
+                        raise not_found(f"No document to update: {path}")
+                    updated = copy.deepcopy(current)
+                    for field_path, value in data.items():
+                        if value is self._delete_field:
+                            _discard(updated, field_path)
+                        else:
+                            _assign(updated, field_path, self._resolve(value, now))
+                    staged[path] = updated
+                else:
+                    staged[path] = None
+
+            for path, data in staged.items():
+                if data is None:
+                    if self._docs.pop(path, None) is not None:
+                        self._times.pop(path, None)
+                        self._unlink(path)
+                else:
+                    created = self._times.get(path, (now, now))[0]
+                    self._docs[path] = data
+                    self._times[path] = (created, now)
+                    self._link(path)
+            self.stats["commits"] += 1
+            self.stats["writes"] += len(writes)
+            return [WriteResult(now) for _ in writes]
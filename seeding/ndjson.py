@@ -0,0 +1,121 @@
+"""Newline-delimited JSON documents: one {"path": …, "data": …} per line.
+
+Values JSON cannot represent natively are written as tagged objects:
+
+    {"__type__": "timestamp", "value": "2026-02-15T00:00:00+00:00"}
+    {"__type__": "geopoint", "latitude": 3.14, "longitude": 101.69}
+    {"__type__": "reference", "path": "users/abc"}
+    {"__type__": "bytes", "value": "<base64>"}
+
+Paths ending in .gz are gzip-compressed transparently.
+"""
+
+import base64
+import gzip
+import json
+from datetime import datetime, timezone
+
+TYPE_KEY = "__type__"
+
+_sdk_types = None
+
+
+def sdk_types():
+    """(GeoPoint, DocumentReference), or (None, None) without the Firestore SDK"""
+    global _sdk_types
+    if _sdk_types is None:
+        try:
+            from google.cloud.firestore_v1 import DocumentReference, GeoPoint
+            _sdk_types = (GeoPoint, DocumentReference)
+        except ImportError:
+            _sdk_types = (None, None)
+    return _sdk_types
+
+
+def encode_value(value):
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return {TYPE_KEY: "timestamp", "value": value.isoformat()}
+    if isinstance(value, dict):
+        return {key: encode_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    if isinstance(value, bytes):
+        return {TYPE_KEY: "bytes", "value": base64.b64encode(value).decode("ascii")}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+
+    geo_point, reference = sdk_types()
+    if geo_point is not None and isinstance(value, geo_point):
+        return {TYPE_KEY: "geopoint", "latitude": value.latitude, "longitude": value.longitude}
+    if reference is not None and isinstance(value, reference):
+        return {TYPE_KEY: "reference", "path": value.path}
+    raise TypeError(f"Cannot encode {type(value).__name__} as NDJSON")
+
+
+def decode_value(value, db=None):
+    """Inverse of encode_value; references need `db` to be rebuilt"""
+    if isinstance(value, dict):
+        kind = value.get(TYPE_KEY)
+        if kind is None:
+            return {key: decode_value(item, db) for key, item in value.items()}
+        if kind == "timestamp":
+            return datetime.fromisoformat(value["value"])
+        if kind == "bytes":
+            return base64.b64decode(value["value"])
+        if kind == "geopoint":
+            geo_point, _ = sdk_types()
+            if geo_point is None:
+                raise ValueError("Decoding a geopoint needs the Firestore SDK")
+            return geo_point(value["latitude"], value["longitude"])
+        if kind == "reference":
+            if db is None:
+                raise ValueError(f"Decoding reference {value['path']!r} needs a Firestore client")
+            return db.document(value["path"])
+        raise ValueError(f"Unknown NDJSON value type {kind!r}")
+    if isinstance(value, list):
+        return [decode_value(item, db) for item in value]
+    return value
+
+
+def dumps(path, data):
+    return json.dumps({"path": path, "data": encode_value(data)},
+                      ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(line, db=None):
+    record = json.loads(line)
+    return record["path"], decode_value(record["data"], db)
+
+
+def open_text(path, mode="r"):
+    """Open an NDJSON file for text I/O, gzip-compressed if it ends in .gz"""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def write_records(path, records):
+    """Stream (path, data) pairs to an NDJSON file; returns the count"""
+    count = 0
+    with open_text(path, "w") as f:
+        for doc_path, data in records:
+            f.write(dumps(doc_path, data) + "\n")
+            count += 1
+    return count
+
+
+def read_records(path, db=None, skip=0):
+    """Yield (path, data) pairs from an NDJSON file, one line at a time.
+
+    The first `skip` records are passed over without being decoded.
+    """
+    with open_text(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            if skip:
+                skip -= 1
+                continue
+            yield loads(line, db)
@@ -0,0 +1,137 @@
+"""Traffic ramp-up for large imports into cold collections.
+
+Firestore splits a collection's key range as its load grows, so a fresh
+collection (education_articles for a new locale, a synthetic users/** tree)
+throttles a writer that starts at full speed with RESOURCE_EXHAUSTED and
+contention errors. The 500/50/5 rule avoids that: start at 500 ops/s and
+raise the rate by at most 50% every 5 minutes.
+
+RampController paces BulkWriter and AsyncWriter commits on that schedule.
+On a throttling error it halves the rate and restarts the schedule from
+there; the writer then retries after its usual jittered backoff. Writers also
+reorder each window of queued writes by a hash of the document path, so
+sequential IDs land on different key ranges instead of one hot tablet.
+
+    python3 seed.py --ramp                    # 500 ops/s, +50% every 5 min
+    python3 -m seeding.transfer import DIR --production --ramp 200
+    python3 -m seeding.synthetic --users 50000 --emulator localhost:8080 --ramp
+"""
+
+import hashlib
+import math
+import threading
+import time
+
+START_RATE = 500            # ops/s
+GROWTH = 0.5                # +50% …
+STEP_SECONDS = 300          # … every 5 minutes
+MIN_RATE = 10
+REPORT_SECONDS = 60
+# Throttle signals close together are one overload event, cut once.
+COOLDOWN_SECONDS = 1.0
+
+_throttling_errors = None
+
+
+def throttling_errors():
+    """Errors that mean the backend wants less traffic; imported on first use"""
+    global _throttling_errors
+    if _throttling_errors is None:
+        try:
+            from google.api_core import exceptions as api_exceptions
+            _throttling_errors = (api_exceptions.ResourceExhausted, api_exceptions.Aborted)
+        except ImportError:
+            _throttling_errors = ()
+    return _throttling_errors
+
+
+def spread_key(op):
+    """Sort key that scatters adjacent document paths across the key range"""
+    return hashlib.blake2b(op[1].encode("utf-8"), digest_size=8).digest()
+
+
+class RampController:
+    """Shared ops/s budget following the 500/50/5 schedule.
+
+    Usage:
+        ramp = RampController()
+        time.sleep(ramp.reserve(len(batch)))   # before each commit
+        ramp.record(len(batch))                # after it succeeds
+        ramp.throttled()                       # on RESOURCE_EXHAUSTED / ABORTED
+        print(ramp.report())
+    """
+
+    def __init__(self, start=START_RATE, growth=GROWTH, step=STEP_SECONDS, min_rate=MIN_RATE,
+                 max_rate=None, clock=time.monotonic):
+        self._growth = growth
+        self._step = step
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._started = self._epoch = clock()
+        self._base = float(start)
+        self._next = self._started      # when the budget spent so far has accrued
+        self._last_cut = None
+        self._buckets = {}              # report interval → [writes, highest limit]
+
+        self.throttles = 0
+        self.writes = 0
+
+    def rate(self, now=None):
+        """Current limit in ops/s"""
+        now = self._clock() if now is None else now
+        rate = self._base * (1 + self._growth) ** math.floor((now - self._epoch) / self._step)
+        return min(rate, self._max_rate) if self._max_rate else rate
+
+    def reserve(self, count):
+        """Claim `count` ops; returns how long to wait before sending them"""
+        with self._lock:
+            now = self._clock()
+            # A batch goes out once its ops have accrued, so no burst beats the rate.
+            start = max(now, self._next)
+            self._next = start + count / self.rate(start)
+            return self._next - now
+
+    def acquire(self, count):
+        time.sleep(self.reserve(count))
+
+    def record(self, count):
+        """`count` ops were committed"""
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets.setdefault(int((now - self._started) // REPORT_SECONDS), [0, 0.0])
+            bucket[0] += count
+            bucket[1] = max(bucket[1], self.rate(now))
+            self.writes += count
+
+    def throttled(self):
+        """Halve the rate and restart the ramp from there"""
+        with self._lock:
+            now = self._clock()
+            if self._last_cut is not None and now - self._last_cut < COOLDOWN_SECONDS:
+                return
+            self._base = max(self._min_rate, self.rate(now) / 2)
+            self._epoch = self._last_cut = now
+            self.throttles += 1
+
+    # ── Reporting ───────────────────────────────────────────────
+    def report(self):
+        with self._lock:
+            buckets = sorted(self._buckets.items())
+            elapsed = self._clock() - self._started
+        lines = [f"  {'time':>11}  {'writes':>9}  {'achieved':>10}  {'limit':>8}"]
+        for index, (writes, limit) in buckets:
+            start = index * REPORT_SECONDS
+            seconds = min(REPORT_SECONDS, max(elapsed - start, 1e-9))
+            lines.append(f"  {_clock_text(start):>5}–{_clock_text(start + REPORT_SECONDS):<5}  "
+                         f"{writes:>9,}  {writes / seconds:>8,.0f}/s  {limit:>6,.0f}/s")
+        average = self.writes / elapsed if elapsed else 0.0
+        lines.append(f"  {self.writes:,} writes in {elapsed:.1f}s · {average:,.0f} writes/s · "
+                     f"{self.throttles} throttles · limit now {self.rate():,.0f}/s")
+        return "\n".join(lines)
+
+
+def _clock_text(seconds):
+    return f"{int(seconds // 60)}:{int(seconds % 60):02d}"
@@ -0,0 +1,222 @@
+"""Related-article suggestions computed from the education corpus.
+
+Per language, every published article becomes a sparse TF-IDF vector over
+its title, key points and body (seeding.search tokens). Cosine similarities
+are computed a block of rows against a chunk of columns at a time, so memory
+stays flat however large the corpus, then weighted by shared tag and mode
+overlap; each row keeps its top-k article IDs (np.argpartition, no full
+sort), ties broken by ID so results are stable. Results are cached in
+build/cache/related.json under a hash of the corpus, so an unchanged corpus
+skips the computation entirely.
+
+    python3 -m seeding.related          # print each article's related IDs
+"""
+
+import json
+import os
+from collections import Counter, namedtuple
+
+from seeding.content import CACHE_DIR
+from seeding.schema import MODES
+from seeding.search import tokenize
+from seeding.sync import content_hash
+
+ALGORITHM_VERSION = 2
+CACHE_PATH = os.path.join(CACHE_DIR, "related.json")
+DEFAULT_K = 3
+MAX_DENSE_CELLS = 1 << 20   # float32 cells per densified block and per score block
+FIELD_REPEAT = {"title": 3, "keyPoints": 2, "body": 1}
+TAG_BONUS = 0.5           # ×1.5 for the same tag
+MODE_FLOOR = 0.5          # no shared mode still keeps half the score
+
+Csr = namedtuple("Csr", "indptr indices data width")
+
+
+def _terms(article):
+    counts = Counter()
+    for field, repeat in FIELD_REPEAT.items():
+        text = " ".join(article[field]) if field == "keyPoints" else article[field]
+        for token in tokenize(text, article["language"]):
+            counts[token] += repeat
+    return counts
+
+
+def tfidf_matrix(documents):
+    """Row-normalised float32 TF-IDF for a list of Counters, as CSR.
+
+    Every term counts toward its row's norm, but only terms shared by two or
+    more documents get a column; the rest cannot add to any similarity.
+    """
+    import numpy as np
+
+    n = len(documents)
+    vocabulary = {}
+    terms = np.array([vocabulary.setdefault(term, len(vocabulary))
+                      for counts in documents for term in counts], dtype=np.int64)
+    counts = np.fromiter((count for counts in documents for count in counts.values()),
+                         dtype=np.float64, count=len(terms))
+    rows = np.repeat(np.arange(n), [len(counts) for counts in documents])
+    df = np.bincount(terms, minlength=len(vocabulary))
+    weights = (1 + np.log(counts)) * (np.log((1 + n) / (1 + df[terms])) + 1)
+    norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=n))
+
+    shared = df[terms] > 1
+    column = np.cumsum(df > 1) - 1
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows[shared], minlength=n), out=indptr[1:])
+    data = (weights / norms[rows])[shared].astype(np.float32)
+    return Csr(indptr, column[terms[shared]], data, int((df > 1).sum()))
+
+
+def _dense(matrix, start, stop):
+    """Rows start:stop of a CSR matrix as a dense array"""
+    import numpy as np
+
+    lo, hi = matrix.indptr[start], matrix.indptr[stop]
+    rows = np.zeros((stop - start, matrix.width), dtype=np.float32)
+    rows[np.repeat(np.arange(stop - start), np.diff(matrix.indptr[start:stop + 1])),
+         matrix.indices[lo:hi]] = matrix.data[lo:hi]
+    return rows
+
+
+def _top_k(scores, k, offset):
+    """(values, columns) of each row's top k, ties going to the lowest column"""
+    import numpy as np
+
+    k = min(k, scores.shape[1])
+    columns = np.argpartition(scores, -k, axis=1)[:, -k:]
+    values = np.take_along_axis(scores, columns, axis=1)
+    # argpartition breaks ties at the k-th value arbitrarily; redo those rows
+    # in full. Ties at zero or below never make the final list, so skip them.
+    kth = values.min(axis=1, keepdims=True)
+    tied = (scores == kth).sum(axis=1) > (values == kth).sum(axis=1)
+    for row in np.nonzero(tied & (kth[:, 0] > 0))[0]:
+        columns[row] = np.lexsort((np.arange(scores.shape[1]), -scores[row]))[:k]
+        values[row] = scores[row, columns[row]]
+    return values, columns + offset
+
+
+def _mode_matrix(articles):
+    import numpy as np
+
+    modes = np.zeros((len(articles), len(MODES)), dtype=np.float32)
+    for row, article in enumerate(articles):
+        for i, mode in enumerate(MODES):
+            if mode in article["mode"] or "all" in article["mode"]:
+                modes[row, i] = 1
+    return modes
+
+
+def top_related(ids, articles, k=DEFAULT_K):
+    """{id: top-k related IDs} for articles of one language"""
+    import numpy as np
+
+    n = len(ids)
+    if n < 2:
+        return {doc_id: [] for doc_id in ids}
+    # Rows in ID order, so the lowest column index is also the lowest ID.
+    order = sorted(range(n), key=ids.__getitem__)
+    ids = [ids[i] for i in order]
+    articles = [articles[i] for i in order]
+    matrix = tfidf_matrix([_terms(article) for article in articles])
+    tags = np.array([article["tag"] for article in articles])
+    modes = _mode_matrix(articles)
+    mode_counts = modes.sum(axis=1)
+    k = min(k, n - 1)
+    width = max(matrix.width, 1)
+    block = max(1, min(n, MAX_DENSE_CELLS // width))
+    chunk = max(1, min(n, MAX_DENSE_CELLS // block, MAX_DENSE_CELLS // width))
+
+    related = {}
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        rows = _dense(matrix, start, stop)
+        values, columns = [], []
+        for first in range(0, n, chunk):
+            last = min(first + chunk, n)
+            scores = rows @ _dense(matrix, first, last).T
+            scores *= 1 + TAG_BONUS * (tags[start:stop, None] == tags[None, first:last])
+            shared = modes[start:stop] @ modes[first:last].T
+            union = mode_counts[start:stop, None] + mode_counts[None, first:last] - shared
+            jaccard = np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+            scores *= MODE_FLOOR + (1 - MODE_FLOOR) * jaccard
+            diagonal = np.arange(max(start, first), min(stop, last))
+            scores[diagonal - start, diagonal - first] = -np.inf
+            chunk_values, chunk_columns = _top_k(scores, k, first)
+            values.append(chunk_values)
+            columns.append(chunk_columns)
+
+        values = np.concatenate(values, axis=1)
+        columns = np.concatenate(columns, axis=1)
+        # Highest score first, then lowest ID.
+        best = np.lexsort((columns, -values), axis=1)[:, :k]
+        for offset, (row_values, row_columns) in enumerate(zip(np.take_along_axis(values, best, axis=1),
+                                                               np.take_along_axis(columns, best, axis=1))):
+            related[ids[start + offset]] = [ids[c] for c, value in zip(row_columns, row_values) if value > 0]
+    return related
+
+
+def corpus_hash(by_id, k):
+    return content_hash({
+        "algorithm": ALGORITHM_VERSION, "k": k,
+        "articles": {doc_id: [a["language"], a["tag"], a["mode"], a["title"], a["keyPoints"], a["body"]]
+                     for doc_id, a in sorted(by_id.items()) if a["isPublished"]},
+    })
+
+
+def related_ids(by_id, k=DEFAULT_K, cache_path=CACHE_PATH):
+    """{article ID: related IDs} for every published article, cached by corpus hash"""
+    digest = corpus_hash(by_id, k)
+    if cache_path:
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("corpus") == digest:
+                return cached["related"]
+        except (FileNotFoundError, ValueError):
+            pass
+
+    related = {}
+    published = {doc_id: a for doc_id, a in by_id.items() if a["isPublished"]}
+    for language in sorted({a["language"] for a in published.values()}):
+        ids = sorted(doc_id for doc_id, a in published.items() if a["language"] == language)
+        related.update(top_related(ids, [published[doc_id] for doc_id in ids], k))
+
+    if cache_path:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"corpus": digest, "related": related}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    return related
+
+
+def with_related(by_id, k=DEFAULT_K, cache_path=CACHE_PATH):
+    """Copies of the articles with relatedIds filled up to k.
+
+    Authored relatedIds stay first; computed ones fill the remaining slots.
+    """
+    computed = related_ids(by_id, k, cache_path)
+    result = {}
+    for doc_id, article in by_id.items():
+        authored = list(article.get("relatedIds") or [])
+        extra = [other for other in computed.get(doc_id, []) if other not in authored]
+        result[doc_id] = {**article, "relatedIds": authored + extra[:max(0, k - len(authored))]}
+    return result
+
+
+def main():
+    import time
+    from seeding.content import article_id, load_bundle
+
+    by_id = {article_id(a): a for a in load_bundle()["data"]["education_articles"]}
+    started = time.perf_counter()
+    related = related_ids(by_id, cache_path=None)
+    elapsed = (time.perf_counter() - started) * 1000
+    for doc_id, others in sorted(related.items()):
+        print(f"  {doc_id}\n      → {', '.join(others) or '—'}")
+    print(f"✓ Related articles for {len(related)} articles in {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Immutable, versioned content releases behind a single pointer document.
+
+A release is a complete snapshot of every seeded document, written under
+releases/{version}/<live path> (journeys/period → releases/{v}/journeys/period).
+The version is a hash of the snapshot's content, so a version never changes
+once written and clients may cache its documents forever.
+
+Publishing writes the snapshot, reads every document back to verify it, marks
+releases/{version} verified and only then flips config/content_release:
+
+    {"version": v, "previous": old v, "history": [… old v, v],
+     "documents": n, "publishedAt": …}
+
+Clients listen to that one pointer and re-fetch only when it changes.
+`history` lists the live releases in publish order, so a rollback drops the
+live one and repeated rollbacks keep moving back. Rolling back is a single
+pointer write:
+
+    python3 seed.py --release                     # seed, verify, publish
+    python3 -m seeding.releases list
+    python3 -m seeding.releases rollback          # back to the previous release
+    python3 -m seeding.releases rollback <version>
+"""
+
+import argparse
+import sys
+
+from seeding.bulk_writer import DEFAULT_WORKERS, open_writer
+from seeding.client import CredentialsError, get_db, server_timestamp, use_emulator
+from seeding.sync import content_hash
+
+COLLECTION = "releases"
+POINTER = "config/content_release"
+VERIFIED = "verified"
+READ_CHUNK = 300            # documents per get_all() while verifying
+HISTORY_LIMIT = 50          # releases kept in the pointer's history
+
+
+def release_version(documents):
+    """Content hash of a whole snapshot ({path: data}), ignoring timestamps"""
+    return content_hash({path: content_hash(data) for path, data in documents.items()})
+
+
+def release_path(version, path):
+    return f"{COLLECTION}/{version}/{path}"
+
+
+def read_pointer(db):
+    return db.document(POINTER).get().to_dict() or {}
+
+
+def read_release(db, version):
+    return db.document(f"{COLLECTION}/{version}").get().to_dict()
+
+
+def verify_release(db, version, documents):
+    """Paths whose released copy is missing or differs from `documents`"""
+    paths = sorted(documents)
+    bad = []
+    for start in range(0, len(paths), READ_CHUNK):
+        chunk = paths[start:start + READ_CHUNK]
+        found = {}
+        for snapshot in db.get_all([db.document(release_path(version, path)) for path in chunk]):
+            if snapshot.exists:
+                found[snapshot.reference.path] = snapshot.to_dict()
+        for path in chunk:
+            released = found.get(release_path(version, path))
+            if released is None or content_hash(released) != content_hash(documents[path]):
+                bad.append(path)
+    return bad
+
+
+def release_history(pointer):
+    """Live releases from the pointer, oldest first, ending with the live one"""
+    if "history" in pointer:
+        return list(pointer["history"])
+    return [version for version in (pointer.get("previous"), pointer.get("version")) if version]
+
+
+def _flip(db, version, documents, history):
+    history = history[-HISTORY_LIMIT:]
+    db.document(POINTER).set({
+        "version": version,
+        "previous": history[-2] if len(history) > 1 else None,
+        "history": history,
+        "documents": documents,
+        "publishedAt": server_timestamp(),
+    })
+
+
+def publish(db, documents, workers=DEFAULT_WORKERS):
+    """Write, verify and point clients at a release of `documents`.
+
+    Returns the version. Raises RuntimeError, leaving the pointer untouched,
+    if the written snapshot does not read back intact.
+    """
+    version = release_version(documents)
+    current = read_pointer(db)
+    if current.get("version") == version:
+        print(f"  = release {version} is already live")
+        return version
+
+    existing = read_release(db, version)
+    if existing and existing.get("status") == VERIFIED:
+        print(f"  = release {version} already written and verified")
+    else:
+        writer = open_writer(db, workers)
+        for path, data in documents.items():
+            writer.set(release_path(version, path), data)
+        writer.close()
+        print(f"  ✓ Wrote release {version}: {writer.summary()}")
+
+        bad = verify_release(db, version, documents)
+        if bad:
+            shown = ", ".join(bad[:5]) + (" …" if len(bad) > 5 else "")
+            raise RuntimeError(f"Release {version} failed verification: "
+                               f"{len(bad)} of {len(documents)} documents differ ({shown})")
+        db.document(f"{COLLECTION}/{version}").set({
+            "version": version,
+            "status": VERIFIED,
+            "documents": len(documents),
+            "collections": sorted({path.split("/", 1)[0] for path in documents}),
+            "createdAt": server_timestamp(),
+        })
+        print(f"  ✓ Verified {len(documents):,} documents")
+
+    history = [v for v in release_history(current) if v != version] + [version]
+    _flip(db, version, len(documents), history)
+    print(f"  ✓ {POINTER} → {version} (was {current.get('version') or 'none'})")
+    return version
+
+
+def rollback(db, version=None):
+    """Point clients at `version`, or the release before the live one; returns it.
+
+    Rolling back to a release in the history drops everything published
+    after it, so the next rollback goes further back rather than forward.
+    """
+    history = release_history(read_pointer(db))
+    if version is None:
+        if len(history) < 2:
+            raise ValueError("No previous release to roll back to")
+        version = history[-2]
+    release = read_release(db, version)
+    if not release or release.get("status") != VERIFIED:
+        raise ValueError(f"Release {version} does not exist or was never verified")
+    if version in history:
+        history = history[:history.index(version) + 1]
+    else:
+        history.append(version)
+    _flip(db, version, release["documents"], history)
+    return version
+
+
+def list_releases(db):
+    """[(version, data)] for every release, oldest first"""
+    releases = [(snapshot.id, snapshot.to_dict()) for snapshot in db.collection(COLLECTION).stream()]
+    return sorted(releases, key=lambda item: (str(item[1].get("createdAt")), item[0]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List or roll back content releases")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="every release, marking the live one")
+    rollback_cmd = commands.add_parser("rollback", help="point clients at an earlier release")
+    rollback_cmd.add_argument("version", nargs="?", help="default: the release before the live one")
+    parser.add_argument("--emulator", metavar="HOST:PORT", help="use a Firestore emulator")
+    args = parser.parse_args()
+
+    if args.emulator:
+        use_emulator(args.emulator)
+    try:
+        db = get_db()
+        if args.command == "list":
+            live = read_pointer(db).get("version")
+            for version, data in list_releases(db):
+                marker = "→" if version == live else " "
+                print(f"  {marker} {version}  {data.get('status', '?'):<9} "
+                      f"{data.get('documents', 0):>6,} docs  {data.get('createdAt')}")
+        else:
+            target = rollback(db, args.version)
+            print(f"✓ {POINTER} → {target}")
+    except (CredentialsError, ValueError) as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Markdown article bodies → compact, versioned render trees.
+
+The markup is the subset article_detail_screen.dart renders, one block per
+line:
+
+    ## Heading          {"t": "h2", "c": [...]}
+    ### Sub-heading     {"t": "h3", "c": [...]}
+    > Quote             {"t": "quote", "c": [...]}
+    1. Numbered item    {"t": "li", "n": 1, "c": [...]}
+    - Bullet item       {"t": "li", "c": [...]}
+    (blank line)        {"t": "gap"}
+    anything else       {"t": "p", "c": [...]}
+
+Inline content is a list of spans, {"s": "text"} or {"s": "text", "b": true}
+for **bold**. Emoji are plain text. The tree is
+
+    {"v": RENDER_VERSION, "hash": <body hash>, "blocks": [...]}
+
+Firestore forbids arrays directly inside arrays, so every node is a map.
+Markup the app cannot render (unknown heading levels, unclosed **, empty
+headings or items) makes render_tree() raise MarkupError, so the compiler
+validates a body by building its tree.
+"""
+
+import hashlib
+import re
+
+RENDER_VERSION = 1
+
+_HEADING = re.compile(r"(#+)(\s+|$)")
+_NUMBERED = re.compile(r"(\d+)\.\s+")
+_BULLET = re.compile(r"[-*]\s+")
+
+
+class MarkupError(ValueError):
+    """Raised for article markup the render tree cannot represent"""
+
+
+def body_hash(body):
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()[:16]
+
+
+def _spans(text, line_no, errors):
+    parts = text.split("**")
+    if len(parts) % 2 == 0:
+        errors.append(f"line {line_no}: unclosed '**'")
+        return [{"s": text}]
+    spans = []
+    for i, part in enumerate(parts):
+        bold = i % 2 == 1
+        if bold and not part.strip():
+            errors.append(f"line {line_no}: empty '****' bold span")
+        elif part:
+            spans.append({"s": part, "b": True} if bold else {"s": part})
+    return spans
+
+
+def _block(line, line_no, errors):
+    if not line.strip():
+        return {"t": "gap"}
+
+    heading = _HEADING.match(line)
+    if heading:
+        level = len(heading.group(1))
+        text = line[heading.end():].strip()
+        if level not in (2, 3):
+            errors.append(f"line {line_no}: only '##' and '###' headings are supported")
+        elif not text:
+            errors.append(f"line {line_no}: empty heading")
+        return {"t": f"h{level}", "c": _spans(text, line_no, errors)}
+
+    number = _NUMBERED.match(line)
+    bullet = _BULLET.match(line)
+    if line.startswith(">"):
+        block, text = {"t": "quote"}, line[1:].strip()
+    elif number:
+        block, text = {"t": "li", "n": int(number.group(1))}, line[number.end():].strip()
+    elif bullet:
+        block, text = {"t": "li"}, line[bullet.end():].strip()
+    else:
+        return {"t": "p", "c": _spans(line.rstrip(), line_no, errors)}
+    if not text:
+        errors.append(f"line {line_no}: empty {'quote' if block['t'] == 'quote' else 'list item'}")
+    block["c"] = _spans(text, line_no, errors)
+    return block
+
+
+def _parse(body):
+    errors = []
+    blocks = [_block(line, n, errors) for n, line in enumerate(body.split("\n"), 1)]
+    return blocks, errors
+
+
+def render_tree(body):
+    """The render tree for `body`; raises MarkupError on malformed markup"""
+    blocks, errors = _parse(body)
+    if errors:
+        raise MarkupError("; ".join(errors))
+    return {"v": RENDER_VERSION, "hash": body_hash(body), "blocks": blocks}
+
+
+def reusable_trees(trees):
+    """{body hash: tree} for previously built trees still at RENDER_VERSION"""
+    return {tree.get("hash"): tree for tree in trees
+            if isinstance(tree, dict) and tree.get("v") == RENDER_VERSION}
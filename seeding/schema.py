@@ -0,0 +1,431 @@
+"""Schema validation for everything the seeders write.
+
+Schemas are built once at import from small combinators into plain closures,
+so validating the whole content bundle is a single pass with no reflection.
+Each validator has the signature check(value, path, errors) and appends
+"path: message" strings to `errors` instead of raising, so one run reports
+every problem at once.
+
+    python3 -m seeding.schema                       # content bundle + test data
+    python3 -m seeding.schema firebase_test_data.json
+"""
+
+import json
+import re
+import sys
+from datetime import date, datetime
+
+MODES = ("period", "preg", "ovul")
+ARTICLE_MODES = MODES + ("all",)
+
+
+class ValidationError(ValueError):
+    """Raised with every schema violation found in one validation pass"""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        shown = "\n  ".join(self.errors[:20])
+        more = f"\n  … and {len(self.errors) - 20} more" if len(self.errors) > 20 else ""
+        super().__init__(f"{len(self.errors)} schema error(s):\n  {shown}{more}")
+
+
+# ═══════════════════════════════════════════════════════════════
+#  COMBINATORS
+# ═══════════════════════════════════════════════════════════════
+def string(nonempty=True, pattern=None):
+    regex = re.compile(pattern) if pattern else None
+
+    def check(value, path, errors):
+        if not isinstance(value, str):
+            errors.append(f"{path}: expected string, got {type(value).__name__}")
+        elif nonempty and not value.strip():
+            errors.append(f"{path}: must not be empty")
+        elif regex and not regex.fullmatch(value):
+            errors.append(f"{path}: {value!r} does not match {pattern}")
+    return check
+
+
+def number(minimum=None, maximum=None, integer=False):
+    kinds = (int,) if integer else (int, float)
+    label = "integer" if integer else "number"
+
+    def check(value, path, errors):
+        if isinstance(value, bool) or not isinstance(value, kinds):
+            errors.append(f"{path}: expected {label}, got {type(value).__name__}")
+        elif minimum is not None and value < minimum:
+            errors.append(f"{path}: {value} is below {minimum}")
+        elif maximum is not None and value > maximum:
+            errors.append(f"{path}: {value} is above {maximum}")
+    return check
+
+
+def integer(minimum=None, maximum=None):
+    return number(minimum, maximum, integer=True)
+
+
+def boolean():
+    def check(value, path, errors):
+        if not isinstance(value, bool):
+            errors.append(f"{path}: expected boolean, got {type(value).__name__}")
+    return check
+
+
+def one_of(*choices):
+    allowed = frozenset(choices)
+
+    def check(value, path, errors):
+        if value not in allowed:
+            errors.append(f"{path}: {value!r} is not one of {', '.join(map(str, choices))}")
+    return check
+
+
+def timestamp():
+    """A datetime, or an ISO 8601 string as used in the JSON test data"""
+    def check(value, path, errors):
+        if isinstance(value, (datetime, date)):
+            return
+        if isinstance(value, str):
+            try:
+                datetime.fromisoformat(value.replace("Z", "+00:00"))
+                return
+            except ValueError:
+                pass
+        errors.append(f"{path}: expected timestamp, got {value!r}")
+    return check
+
+
+def list_of(item, min_items=0, unique_by=None):
+    def check(value, path, errors):
+        if not isinstance(value, list):
+            errors.append(f"{path}: expected list, got {type(value).__name__}")
+            return
+        if len(value) < min_items:
+            errors.append(f"{path}: needs at least {min_items} item(s)")
+        seen = set()
+        for i, element in enumerate(value):
+            item(element, f"{path}[{i}]", errors)
+            if unique_by and isinstance(element, dict) and unique_by in element:
+                key = element[unique_by]
+                if key in seen:
+                    errors.append(f"{path}[{i}].{unique_by}: duplicate {key!r}")
+                seen.add(key)
+    return check
+
+
+def map_of(value_check, keys=None):
+    """A mapping with arbitrary (or `keys`-restricted) keys"""
+    key_check = one_of(*keys) if keys else string()
+
+    def check(value, path, errors):
+        if not isinstance(value, dict):
+            errors.append(f"{path}: expected mapping, got {type(value).__name__}")
+            return
+        for key, element in value.items():
+            key_check(key, f"{path}.{key}", errors)
+            value_check(element, f"{path}.{key}", errors)
+    return check
+
+
+def record(required, optional=None, rules=(), extra=False):
+    """A mapping with known fields; `rules` run after the field checks"""
+    optional = optional or {}
+    known = set(required) | set(optional)
+    required_items = tuple(required.items())
+
+    def check(value, path, errors):
+        if not isinstance(value, dict):
+            errors.append(f"{path}: expected mapping, got {type(value).__name__}")
+            return
+        for name, field_check in required_items:
+            if name not in value:
+                errors.append(f"{path}: missing required field '{name}'")
+            else:
+                field_check(value[name], f"{path}.{name}", errors)
+        for name, field in value.items():
+            if name in optional:
+                optional[name](field, f"{path}.{name}", errors)
+            elif name not in known and not extra:
+                errors.append(f"{path}: unexpected field '{name}'")
+        for rule in rules:
+            rule(value, path, errors)
+    return check
+
+
+# ═══════════════════════════════════════════════════════════════
+#  CONTENT SCHEMAS
+# ═══════════════════════════════════════════════════════════════
+STEP_TYPES = ("date", "due-date", "stepper", "chips-single", "chips-multi", "chips-big-single")
+SINGLE_CHOICE_TYPES = ("chips-single", "chips-big-single")
+HEX_COLOR = r"#[0-9A-Fa-f]{6}"
+
+
+def _step_rules(step, path, errors):
+    kind = step.get("type")
+    if kind == "stepper":
+        missing = [f for f in ("min", "max", "def", "unit") if f not in step]
+        if missing:
+            errors.append(f"{path}: stepper step needs {', '.join(missing)}")
+        elif all(isinstance(step[f], int) for f in ("min", "max", "def")):
+            if not step["min"] <= step["def"] <= step["max"]:
+                errors.append(f"{path}: stepper needs min <= def <= max")
+    elif kind and kind.startswith("chips"):
+        if "opts" not in step:
+            errors.append(f"{path}: {kind} step needs opts")
+        elif kind in SINGLE_CHOICE_TYPES:
+            for i, opt in enumerate(step["opts"] or ()):
+                if isinstance(opt, dict) and "v" not in opt:
+                    errors.append(f"{path}.opts[{i}]: single-choice option needs a value 'v'")
+    for field in ("min", "max", "def", "unit"):
+        if field in step and kind != "stepper":
+            errors.append(f"{path}: '{field}' only applies to stepper steps")
+
+
+JOURNEY_OPTION = record(
+    {"e": string(), "l": string()},
+    optional={"v": string(), "special": boolean()},
+)
+
+JOURNEY_STEP = record(
+    {"icon": string(), "q": string(), "sub": string(), "type": one_of(*STEP_TYPES), "key": string()},
+    optional={
+        "required": boolean(), "skip": string(), "warn": string(),
+        "min": integer(), "max": integer(), "def": integer(), "unit": string(),
+        "opts": list_of(JOURNEY_OPTION, min_items=1),
+    },
+    rules=[_step_rules],
+)
+
+JOURNEYS = map_of(list_of(JOURNEY_STEP, min_items=1, unique_by="key"), keys=MODES)
+
+SYMPTOMS = list_of(record({"icon": string(), "label": string(), "key": string()}),
+                   min_items=1, unique_by="key")
+INSIGHT_TIPS = list_of(record({"text": string()}), min_items=1)
+
+CONFIG = record({"symptoms": SYMPTOMS, "insight_tips": INSIGHT_TIPS})
+
+RITUAL = record({
+    "emoji": string(), "title": string(), "subtitle": string(),
+    "duration": string(), "order": integer(minimum=1),
+})
+
+_PHASE_FIELDS = {
+    "badge": string(), "emoji": string(), "label": string(), "order": integer(minimum=1),
+    "hero_e": string(), "hero_t": string(), "hero_d": string(),
+    "rituals": list_of(RITUAL, min_items=1, unique_by="order"),
+}
+PHASE = record(_PHASE_FIELDS)
+
+
+def _unique_phase_order(phases, path, errors):
+    seen = {}
+    for name, phase in phases.items():
+        order = phase.get("order") if isinstance(phase, dict) else None
+        if order in seen:
+            errors.append(f"{path}.{name}.order: {order} already used by '{seen[order]}'")
+        seen[order] = name
+
+
+def _phases(value, path, errors):
+    map_of(PHASE)(value, path, errors)
+    if isinstance(value, dict):
+        _unique_phase_order(value, path, errors)
+
+
+SELF_CARE = map_of(_phases, keys=MODES)
+
+_CARD_FIELDS = {
+    "icon": string(), "tag": string(), "tagColor": string(pattern=HEX_COLOR),
+    "title": string(), "meta": string(), "readTime": string(pattern=r"\d+ min read"),
+    "isPremium": boolean(), "order": integer(minimum=0),
+}
+
+# seeding.render_tree output
+RENDER_TREE = record({
+    "v": integer(minimum=1), "hash": string(),
+    "blocks": list_of(record(
+        {"t": one_of("h2", "h3", "p", "quote", "li", "gap")},
+        optional={"n": integer(minimum=0),
+                  "c": list_of(record({"s": string()}, optional={"b": boolean()}))},
+    )),
+})
+
+ARTICLE = record(
+    {
+        **_CARD_FIELDS,
+        "mode": list_of(one_of(*ARTICLE_MODES), min_items=1), "isPublished": boolean(),
+        "language": string(pattern=r"[a-z]{2}(-[A-Z]{2})?"),
+        "keyPoints": list_of(string(), min_items=1),
+        "relatedIds": list_of(string()),
+        "body": string(),
+    },
+    optional={"bodyTree": RENDER_TREE, "createdAt": timestamp(), "updatedAt": timestamp(),
+              "contentHash": string()},
+)
+
+EDUCATION_INDEX = record(
+    {
+        "language": string(pattern=r"[a-z]{2}(-[A-Z]{2})?"), "mode": one_of(*MODES),
+        "articles": list_of(record({**_CARD_FIELDS, "id": string()}), unique_by="id"),
+    },
+    optional={"createdAt": timestamp(), "updatedAt": timestamp(), "contentHash": string()},
+)
+
+
+# ═══════════════════════════════════════════════════════════════
+#  USER SCHEMAS  (FIREBASE_DATA_GUIDE.md)
+# ═══════════════════════════════════════════════════════════════
+USER = record(
+    {
+        "displayName": string(), "ageGroup": one_of("teen", "adult", "mature"),
+        "region": one_of("asia", "africa", "latam", "global"),
+        "language": string(), "createdAt": timestamp(), "lifeStage": one_of(*MODES),
+        "isPremium": boolean(),
+    },
+    optional={"premiumSince": timestamp()},
+    extra=True,  # the app adds security/settings fields at runtime
+)
+
+PERIOD_JOURNEY = record(
+    {"cycleLen": integer(18, 45), "periodLen": integer(1, 10)},
+    optional={"lastPeriod": timestamp(), "flow": one_of("light", "medium", "heavy", "varies"),
+              "symptoms": list_of(string())},
+    extra=True,
+)
+
+
+def _cycle_dates(cycle, path, errors):
+    start, end = cycle.get("startDate"), cycle.get("endDate")
+    if isinstance(start, str) and isinstance(end, str) and end < start:
+        errors.append(f"{path}: endDate is before startDate")
+    elif isinstance(start, datetime) and isinstance(end, datetime) and end < start:
+        errors.append(f"{path}: endDate is before startDate")
+
+
+CYCLE = record(
+    {"startDate": timestamp(), "endDate": timestamp(), "length": integer(1, 120)},
+    optional={"notes": string(nonempty=False)},
+    rules=[_cycle_dates],
+)
+
+LOG_ENTRY = record(
+    {"date": timestamp(), "flow": one_of("none", "light", "medium", "heavy")},
+    optional={
+        "mood": string(), "symptoms": list_of(string()), "painLevel": integer(0, 5),
+        "waterGlasses": integer(0, 30), "sleepHours": number(0, 24), "note": string(nonempty=False),
+    },
+    extra=True,
+)
+
+SELF_CARE_VIEW = record({
+    "mode": one_of(*MODES), "version": string(),
+    "phases": list_of(record({"key": string(), **_PHASE_FIELDS}), min_items=1, unique_by="key"),
+})
+
+APP_CONFIG = record({"maxFailedAttempts": integer(1), "lockoutDurationMinutes": integer(1)}, extra=True)
+
+# Document path pattern → schema, for validating individual Firestore docs.
+DOCUMENT_SCHEMAS = [
+    (re.compile(r"users/[^/]+"), USER),
+    (re.compile(r"users/[^/]+/journey/period"), PERIOD_JOURNEY),
+    (re.compile(r"users/[^/]+/cycles/[^/]+"), CYCLE),
+    (re.compile(r"users/[^/]+/logs/period/entries/\d{4}-\d{2}-\d{2}"), LOG_ENTRY),
+    (re.compile(r"config/appConfig"), APP_CONFIG),
+    (re.compile(r"config/symptoms"), record({"items": SYMPTOMS})),
+    (re.compile(r"config/insight_tips"), record({"tips": INSIGHT_TIPS})),
+    (re.compile(r"config/data"), record({"symptoms": SYMPTOMS})),
+    (re.compile(r"config/self_care/views/[^/]+"), SELF_CARE_VIEW),
+    (re.compile(r"education_articles/[^/]+"), ARTICLE),
+    (re.compile(r"education_index/[^/]+"), EDUCATION_INDEX),
+]
+
+
+# ═══════════════════════════════════════════════════════════════
+#  ENTRY POINTS
+# ═══════════════════════════════════════════════════════════════
+def content_errors(data, article_id):
+    """Every schema error in a content bundle's `data` section"""
+    errors = []
+    JOURNEYS(data.get("journeys"), "journeys", errors)
+    CONFIG(data.get("config"), "config", errors)
+    SELF_CARE(data.get("self_care"), "self_care", errors)
+
+    articles = data.get("education_articles") or []
+    ids = {}
+    for i, article in enumerate(articles):
+        path = f"education_articles[{i}]"
+        ARTICLE(article, path, errors)
+        if isinstance(article, dict) and "title" in article and "language" in article:
+            doc_id = article_id(article)
+            if doc_id in ids:
+                errors.append(f"{path}: ID '{doc_id}' already used by education_articles[{ids[doc_id]}]")
+            ids[doc_id] = i
+
+    # Cross-document references, resolved once every ID is known.
+    for i, article in enumerate(articles):
+        for related in (article.get("relatedIds") or []) if isinstance(article, dict) else ():
+            if related not in ids:
+                errors.append(f"education_articles[{i}].relatedIds: unknown article '{related}'")
+    return errors
+
+
+def document_errors(path, data):
+    """Errors for one Firestore document, chosen by its path"""
+    errors = []
+    for pattern, schema in DOCUMENT_SCHEMAS:
+        if pattern.fullmatch(path):
+            schema(data, path, errors)
+            break
+    return errors
+
+
+def flatten_tree(tree, prefix=""):
+    """Yield (path, fields) for a nested export like firebase_test_data.json.
+
+    Map values whose keys are known subcollections become child documents.
+    """
+    subcollections = {"journey", "cycles", "logs", "entries"}
+    for doc_id, doc in tree.items():
+        path = f"{prefix}{doc_id}"
+        fields = {k: v for k, v in doc.items() if k not in subcollections}
+        yield path, fields
+        for name in subcollections & doc.keys():
+            yield from flatten_tree(doc[name], f"{path}/{name}/")
+
+
+def test_data_errors(tree):
+    errors = []
+    for collection, docs in tree.items():
+        for path, fields in flatten_tree(docs, f"{collection}/"):
+            errors.extend(document_errors(path, fields))
+    return errors
+
+
+def validate_content(data, article_id):
+    errors = content_errors(data, article_id)
+    if errors:
+        raise ValidationError(errors)
+
+
+def main():
+    import time
+    from seeding.content import ContentError, article_id, load_sources
+
+    started = time.perf_counter()
+    errors = []
+    try:
+        errors.extend(content_errors(load_sources(), article_id))
+    except ContentError as e:
+        errors.append(str(e))
+    for path in sys.argv[1:] or ["firebase_test_data.json"]:
+        with open(path, encoding="utf-8") as f:
+            errors.extend(f"{path}: {e}" for e in test_data_errors(json.load(f)))
+
+    elapsed = (time.perf_counter() - started) * 1000
+    if errors:
+        print(ValidationError(errors))
+        sys.exit(1)
+    print(f"✓ All documents valid ({elapsed:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
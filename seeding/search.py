@@ -0,0 +1,226 @@
+"""Precomputed full-text search index for education articles.
+
+Each language gets a manifest doc search_index/{language} and one or more
+shard docs search_index/{language}_{n}:
+
+    manifest: {"format": 1, "language", "version", "docs": [article IDs],
+               "fields": {field: weight}, "shards": [first term of each shard]}
+    shard:    {"language", "postings": "term\\tdoc:weight:pos,pos;doc:…\\n…"}
+
+Postings are one line per term, sorted, with `doc` an index into the
+manifest's docs list, `weight` the summed field weight of every occurrence
+and `pos` token positions within the article (title, meta, key points, then
+body). Shards split the sorted terms so no doc nears the 1 MiB limit; a
+client finds a term's shard by binary search over `shards`. Postings live in
+one string so Firestore indexes a single value per shard.
+
+Tokenizing is incremental: postings are cached per article in
+build/cache/search_postings.json, keyed by a hash of the indexed fields.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import unicodedata
+
+from seeding.content import CACHE_DIR
+from seeding.sync import content_hash
+
+INDEX_FORMAT = 1
+TOKENIZER_VERSION = 1
+COLLECTION = "search_index"
+CACHE_PATH = os.path.join(CACHE_DIR, "search_postings.json")
+MAX_SHARD_BYTES = 512 * 1024
+
+FIELD_WEIGHTS = {"title": 4, "meta": 2, "keyPoints": 2, "body": 1}
+
+STOPWORDS = {
+    "en": frozenset("""
+        a an and are as at be but by can do does for from has have how if in
+        into is it its of on or so that the their them then there these this
+        to was we what when which who why will with you your
+    """.split()),
+}
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text, language="en"):
+    """Lowercased word tokens, without stopwords; markdown and emoji drop out"""
+    stopwords = STOPWORDS.get(language.split("-")[0], frozenset())
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return [token for token in _TOKEN.findall(text) if token not in stopwords]
+
+
+def indexed_text(article):
+    """(field, text) pairs in position order"""
+    yield "title", article["title"]
+    yield "meta", article["meta"]
+    for point in article["keyPoints"]:
+        yield "keyPoints", point
+    yield "body", article["body"]
+
+
+def article_postings(article):
+    """{term: [weight, positions]} for one article"""
+    postings = {}
+    position = 0
+    for field, text in indexed_text(article):
+        for token in tokenize(text, article["language"]):
+            entry = postings.setdefault(token, [0, []])
+            entry[0] += FIELD_WEIGHTS[field]
+            entry[1].append(position)
+            position += 1
+        position += 1   # phrases never span two fields
+    return postings
+
+
+def _cache_key(article):
+    fields = {field: article[field] for field in ("language", "title", "meta", "keyPoints", "body")}
+    return content_hash({"tokenizer": TOKENIZER_VERSION, **fields})
+
+
+def _load_cache(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    return cache.get("articles", {}) if cache.get("tokenizer") == TOKENIZER_VERSION else {}
+
+
+def _save_cache(path, articles):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"tokenizer": TOKENIZER_VERSION, "articles": articles}, f,
+                  ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+# ═══════════════════════════════════════════════════════════════
+#  BUILD
+# ═══════════════════════════════════════════════════════════════
+def _posting_line(term, entries):
+    return term + "\t" + ";".join(f"{doc}:{weight}:{','.join(map(str, positions))}"
+                                  for doc, weight, positions in entries)
+
+
+def _language_docs(language, doc_ids, postings):
+    terms = {}
+    for doc, doc_id in enumerate(doc_ids):
+        for term, (weight, positions) in postings[doc_id].items():
+            terms.setdefault(term, []).append((doc, weight, positions))
+
+    shards, current, size = [], [], 0
+    for term in sorted(terms):
+        line = _posting_line(term, terms[term])
+        if current and size + len(line.encode("utf-8")) + 1 > MAX_SHARD_BYTES:
+            shards.append(current)
+            current, size = [], 0
+        current.append(line)
+        size += len(line.encode("utf-8")) + 1
+    if current:
+        shards.append(current)
+
+    docs = {
+        f"{language}_{n}": {"language": language, "postings": "\n".join(lines)}
+        for n, lines in enumerate(shards)
+    }
+    docs[language] = {
+        "format": INDEX_FORMAT,
+        "language": language,
+        "version": content_hash(docs),
+        "docs": list(doc_ids),
+        "fields": FIELD_WEIGHTS,
+        "shards": [lines[0].split("\t", 1)[0] for lines in shards],
+    }
+    return docs
+
+
+def build_index(by_id, cache_path=CACHE_PATH):
+    """{doc ID: data} for every search_index doc, plus (reused, tokenized) counts"""
+    cached = _load_cache(cache_path) if cache_path else {}
+    fresh, postings = {}, {}
+    reused = 0
+    for doc_id, article in by_id.items():
+        if not article["isPublished"]:
+            continue
+        key = _cache_key(article)
+        if key in cached:
+            reused += 1
+            fresh[key] = cached[key]
+        else:
+            fresh[key] = article_postings(article)
+        postings[doc_id] = fresh[key]
+    if cache_path and fresh.keys() != cached.keys():
+        _save_cache(cache_path, fresh)
+
+    docs = {}
+    for language in sorted({by_id[doc_id]["language"] for doc_id in postings}):
+        doc_ids = sorted(doc_id for doc_id in postings if by_id[doc_id]["language"] == language)
+        docs.update(_language_docs(language, doc_ids, postings))
+    return docs, (reused, len(postings) - reused)
+
+
+# ═══════════════════════════════════════════════════════════════
+#  QUERY  (reference implementation for clients)
+# ═══════════════════════════════════════════════════════════════
+def parse_postings(text):
+    """{term: [(doc, weight, positions)]} from a shard's postings string"""
+    terms = {}
+    for line in text.split("\n"):
+        if not line:
+            continue
+        term, entries = line.split("\t", 1)
+        terms[term] = [
+            (int(doc), int(weight), [int(p) for p in positions.split(",") if p])
+            for doc, weight, positions in (entry.split(":") for entry in entries.split(";"))
+        ]
+    return terms
+
+
+def search(docs, language, query, limit=10):
+    """Rank article IDs for `query`; the last word also matches as a prefix"""
+    manifest = docs[language]
+    terms = {}
+    for n in range(len(manifest["shards"])):
+        terms.update(parse_postings(docs[f"{language}_{n}"]["postings"]))
+
+    words = tokenize(query, language)
+    total = len(manifest["docs"])
+    scores = {}
+    for i, word in enumerate(words):
+        matches = [word] if i < len(words) - 1 else [t for t in terms if t.startswith(word)]
+        for term in matches:
+            entries = terms.get(term, ())
+            idf = math.log(1 + total / len(entries)) if entries else 0.0
+            for doc, weight, _ in entries:
+                scores[doc] = scores.get(doc, 0.0) + weight * idf
+    ranked = sorted(scores, key=lambda doc: (-scores[doc], manifest["docs"][doc]))
+    return [manifest["docs"][doc] for doc in ranked[:limit]]
+
+
+def main():
+    from seeding.content import article_id, load_bundle
+
+    parser = argparse.ArgumentParser(description="Build the education search index")
+    parser.add_argument("query", nargs="*", help="search the built index")
+    parser.add_argument("--language", default="en")
+    args = parser.parse_args()
+
+    by_id = {article_id(a): a for a in load_bundle()["data"]["education_articles"]}
+    docs, (reused, tokenized) = build_index(by_id)
+    shards = {k: v for k, v in docs.items() if "postings" in v}
+    size = sum(len(v["postings"].encode("utf-8")) for v in shards.values())
+    print(f"✓ Search index: {len(docs) - len(shards)} languages, {len(shards)} shards, "
+          f"{size / 1024:.1f} KiB ({reused} articles cached, {tokenized} tokenized)")
+    if args.query:
+        for rank, doc_id in enumerate(search(docs, args.language, " ".join(args.query)), 1):
+            print(f"  {rank:>2}. {doc_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Idempotent, diff-based collection sync.
+
+Each desired document carries a `contentHash` of its normalized payload.
+Existing documents are fetched with one projection query, and only created,
+changed or deleted documents are written.
+"""
+
+import hashlib
+import json
+import re
+import unicodedata
+from datetime import datetime, timezone
+
+HASH_FIELD = "contentHash"
+# Bookkeeping fields that never count as a content change.
+VOLATILE_FIELDS = {"createdAt", "updatedAt", HASH_FIELD}
+
+
+def slugify(text):
+    """Turn a title into an ASCII, lowercase, hyphen-separated ID segment"""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    text = re.sub(r"['’]", "", text)
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def content_hash(data):
+    """Stable hash of a payload, ignoring timestamps and the hash itself"""
+    normalized = {k: v for k, v in data.items() if k not in VOLATILE_FIELDS}
+    encoded = json.dumps(normalized, sort_keys=True, ensure_ascii=False,
+                         separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def fetch_hashes(db, collection):
+    """{doc_id: {contentHash, createdAt}} for every doc, in one bulk read"""
+    query = db.collection(collection).select([HASH_FIELD, "createdAt"])
+    return {snap.id: snap.to_dict() or {} for snap in query.stream()}
+
+
+def sync_collection(db, writer, collection, desired, now=None):
+    """Queue the writes that make `collection` match `desired` ({doc_id: data}).
+
+    Returns {"created": [...], "changed": [...], "deleted": [...], "unchanged": [...]}
+    with document IDs; the writes themselves go through `writer`.
+    """
+    now = now or datetime.now(timezone.utc)
+    existing = fetch_hashes(db, collection)
+    result = {"created": [], "changed": [], "deleted": [], "unchanged": []}
+
+    for doc_id, data in desired.items():
+        digest = content_hash(data)
+        current = existing.get(doc_id)
+        if current is not None and current.get(HASH_FIELD) == digest:
+            result["unchanged"].append(doc_id)
+            continue
+
+        payload = {k: v for k, v in data.items() if k not in VOLATILE_FIELDS}
+        payload[HASH_FIELD] = digest
+        payload["createdAt"] = (current or {}).get("createdAt") or now
+        payload["updatedAt"] = now
+        writer.set(f"{collection}/{doc_id}", payload)
+        result["changed" if current is not None else "created"].append(doc_id)
+
+    for doc_id in sorted(existing.keys() - desired.keys()):
+        writer.delete(f"{collection}/{doc_id}")
+        result["deleted"].append(doc_id)
+
+    return result
+
+
+class QueuedWrites:
+    """Writer stand-in that holds sync_collection's writes until replay()"""
+
+    def __init__(self):
+        self.ops = []
+
+    def set(self, path, data, merge=False):
+        self.ops.append(("set", path, data, merge))
+
+    def delete(self, path):
+        self.ops.append(("delete", path, None, False))
+
+    def replay(self, writer):
+        for kind, path, data, merge in self.ops:
+            if kind == "set":
+                writer.set(path, data, merge=merge)
+            else:
+                writer.delete(path)
+
+
+def format_result(result):
+    return (f"+{len(result['created'])} created · ~{len(result['changed'])} changed · "
+            f"-{len(result['deleted'])} deleted · ={len(result['unchanged'])} unchanged")
@@ -0,0 +1,298 @@
+"""Synthetic users, cycles and daily logs for load testing.
+
+Streams documents in the FIREBASE_DATA_GUIDE.md layout:
+
+    users/{uid}
+    users/{uid}/journey/period
+    users/{uid}/cycles/{cycleId}
+    users/{uid}/logs/period/entries/{YYYY-MM-DD}
+
+Each user is generated from its own RNG seeded with (seed, index), so runs
+are reproducible for a given --seed and --until, and memory stays flat no
+matter how many users or log documents are produced.
+
+    python3 -m seeding.synthetic --users 1000 --out build/synthetic/users.ndjson.gz
+    python3 -m seeding.synthetic --users 50000 --emulator localhost:8080
+    python3 -m seeding.synthetic --users 100 --profile my_profile.yaml --dry-run
+"""
+
+import argparse
+import copy
+import hashlib
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import yaml
+
+from seeding import ndjson
+from seeding.bulk_writer import DEFAULT_WORKERS, open_writer, use_ramp
+from seeding.client import CredentialsError, get_db, use_emulator
+from seeding.dry_run import DryRunClient
+from seeding.ramp import START_RATE, RampController
+from seeding.schema import document_errors
+
+# Every distribution can be overridden from a YAML profile (--profile).
+DEFAULT_PROFILE = {
+    "years": 2,
+    "cycle_length": {"mean": 28.5, "sd": 2.5, "min": 21, "max": 45},
+    "cycle_variation_sd": 2.0,      # month-to-month drift around a user's own mean
+    "period_length": {"mean": 5.0, "sd": 1.0, "min": 2, "max": 9},
+    "log_probability": {"period": 0.95, "other": 0.3},
+    # Flow weights by position in the period: first days, middle days, last day.
+    "flow": {
+        "start": {"heavy": 0.5, "medium": 0.4, "light": 0.1},
+        "middle": {"heavy": 0.2, "medium": 0.5, "light": 0.3},
+        "end": {"heavy": 0.05, "medium": 0.25, "light": 0.7},
+    },
+    "mood": {
+        "period": {"happy": 0.15, "okay": 0.35, "low": 0.25, "anxious": 0.1, "irritable": 0.15},
+        "luteal": {"happy": 0.15, "okay": 0.3, "low": 0.2, "anxious": 0.15, "irritable": 0.2},
+        "other": {"happy": 0.4, "okay": 0.4, "low": 0.08, "anxious": 0.07, "irritable": 0.05},
+    },
+    "pain": {
+        "period": [0.1, 0.2, 0.25, 0.25, 0.15, 0.05],   # weights for painLevel 0..5
+        "other": [0.75, 0.15, 0.06, 0.03, 0.01, 0.0],
+    },
+    "symptoms": {
+        "period": {"cramps": 0.6, "fatigue": 0.4, "backache": 0.3, "headache": 0.2, "bloating": 0.3},
+        "luteal": {"bloating": 0.4, "cravings": 0.35, "acne": 0.2, "mood_swings": 0.3},
+        "other": {"fatigue": 0.1, "headache": 0.08},
+    },
+    "water_glasses": {"mean": 7, "sd": 2},
+    "sleep_hours": {"mean": 7.5, "sd": 1.0},
+    "users": {
+        "ageGroup": {"teen": 0.2, "adult": 0.65, "mature": 0.15},
+        "region": {"asia": 0.35, "africa": 0.15, "latam": 0.2, "global": 0.3},
+        "language": {"en": 0.6, "ms": 0.1, "es": 0.15, "hi": 0.1, "ar": 0.05},
+        "lifeStage": {"period": 0.8, "ovul": 0.15, "preg": 0.05},
+        "premium_rate": 0.2,
+    },
+}
+
+
+def load_profile(path=None):
+    """DEFAULT_PROFILE, deep-merged with the YAML file at `path`"""
+    profile = copy.deepcopy(DEFAULT_PROFILE)
+    if path:
+        with open(path, encoding="utf-8") as f:
+            _merge(profile, yaml.safe_load(f) or {})
+    return profile
+
+
+def _merge(base, override):
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _merge(base[key], value)
+        else:
+            base[key] = value
+
+
+class _Weighted:
+    """Pre-split {choice: weight} so sampling is one rng.choices call"""
+
+    def __init__(self, weights):
+        self.choices = list(weights)
+        self.cum_weights = []
+        total = 0.0
+        for value in weights.values():
+            total += value
+            self.cum_weights.append(total)
+
+    def sample(self, rng):
+        return rng.choices(self.choices, cum_weights=self.cum_weights)[0]
+
+
+def _clipped_normal(rng, spec, mean=None):
+    value = rng.gauss(spec["mean"] if mean is None else mean, spec["sd"])
+    return int(round(min(max(value, spec["min"]), spec["max"])))
+
+
+class Generator:
+    def __init__(self, profile, seed=0, until=None):
+        self.profile = profile
+        self.seed = seed
+        self.until = until or datetime.now(timezone.utc).date()
+        self.days = int(profile["years"] * 365)
+
+        users = profile["users"]
+        self._user_fields = {key: _Weighted(users[key])
+                             for key in ("ageGroup", "region", "language", "lifeStage")}
+        self._flow = {key: _Weighted(value) for key, value in profile["flow"].items()}
+        self._mood = {key: _Weighted(value) for key, value in profile["mood"].items()}
+        self._pain = {key: _Weighted(dict(enumerate(value))) for key, value in profile["pain"].items()}
+
+    def uid(self, index):
+        digest = hashlib.sha1(f"{self.seed}:{index}".encode()).hexdigest()
+        return f"syn_{digest[:16]}"
+
+    def user_documents(self, index):
+        """Yield (path, data) for one user's whole tree"""
+        rng = random.Random(f"{self.seed}:{index}")
+        profile = self.profile
+        uid = self.uid(index)
+
+        cycle_mean = rng.gauss(profile["cycle_length"]["mean"], profile["cycle_length"]["sd"])
+        period_len = _clipped_normal(rng, profile["period_length"])
+        # Histories shorter than a cycle would otherwise start after `until`.
+        first_start = min(self.until - timedelta(days=self.days - rng.randrange(28)), self.until)
+
+        cycles = []
+        start = first_start
+        while start <= self.until:
+            length = _clipped_normal(rng, {**profile["cycle_length"], "sd": profile["cycle_variation_sd"]},
+                                     mean=cycle_mean)
+            bleed = max(1, period_len + rng.choice((-1, 0, 0, 1)))
+            cycles.append((start, length, bleed))
+            start += timedelta(days=length)
+
+        created = _utc(first_start - timedelta(days=rng.randrange(1, 30)))
+        premium = rng.random() < profile["users"]["premium_rate"]
+        user = {
+            "displayName": f"Synthetic User {index}",
+            **{key: field.sample(rng) for key, field in self._user_fields.items()},
+            "createdAt": created,
+            "isPremium": premium,
+        }
+        if premium:
+            user["premiumSince"] = created + timedelta(days=rng.randrange(0, 60))
+        yield f"users/{uid}", user
+
+        last_start, _, _ = cycles[-1]
+        yield f"users/{uid}/journey/period", {
+            "lastPeriod": _utc(last_start),
+            "cycleLen": int(round(min(max(cycle_mean, 18), 45))),
+            "periodLen": period_len,
+            "flow": self._flow["middle"].sample(rng),
+            "symptoms": sorted(s for s, p in profile["symptoms"]["period"].items() if rng.random() < p),
+        }
+
+        for start, length, bleed in cycles[:-1]:   # the current cycle is still open
+            yield f"users/{uid}/cycles/cycle_{start.isoformat()}", {
+                "startDate": _utc(start),
+                "endDate": _utc(start + timedelta(days=bleed - 1)),
+                "length": length,
+            }
+
+        for start, length, bleed in cycles:
+            for offset in range(length):
+                day = start + timedelta(days=offset)
+                if day > self.until:
+                    break
+                entry = self._log_entry(rng, day, offset, length, bleed)
+                if entry is not None:
+                    yield f"users/{uid}/logs/period/entries/{day.isoformat()}", entry
+
+    def _log_entry(self, rng, day, offset, length, bleed):
+        profile = self.profile
+        on_period = offset < bleed
+        phase = "period" if on_period else ("luteal" if offset >= length - 5 else "other")
+        if rng.random() >= profile["log_probability"]["period" if on_period else "other"]:
+            return None
+
+        if on_period:
+            position = "start" if offset < 2 else ("end" if offset == bleed - 1 else "middle")
+            flow = self._flow[position].sample(rng)
+        else:
+            flow = "none"
+        water, sleep = profile["water_glasses"], profile["sleep_hours"]
+        return {
+            "date": _utc(day),
+            "flow": flow,
+            "mood": self._mood[phase].sample(rng),
+            "symptoms": sorted(s for s, p in profile["symptoms"][phase].items() if rng.random() < p),
+            "painLevel": self._pain["period" if on_period else "other"].sample(rng),
+            "waterGlasses": max(0, min(15, int(round(rng.gauss(water["mean"], water["sd"]))))),
+            "sleepHours": round(max(3.0, min(12.0, rng.gauss(sleep["mean"], sleep["sd"]))), 1),
+        }
+
+    def documents(self, users, start=0):
+        """Yield (path, data) for users [start, start + users)"""
+        for index in range(start, start + users):
+            yield from self.user_documents(index)
+
+
+def _utc(day):
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+
+def _positive_float(text):
+    value = float(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {text}")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic users, cycles and logs")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (default: %(default)s)")
+    parser.add_argument("--years", type=_positive_float, help="history per user (default: profile, 2)")
+    parser.add_argument("--until", type=date.fromisoformat,
+                        help="last generated day, YYYY-MM-DD (default: today)")
+    parser.add_argument("--start-index", type=int, default=0,
+                        help="first user index, to generate disjoint shards")
+    parser.add_argument("--profile", help="YAML file overriding DEFAULT_PROFILE distributions")
+    parser.add_argument("--validate", action="store_true", help="schema-check every document")
+    destination = parser.add_mutually_exclusive_group(required=True)
+    destination.add_argument("--out", help="write NDJSON here (.gz to compress)")
+    destination.add_argument("--emulator", metavar="HOST:PORT", help="write into a Firestore emulator")
+    destination.add_argument("--dry-run", action="store_true", help="report writes and bytes only")
+    destination.add_argument("--production", action="store_true",
+                             help="write into the configured production project")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--ramp", type=int, nargs="?", const=START_RATE, metavar="OPS",
+                        help="pace writes from OPS/s (default %(const)s), +50%% every 5 minutes, "
+                             "halving on throttling")
+    args = parser.parse_args()
+
+    profile = load_profile(args.profile)
+    if args.years is not None:
+        profile["years"] = args.years
+    generator = Generator(profile, seed=args.seed, until=args.until)
+    docs = generator.documents(args.users, start=args.start_index)
+
+    if args.validate:
+        def checked(records):
+            for path, data in records:
+                errors = document_errors(path, data)
+                if errors:
+                    raise SystemExit("✗ " + "\n  ".join(errors))
+                yield path, data
+        docs = checked(docs)
+
+    print(f"Generating {args.users} users × {profile['years']} years "
+          f"(seed {args.seed}, until {generator.until.isoformat()})")
+    started = time.perf_counter()
+
+    if args.out:
+        count = ndjson.write_records(args.out, docs)
+    else:
+        if args.emulator:
+            use_emulator(args.emulator)
+        try:
+            db = DryRunClient() if args.dry_run else get_db()
+        except CredentialsError as e:
+            print(f"✗ {e}")
+            sys.exit(1)
+        ramp = use_ramp(RampController(start=args.ramp)) if args.ramp else None
+        writer = open_writer(db, args.workers)
+        count = 0
+        for path, data in docs:
+            writer.set(path, data)
+            count += 1
+        writer.close()
+        print(f"  Committed {writer.summary()}")
+        if ramp is not None:
+            print(ramp.report())
+        if args.dry_run:
+            print("\n" + db.plan.report())
+
+    elapsed = time.perf_counter() - started
+    print(f"✓ {count:,} documents for {args.users:,} users in {elapsed:.1f}s "
+          f"({count / elapsed if elapsed else 0:,.0f} docs/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Dependency-aware task scheduler for the seeding CLI.
+
+Each dataset is registered as a Task with the Firestore paths it writes.
+Tasks whose targets overlap (one path is a prefix of the other) run in
+registration order; everything else runs concurrently on a shared client.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from seeding import tracing
+
+
+class Task:
+    def __init__(self, name, run, targets, after=(), description=""):
+        self.name = name
+        self.run = run              # callable(db) -> anything; False means failure
+        self.targets = list(targets)
+        self.after = list(after)
+        self.description = description
+
+
+def _overlaps(a, b):
+    a, b = a.strip("/"), b.strip("/")
+    return a == b or a.startswith(b + "/") or b.startswith(a + "/")
+
+
+def resolve_dependencies(tasks):
+    """{task name: set of task names it must wait for}"""
+    names = {task.name for task in tasks}
+    deps = {}
+    for i, task in enumerate(tasks):
+        wanted = {name for name in task.after if name in names}
+        for earlier in tasks[:i]:
+            if any(_overlaps(a, b) for a in task.targets for b in earlier.targets):
+                wanted.add(earlier.name)
+        deps[task.name] = wanted
+    return deps
+
+
+def select_tasks(tasks, only=None, skip=None):
+    known = {task.name for task in tasks}
+    unknown = (set(only or ()) | set(skip or ())) - known
+    if unknown:
+        raise ValueError(f"Unknown task(s): {', '.join(sorted(unknown))}. "
+                         f"Available: {', '.join(task.name for task in tasks)}")
+    return [task for task in tasks
+            if (not only or task.name in only) and task.name not in (skip or ())]
+
+
+def run_tasks(tasks, db, max_workers=None):
+    """Run tasks as soon as their dependencies finish.
+
+    Returns {name: {"status": "ok" | "failed" | "skipped", "elapsed": s, "error": e}}
+    in registration order. Dependents of a failed task are skipped.
+    """
+    deps = resolve_dependencies(tasks)
+    by_name = {task.name: task for task in tasks}
+    results = {task.name: None for task in tasks}
+    running = {}
+
+    def execute(task):
+        started = time.perf_counter()
+        try:
+            with tracing.span(f"task.{task.name}") as span:
+                ok = task.run(db) is not False
+                span.set(ok=ok)
+            return {"status": "ok" if ok else "failed", "error": None,
+                    "elapsed": time.perf_counter() - started}
+        except Exception as e:
+            return {"status": "failed", "error": e,
+                    "elapsed": time.perf_counter() - started}
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(tasks) or 1) as pool:
+        while True:
+            for name, wanted in deps.items():
+                if results[name] is not None or name in running.values():
+                    continue
+                if any(results[dep] is not None and results[dep]["status"] != "ok" for dep in wanted):
+                    results[name] = {"status": "skipped", "error": None, "elapsed": 0.0}
+                elif all(results[dep] is not None for dep in wanted):
+                    running[pool.submit(execute, by_name[name])] = name
+
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+
+    for name, result in results.items():
+        if result is None:
+            results[name] = {"status": "skipped", "elapsed": 0.0,
+                             "error": ValueError("circular task dependency")}
+    return results
+
+
+def format_timing_table(results, wall_time):
+    width = max([len("task")] + [len(name) for name in results])
+    lines = [f"  {'task':<{width}}  {'status':<9}  {'time':>8}",
+             f"  {'─' * width}  {'─' * 9}  {'─' * 8}"]
+    for name, result in results.items():
+        mark = {"ok": "✓", "failed": "✗", "skipped": "–"}[result["status"]]
+        lines.append(f"  {name:<{width}}  {mark} {result['status']:<7}  {result['elapsed']:>7.2f}s")
+        if result["error"] is not None:
+            lines.append(f"  {'':<{width}}    {result['error']}")
+    serial = sum(result["elapsed"] for result in results.values())
+    lines.append(f"  wall time {wall_time:.2f}s (sum of tasks {serial:.2f}s)")
+    return "\n".join(lines)
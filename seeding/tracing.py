@@ -0,0 +1,350 @@
+"""Spans around every Firestore call the seeders make, exported as OTLP JSON.
+
+Off by default, and then get_db() hands out the bare client and span() is a
+shared no-op. Turn it on for any seeder or tool with
+
+    SEED_TRACE=build/trace.json python3 seed.py
+    python3 seed.py --trace build/trace.json
+
+and every RPC (commit, get, set, query, get_all, …) becomes a span carrying
+its collection, document count, payload bytes, latency and outcome, with
+BulkWriter batches and seed.py tasks as parent spans (batch spans also carry
+their retries). At exit the spans are written as an OTLP/JSON
+ExportTraceServiceRequest, which collectors and Jaeger/Tempo import as is,
+and a p50/p95/p99 table per operation is printed.
+"""
+
+import atexit
+import contextlib
+import json
+import math
+import os
+import threading
+import time
+
+from seeding.doc_size import document_name_size, document_size
+
+TRACE_ENV = "SEED_TRACE"
+SERVICE_NAME = "metrustual-seeding"
+
+# OTLP span kinds and status codes
+INTERNAL = 1
+CLIENT = 3
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    __slots__ = ("name", "kind", "span_id", "parent_id", "start_ns", "end_ns",
+                 "attributes", "error")
+
+    def __init__(self, name, kind, parent_id, attributes):
+        self.name = name
+        self.kind = kind
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = attributes
+        self.error = None
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    @property
+    def seconds(self):
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+class _NoopSpan:
+    span_id = None
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP = _NoopSpan()
+
+
+class Tracer:
+    """Collects finished spans; parents follow the calling thread unless given"""
+
+    def __init__(self):
+        self.trace_id = os.urandom(16).hex()
+        self.spans = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def current(self):
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else None
+
+    def start(self, name, kind=INTERNAL, parent=None, **attributes):
+        if parent is None:
+            parent = self.current()
+        return Span(name, kind, parent.span_id if parent else None, attributes)
+
+    def finish(self, span, error=None):
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        with self._lock:
+            self.spans.append(span)
+
+    @contextlib.contextmanager
+    def span(self, name, kind=INTERNAL, parent=None, **attributes):
+        span = self.start(name, kind, parent, **attributes)
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.finish(span, e)
+            raise
+        else:
+            self.finish(span)
+        finally:
+            stack.pop()
+
+    # ── Export ──────────────────────────────────────────────────
+    def otlp(self):
+        """The spans as an OTLP/JSON ExportTraceServiceRequest"""
+        with self._lock:
+            spans = list(self.spans)
+        return {"resourceSpans": [{
+            "resource": {"attributes": _attributes({"service.name": SERVICE_NAME})},
+            "scopeSpans": [{
+                "scope": {"name": __name__},
+                "spans": [_otlp_span(self.trace_id, span) for span in spans],
+            }],
+        }]}
+
+    def write(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.otlp(), f)
+
+    def latencies(self):
+        """{span name: sorted durations in seconds}"""
+        by_name = {}
+        with self._lock:
+            for span in self.spans:
+                by_name.setdefault(span.name, []).append(span.seconds)
+        return {name: sorted(durations) for name, durations in sorted(by_name.items())}
+
+
+def _attributes(attributes):
+    encoded = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            value = {"boolValue": value}
+        elif isinstance(value, int):
+            value = {"intValue": str(value)}     # OTLP/JSON carries int64 as a string
+        elif isinstance(value, float):
+            value = {"doubleValue": value}
+        else:
+            value = {"stringValue": str(value)}
+        encoded.append({"key": key, "value": value})
+    return encoded
+
+
+def _otlp_span(trace_id, span):
+    encoded = {
+        "traceId": trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": _attributes(span.attributes),
+        "status": {"code": STATUS_ERROR, "message": span.error} if span.error
+                  else {"code": STATUS_OK},
+    }
+    if span.parent_id:
+        encoded["parentSpanId"] = span.parent_id
+    return encoded
+
+
+def percentile(durations, p):
+    """Nearest-rank percentile of sorted `durations`"""
+    return durations[max(0, math.ceil(p / 100 * len(durations)) - 1)]
+
+
+def format_summary(tracer):
+    latencies = tracer.latencies()
+    width = max([len("operation")] + [len(name) for name in latencies])
+    lines = [f"  {'operation':<{width}}  {'count':>6}  {'p50':>9}  {'p95':>9}  {'p99':>9}  {'total':>8}"]
+    for name, durations in latencies.items():
+        p50, p95, p99 = (percentile(durations, p) * 1000 for p in (50, 95, 99))
+        lines.append(f"  {name:<{width}}  {len(durations):>6,}  {p50:>7.1f}ms  {p95:>7.1f}ms  "
+                     f"{p99:>7.1f}ms  {sum(durations):>7.2f}s")
+    return "\n".join(lines)
+
+
+# ═══════════════════════════════════════════════════════════════
+#  PROCESS-WIDE TRACER
+# ═══════════════════════════════════════════════════════════════
+_tracer = None
+_path = None
+_lock = threading.Lock()
+
+
+def enable(path):
+    """Trace from now on and write to `path` at exit; returns the tracer"""
+    global _tracer, _path
+    with _lock:
+        if _tracer is None:
+            _tracer = Tracer()
+            atexit.register(_finish)
+        _path = path
+    return _tracer
+
+
+def enable_from_env():
+    if _tracer is None and os.getenv(TRACE_ENV):
+        enable(os.environ[TRACE_ENV])
+
+
+def tracer():
+    return _tracer
+
+
+def current():
+    return _tracer.current() if _tracer is not None else None
+
+
+def span(name, parent=None, **attributes):
+    """An INTERNAL span on the process tracer, or a no-op when tracing is off"""
+    if _tracer is None:
+        return NOOP
+    return _tracer.span(name, INTERNAL, parent, **attributes)
+
+
+def wrap(client):
+    """`client`, traced if tracing is on"""
+    return client if _tracer is None else TracedClient(client, _tracer)
+
+
+def _finish():
+    if not _tracer.spans:
+        return
+    _tracer.write(_path)
+    print(f"\n⏱  {len(_tracer.spans):,} spans → {_path}")
+    print(format_summary(_tracer))
+
+
+# ═══════════════════════════════════════════════════════════════
+#  CLIENT PROXY
+# ═══════════════════════════════════════════════════════════════
+# Same class names in the SDK and in seeding.memory.
+_WRAPPED = {"DocumentReference", "CollectionReference", "CollectionGroup", "Query", "WriteBatch"}
+_BATCHES = {"WriteBatch", "Batch"}
+_RPCS = {
+    "WriteBatch": {"commit": "commit"},
+    "Batch": {"commit": "commit"},
+    "DocumentReference": {"get": "get", "set": "set", "create": "create", "update": "update",
+                          "delete": "delete", "collections": "list_collections"},
+    "CollectionReference": {"get": "query", "stream": "query", "list_documents": "list_documents"},
+    "CollectionGroup": {"get": "query", "stream": "query"},
+    "Query": {"get": "query", "stream": "query"},
+    "Client": {"get_all": "get_all", "collections": "list_collections"},
+    "MemoryClient": {"get_all": "get_all", "collections": "list_collections"},
+}
+_WRITES = {"set", "create", "update"}
+_STREAMS = {"stream", "get_all", "list_documents", "collections"}
+
+
+def collection_of(path):
+    """Collection ID of a document or collection path"""
+    parts = path.strip("/").split("/")
+    return parts[-2] if len(parts) % 2 == 0 else parts[-1]
+
+
+class TracedClient:
+    """Wraps a Firestore client, and everything it hands out, in RPC spans"""
+
+    def __init__(self, target, tracer, collection=None):
+        self._target = target
+        self._tracer = tracer
+        self._kind = type(target).__name__
+        self._collection = collection
+        self._writes = []       # (collection, bytes) queued in a batch until it commits
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+        rpc = _RPCS.get(self._kind, {}).get(name)
+
+        def call(*args, **kwargs):
+            args = [arg._target if isinstance(arg, TracedClient) else arg for arg in args]
+            if self._kind in _BATCHES and name in _WRITES | {"delete"}:
+                path = args[0].path
+                size = document_size(path, args[1]) if name in _WRITES else document_name_size(path)
+                self._writes.append((collection_of(path), size))
+            if rpc is None:
+                return self._wrap(name, args, attr(*args, **kwargs))
+            return self._rpc(rpc, name, attr, args, kwargs)
+
+        return call
+
+    def _rpc(self, rpc, name, attr, args, kwargs):
+        attributes = {"collection": self._collection or "", "documents": 1}
+        if self._kind in _BATCHES:
+            writes, self._writes = self._writes, []
+            attributes.update(collection=",".join(sorted({c for c, _ in writes})),
+                              documents=len(writes), bytes=sum(size for _, size in writes))
+        elif name in _WRITES:
+            attributes["bytes"] = document_size(self._target.path, args[0])
+        elif name == "get_all":
+            attributes.update(collection=",".join(sorted({collection_of(ref.path) for ref in args[0]})),
+                              documents=len(args[0]))
+
+        span = self._tracer.start(f"firestore.{rpc}", CLIENT, **attributes)
+        try:
+            result = attr(*args, **kwargs)
+        except BaseException as e:
+            self._tracer.finish(span, e)
+            raise
+        if name in _STREAMS:
+            return self._drain(span, result, count=name != "get_all")
+        if isinstance(result, list):
+            span.set(documents=len(result))
+        self._tracer.finish(span)
+        return self._wrap(name, args, result)
+
+    def _drain(self, span, results, count):
+        # Streams do their work while iterated; the span covers all of it.
+        found = 0
+        try:
+            for item in results:
+                found += 1
+                yield self._wrap(None, (), item)
+        except GeneratorExit:
+            # The caller stopped early (a limit, a break): a normal finish.
+            if count:
+                span.set(documents=found)
+            self._tracer.finish(span)
+            raise
+        except BaseException as e:
+            self._tracer.finish(span, e)
+            raise
+        if count:
+            span.set(documents=found)
+        self._tracer.finish(span)
+
+    def _wrap(self, name, args, result):
+        if type(result).__name__ not in _WRAPPED:
+            return result
+        collection = self._collection
+        if name in ("collection", "collection_group") and args:
+            collection = str(args[-1]).split("/")[-1]
+        elif hasattr(result, "path") and type(result).__name__ != "WriteBatch":
+            collection = collection_of(result.path)
+        return TracedClient(result, self._tracer, collection)
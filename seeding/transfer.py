@@ -0,0 +1,240 @@
+"""Streaming export/import of the whole Firestore tree as gzip NDJSON.
+
+    python3 -m seeding.transfer export build/export/2026-10-17
+    python3 -m seeding.transfer import build/export/2026-10-17 --emulator localhost:8080
+
+An export directory holds one <collection group>.ndjson.gz per group plus
+manifest.json, which records each group's read cursor. Groups are read
+concurrently, a page at a time, ordered by document name; after every page
+the file is closed (one gzip member per page) and the cursor checkpointed,
+so an interrupted export resumes where it stopped when run again on the same
+directory.
+
+Imports stream each file back through a BulkWriter and checkpoint the
+number of committed records to import.json, so they resume the same way.
+Memory stays flat in both directions: at most one page per reader and the
+writer's bounded queue are held at a time.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+
+from seeding import ndjson
+from seeding.bulk_writer import DEFAULT_WORKERS, open_writer, use_ramp
+from seeding.client import CredentialsError, get_db, use_emulator
+from seeding.dry_run import DryRunClient
+from seeding.ramp import START_RATE, RampController
+
+EXPORT_FORMAT = 1
+MANIFEST = "manifest.json"
+IMPORT_STATE = "import.json"
+DEFAULT_PAGE_SIZE = 1000
+IMPORT_CHECKPOINT_EVERY = 5000
+
+# Collection IDs from FIREBASE_DATA_GUIDE.md. config/self_care/{mode} IDs
+# come from content, so they are discovered by walking config/.
+ROOT_GROUPS = ("config", "journeys", "education_articles", "users")
+USER_GROUPS = ("journey", "cycles", "logs", "entries")
+
+
+class Checkpoint:
+    """A JSON state file rewritten atomically on every update"""
+
+    def __init__(self, path, initial):
+        self.path = path
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.state = json.load(f)
+        else:
+            self.state = initial
+            self._save()
+
+    def group(self, name):
+        return self.state["groups"].setdefault(name, {})
+
+    def update(self, name, **fields):
+        with self._lock:
+            self.group(name).update(fields)
+            self._save()
+
+    def _save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def discover_groups(db):
+    """Every collection ID to export: the known ones, other root collections
+    and those under config/"""
+    groups = list(ROOT_GROUPS + USER_GROUPS)
+    groups += [collection.id for collection in db.collections() if collection.id not in groups]
+    stack = list(db.collection("config").list_documents())
+    while stack:
+        doc = stack.pop()
+        for sub in doc.collections():
+            # Same-named collections share a shape, so only the first is walked.
+            if sub.id not in groups:
+                groups.append(sub.id)
+                stack.extend(sub.list_documents())
+    return groups
+
+
+def group_file(group):
+    return f"{group}.ndjson.gz"
+
+
+# ═══════════════════════════════════════════════════════════════
+#  EXPORT
+# ═══════════════════════════════════════════════════════════════
+def export_group(db, group, directory, checkpoint, page_size=DEFAULT_PAGE_SIZE):
+    """Append every document of one collection group, resuming from its cursor"""
+    state = checkpoint.group(group)
+    if state.get("done"):
+        return state
+    path = os.path.join(directory, group_file(group))
+    cursor, count, size = state.get("cursor"), state.get("count", 0), state.get("bytes", 0)
+
+    # Drop anything written after the last checkpoint.
+    with open(path, "ab") as f:
+        f.truncate(size)
+
+    while True:
+        query = db.collection_group(group).order_by("__name__").limit(page_size)
+        if cursor:
+            query = query.start_after({"__name__": db.document(cursor)})
+        snapshots = list(query.stream())
+        if snapshots:
+            with ndjson.open_text(path, "a") as f:
+                for snapshot in snapshots:
+                    f.write(ndjson.dumps(snapshot.reference.path, snapshot.to_dict()) + "\n")
+            cursor = snapshots[-1].reference.path
+            count += len(snapshots)
+            size = os.path.getsize(path)
+        done = len(snapshots) < page_size
+        checkpoint.update(group, cursor=cursor, count=count, bytes=size, done=done)
+        if done:
+            return checkpoint.group(group)
+
+
+def export_tree(db, directory, groups=None, workers=DEFAULT_WORKERS, page_size=DEFAULT_PAGE_SIZE):
+    """Export (or resume exporting) into `directory`; returns the checkpoint"""
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, MANIFEST)
+    resuming = os.path.exists(manifest_path)
+    checkpoint = Checkpoint(manifest_path, {
+        "format": EXPORT_FORMAT,
+        "startedAt": datetime.now(timezone.utc).isoformat(),
+        "groups": {},
+    })
+    if not resuming:
+        for group in groups or discover_groups(db):
+            checkpoint.update(group, file=group_file(group), cursor=None, count=0, bytes=0, done=False)
+
+    names = list(checkpoint.state["groups"])
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(export_group, db, name, directory, checkpoint, page_size): name
+                   for name in names}
+        for future in as_completed(futures):
+            state = future.result()
+            print(f"  ✓ {futures[future]:<20} {state['count']:>10,} docs  {state['bytes'] / 1024:>9.1f} KiB")
+    return checkpoint
+
+
+# ═══════════════════════════════════════════════════════════════
+#  IMPORT
+# ═══════════════════════════════════════════════════════════════
+def import_tree(db, directory, workers=DEFAULT_WORKERS, checkpoint_every=IMPORT_CHECKPOINT_EVERY):
+    """Write an export back, skipping records an earlier run already committed"""
+    with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != EXPORT_FORMAT:
+        raise ValueError(f"{directory}: unsupported export format {manifest.get('format')!r}")
+    incomplete = [name for name, state in manifest["groups"].items() if not state["done"]]
+    if incomplete:
+        raise ValueError(f"{directory}: export did not finish ({', '.join(incomplete)}); "
+                         "run the export again to resume it")
+
+    checkpoint = Checkpoint(os.path.join(directory, IMPORT_STATE), {"groups": {}})
+    writer = open_writer(db, workers)
+    for name, state in manifest["groups"].items():
+        imported = checkpoint.group(name).get("records", 0)
+        if imported >= state["count"]:
+            continue
+        path = os.path.join(directory, state["file"])
+        for doc_path, data in ndjson.read_records(path, db, skip=imported):
+            writer.set(doc_path, data)
+            imported += 1
+            if imported % checkpoint_every == 0:
+                writer.flush()
+                checkpoint.update(name, records=imported)
+        writer.flush()
+        checkpoint.update(name, records=imported)
+        print(f"  ✓ {name:<20} {imported:>10,} docs")
+    writer.close()
+    return writer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export or import the Firestore tree as NDJSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_cmd = commands.add_parser("export", help="read every collection group into DIR")
+    export_cmd.add_argument("directory")
+    export_cmd.add_argument("--groups", help="comma-separated collection IDs (default: discovered)")
+    export_cmd.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    export_cmd.add_argument("--emulator", metavar="HOST:PORT", help="read from a Firestore emulator")
+    export_cmd.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+
+    import_cmd = commands.add_parser("import", help="write an export in DIR back to Firestore")
+    import_cmd.add_argument("directory")
+    import_cmd.add_argument("--restart", action="store_true", help="ignore the import checkpoint")
+    import_cmd.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    import_cmd.add_argument("--ramp", type=int, nargs="?", const=START_RATE, metavar="OPS",
+                            help="pace writes from OPS/s (default %(const)s), +50%% every 5 minutes, "
+                                 "halving on throttling")
+    destination = import_cmd.add_mutually_exclusive_group(required=True)
+    destination.add_argument("--emulator", metavar="HOST:PORT", help="write into a Firestore emulator")
+    destination.add_argument("--dry-run", action="store_true", help="report writes and bytes only")
+    destination.add_argument("--production", action="store_true",
+                             help="write into the configured production project")
+    args = parser.parse_args()
+
+    if args.emulator:
+        use_emulator(args.emulator)
+    started = time.perf_counter()
+    try:
+        db = DryRunClient() if getattr(args, "dry_run", False) else get_db()
+        if args.command == "export":
+            groups = args.groups.split(",") if args.groups else None
+            print(f"Exporting to {args.directory}")
+            checkpoint = export_tree(db, args.directory, groups, args.workers, args.page_size)
+            total = sum(state["count"] for state in checkpoint.state["groups"].values())
+        else:
+            state_path = os.path.join(args.directory, IMPORT_STATE)
+            if args.restart and os.path.exists(state_path):
+                os.remove(state_path)
+            print(f"Importing from {args.directory}")
+            ramp = use_ramp(RampController(start=args.ramp)) if args.ramp else None
+            writer = import_tree(db, args.directory, args.workers)
+            total = writer.writes
+            print(f"  Committed {writer.summary()}")
+            if ramp is not None:
+                print(ramp.report())
+            if args.dry_run:
+                print("\n" + db.plan.report())
+    except (CredentialsError, ValueError) as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print(f"✓ {total:,} documents in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
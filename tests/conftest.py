@@ -0,0 +1,30 @@
+"""Hermetic seeder tests: every test gets a fresh in-memory Firestore."""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# Keep the real build/cache untouched; must be set before seeding.content is imported.
+os.environ.setdefault("SEED_CACHE_DIR", tempfile.mkdtemp(prefix="seed-cache-"))
+
+from seeding.content import load_bundle  # noqa: E402
+from seeding.memory import MemoryClient  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    return MemoryClient(project="demo-metrustual")
+
+
+@pytest.fixture(scope="session")
+def bundle():
+    return load_bundle()
+
+
+def documents(db, collection):
+    """{document ID: data} for one collection"""
+    return {snapshot.id: snapshot.to_dict() for snapshot in db.collection(collection).stream()}
@@ -0,0 +1,146 @@
+import collections
+import gc
+import threading
+import time
+
+import pytest
+from google.api_core import exceptions as api_exceptions
+
+from seeding import async_writer
+from seeding.memory import MemoryClient
+
+from conftest import documents
+
+
+def test_engine_is_per_client_and_stops_with_it():
+    db = MemoryClient(project="demo-metrustual")
+    engine = async_writer.engine_for(db)
+    assert async_writer.engine_for(db) is engine
+    assert async_writer.engine_for(MemoryClient(project="demo-metrustual")) is not engine
+
+    writer = async_writer.AsyncWriter(db)
+    writer.set("articles/a", {"n": 1})
+    writer.close()
+    assert documents(db, "articles") == {"a": {"n": 1}}
+
+    thread = engine._thread
+    del db, writer
+    gc.collect()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert engine not in async_writer._engines.values()
+
+
+def test_a_new_client_never_gets_a_dead_clients_engine():
+    previous = None
+    for _ in range(5):
+        db = MemoryClient(project="demo-metrustual")
+        writer = async_writer.AsyncWriter(db)
+        assert writer._engine is not previous
+        writer.set("articles/a", {"n": 1})
+        writer.close()
+        # Whether or not the new client reuses the old one's id(), its
+        # writes land in it.
+        assert documents(db, "articles") == {"a": {"n": 1}}
+        previous = writer._engine
+        del db, writer
+        gc.collect()
+        previous._thread.join(timeout=5)
+        assert not previous._thread.is_alive()
+
+
+class GatedClient:
+    """MemoryClient whose commits to `held` collections wait for `gate`"""
+
+    def __init__(self, held=(), fail=()):
+        self.db = MemoryClient(project="demo-metrustual")
+        self.held, self.fail = set(held), set(fail)
+        self.gate = threading.Event()
+        self.started = collections.Counter()
+        self.running = collections.Counter()
+        self.peak = collections.Counter()
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def document(self, path):
+        return self.db.document(path)
+
+    def batch(self):
+        batch = self.db.batch()
+        commit = batch.commit
+
+        def gated_commit():
+            names = {path.split("/", 1)[0] for _, path, _, _ in batch._writes}
+            (collection,) = names
+            with self._lock:
+                self.batches.append(collection)
+                self.started[collection] += 1
+                self.running[collection] += 1
+                self.peak[collection] = max(self.peak[collection], self.running[collection])
+            try:
+                if collection in self.fail:
+                    raise api_exceptions.PermissionDenied(collection)
+                if collection in self.held:
+                    self.gate.wait(5)
+                return commit()
+            finally:
+                with self._lock:
+                    self.running[collection] -= 1
+
+        batch.commit = gated_commit
+        return batch
+
+
+def _wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_chunks_per_collection():
+    client = GatedClient()
+    writer = async_writer.AsyncWriter(client, max_writes=2)
+    for i in range(5):
+        writer.set(f"a/{i}", {"n": i})
+        writer.set(f"b/{i}", {"n": i})
+    writer.close()
+    # Every batch holds one collection's writes; interleaving never splits them early.
+    assert sorted(client.batches) == ["a"] * 3 + ["b"] * 3
+    assert (writer.writes, writer.batches) == (10, 6)
+    assert len(documents(client.db, "a")) == len(documents(client.db, "b")) == 5
+
+
+def test_a_busy_collection_holds_only_its_own_slots():
+    client = GatedClient(held={"slow"})
+    writer = async_writer.AsyncWriter(client, workers=2, max_writes=1)
+    for i in range(7):
+        writer.set(f"slow/{i}", {"n": i})
+    writer.set("fast/0", {"n": 0})
+    writer.set("fast/1", {"n": 1})
+    # fast/0 commits while every slow commit is still waiting.
+    _wait_for(lambda: "0" in documents(client.db, "fast"))
+    assert client.running["slow"] == client.peak["slow"] == 2
+    client.gate.set()
+    writer.close()
+    assert client.peak["slow"] == 2
+    assert len(documents(client.db, "slow")) == 7
+
+
+def test_first_fatal_error_cancels_the_other_commits():
+    client = GatedClient(held={"slow"}, fail={"bad"})
+    writer = async_writer.AsyncWriter(client, workers=1, max_writes=1, backoff=0.001)
+    for i in range(5):
+        writer.set(f"slow/{i}", {"n": i})
+    writer.set("bad/0", {"n": 0})
+    writer.set("bad/1", {"n": 1})
+    _wait_for(lambda: writer._error is not None)
+    with pytest.raises(api_exceptions.PermissionDenied):
+        writer.set("slow/5", {"n": 5})
+    with pytest.raises(api_exceptions.PermissionDenied):
+        writer.close()
+    client.gate.set()
+    # Only the commit already on the wire went out; the queued ones were
+    # cancelled and the batches flushed by close() were never sent.
+    assert client.started == {"slow": 1, "bad": 1}
+    assert writer.writes == 0 and writer.retries == 0
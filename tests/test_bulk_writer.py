@@ -0,0 +1,124 @@
+import logging
+import threading
+
+import pytest
+from google.api_core import exceptions as api_exceptions
+
+from seeding.bulk_writer import MAX_BATCH_BYTES, MAX_BATCH_WRITES, BulkWriter
+from seeding.doc_size import document_size
+from seeding.memory import MemoryClient
+
+from conftest import documents
+
+
+class FlakyClient:
+    """MemoryClient whose commits raise `errors` in turn before going through"""
+
+    def __init__(self, errors=(), gate=None):
+        self.db = MemoryClient(project="demo-metrustual")
+        self.errors = list(errors)
+        self.gate = gate            # commits wait on this event when set
+        self.sizes = []
+        self._lock = threading.Lock()
+
+    def document(self, path):
+        return self.db.document(path)
+
+    def batch(self):
+        batch = self.db.batch()
+        commit = batch.commit
+
+        def flaky_commit():
+            if self.gate is not None:
+                self.gate.wait(5)
+            with self._lock:
+                error = self.errors.pop(0) if self.errors else None
+                if error is None:
+                    self.sizes.append(len(batch))
+            if error is not None:
+                raise error
+            return commit()
+
+        batch.commit = flaky_commit
+        return batch
+
+
+def test_chunks_at_500_writes():
+    client = FlakyClient()
+    writer = BulkWriter(client, workers=2)
+    for i in range(1201):
+        writer.set(f"items/{i:04d}", {"n": i})
+    writer.close()
+    assert MAX_BATCH_WRITES == 500
+    assert sorted(client.sizes) == [201, 500, 500]
+    assert (writer.writes, writer.batches) == (1201, 3)
+    assert len(documents(client.db, "items")) == 1201
+
+
+def test_chunks_under_9_mib():
+    client = FlakyClient()
+    writer = BulkWriter(client, workers=2)
+    blob = "x" * (1024 * 1024)
+    for i in range(20):
+        writer.set(f"blobs/{i:02d}", {"blob": blob})
+    writer.close()
+    # Each document is a little over 1 MiB, so 8 fit under the 9 MiB cap.
+    assert MAX_BATCH_BYTES == 9 * 1024 * 1024
+    assert sorted(client.sizes) == [4, 8, 8]
+    assert writer.bytes == sum(document_size(f"blobs/{i:02d}", {"blob": blob}) for i in range(20))
+
+
+def test_retries_transient_errors():
+    client = FlakyClient([api_exceptions.ServiceUnavailable("busy"),
+                          api_exceptions.Aborted("contention")])
+    writer = BulkWriter(client, workers=1, backoff=0.001)
+    writer.set("items/a", {"n": 1})
+    writer.close()
+    assert writer.retries == 2
+    assert (writer.writes, writer.batches) == (1, 1)
+    assert documents(client.db, "items") == {"a": {"n": 1}}
+    assert "1 writes in 1 batches" in writer.summary()
+    assert writer.summary().endswith("2 retries")
+
+
+def test_gives_up_after_max_retries():
+    client = FlakyClient([api_exceptions.ServiceUnavailable("busy")] * 3)
+    writer = BulkWriter(client, workers=1, max_retries=2, backoff=0.001)
+    writer.set("items/a", {"n": 1})
+    with pytest.raises(api_exceptions.ServiceUnavailable):
+        writer.close()
+    assert writer.retries == 2
+    assert writer.writes == 0
+    assert documents(client.db, "items") == {}
+
+
+def test_fatal_error_is_not_retried_and_propagates():
+    client = FlakyClient([api_exceptions.PermissionDenied("no")])
+    writer = BulkWriter(client, workers=1, max_writes=1, backoff=0.001)
+    writer.set("items/a", {"n": 1})
+    writer.set("items/b", {"n": 2})     # sends the first batch
+    writer._pool.submit(lambda: None).result()  # one worker: runs after the failure is recorded
+    with pytest.raises(api_exceptions.PermissionDenied):
+        writer.set("items/c", {"n": 3})
+    with pytest.raises(api_exceptions.PermissionDenied):
+        writer.close()
+    assert writer.retries == 0
+    with pytest.raises(RuntimeError, match="closed"):
+        writer.set("items/d", {"n": 4})
+
+
+def test_exception_in_block_cancels_queued_batches(caplog):
+    gate = threading.Event()
+    client = FlakyClient(gate=gate)
+    caplog.set_level(logging.ERROR)
+    with pytest.raises(KeyError):
+        with BulkWriter(client, workers=1, max_writes=1) as writer:
+            for i in range(3):
+                writer.set(f"items/{i}", {"n": i})
+            # One batch is committing and one is queued behind it.
+            threading.Timer(0.2, gate.set).start()
+            raise KeyError("stop")
+    # The queued batch was cancelled, not recorded as the writer's error.
+    assert writer._error is None
+    assert client.sizes == [1]
+    assert not caplog.records
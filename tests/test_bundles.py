@@ -0,0 +1,43 @@
+import populate_firestore
+import populate_self_care
+import seed_education
+from seeding import bundles
+from seeding.dry_run import DryRunClient
+
+
+def _planned_documents():
+    db = DryRunClient(keep_documents=True)
+    populate_firestore.populate_journey_steps(db)
+    populate_firestore.populate_config_data(db)
+    populate_self_care.populate_self_care(db)
+    seed_education.seed(db)
+    return db.plan.documents
+
+
+def _filters(structured_query):
+    where = structured_query.get("where", {})
+    filters = where.get("compositeFilter", {}).get("filters", [where] if where else [])
+    return {f["fieldFilter"]["field"]["fieldPath"]: f["fieldFilter"] for f in filters}
+
+
+def test_education_queries_are_scoped_to_the_bundle(tmp_path):
+    documents = _planned_documents()
+    index = bundles.write_bundles(documents, tmp_path, "demo-metrustual", "v1")
+    assert index["bundles"]
+    for entry in index["bundles"]:
+        language, mode = entry["language"], entry["mode"]
+        paths, queries = bundles.bundle_contents(documents, language, mode)
+        education = {name: query for name, query in queries.items() if name.startswith("education")}
+        assert list(education) == [f"education-{language}-{mode}"]
+        _, structured_query, members = education[f"education-{language}-{mode}"]
+        filters = _filters(structured_query)
+        assert filters["language"]["value"] == {"stringValue": language}
+        assert filters["mode"]["op"] == "ARRAY_CONTAINS_ANY"
+        for path in members:
+            assert path in paths
+            assert documents[path]["language"] == language
+
+        names = [element["namedQuery"]["name"]
+                 for element in bundles.read_elements((tmp_path / entry["file"]).read_bytes())
+                 if "namedQuery" in element]
+        assert names == sorted(queries)
@@ -0,0 +1,111 @@
+import populate_self_care
+import seed_education
+from seeding import changes
+
+from conftest import documents
+
+
+def test_first_sync_is_logged_and_noop_sync_is_not(db, bundle):
+    seed_education.sync(db)
+    assert db.document(changes.HEAD).get().to_dict()["seq"] == 1
+    entry = db.document(changes.entry_path(1)).get().to_dict()
+    assert entry["seq"] == 1
+    assert entry["version"] == bundle["version"]
+    assert len(entry["collections"][seed_education.COLLECTION]["added"]) == \
+        len(bundle["data"]["education_articles"])
+
+    seed_education.sync(db)
+    assert db.document(changes.HEAD).get().to_dict()["seq"] == 1
+    assert list(documents(db, changes.COLLECTION)) == ["00000001"]
+
+
+def test_changes_since_merges_entries(db):
+    seed_education.sync(db)
+    populate_self_care.sync_self_care(db)
+    first = sorted(documents(db, seed_education.COLLECTION))[0]
+    db.document(f"{seed_education.COLLECTION}/{first}").delete()
+    seed_education.sync(db)                     # re-adds it: seq 3
+
+    delta = changes.changes_since(db, 2)
+    assert delta["seq"] == 3
+    assert delta["collections"] == {
+        seed_education.COLLECTION: {"upserted": [first], "removed": []}}
+    assert changes.changes_since(db, 3) == {"seq": 3, "collections": {}}
+    assert set(changes.changes_since(db, 0)["collections"]) > {seed_education.COLLECTION,
+                                                               populate_self_care.VIEW_PATH}
+
+
+def test_merge_entries_applies_in_seq_order():
+    merged = changes.merge_entries([
+        {"seq": 2, "collections": {"a": {"removed": ["x"]}}},
+        {"seq": 1, "collections": {"a": {"added": ["x", "y"]}}},
+        {"seq": 3, "collections": {"a": {"modified": ["z"], "removed": ["y"]}}},
+    ])
+    assert merged == {"seq": 3, "collections": {"a": {"upserted": ["z"], "removed": ["x", "y"]}}}
+
+
+def test_lost_race_retries_with_the_next_seq(db):
+    results = {"c": {"created": ["a"], "changed": [], "deleted": [], "unchanged": []}}
+    assert changes.record_changes(db, results) == 1
+    stale_head = db.document(changes.HEAD).get()
+    # Another seeder appends seq 2 between our head read and our commit.
+    assert changes.record_changes(db, results) == 2
+    other_entry = db.document(changes.entry_path(2)).get().to_dict()
+
+    reads = []
+    real_document = db.document
+
+    def document(path):
+        ref = real_document(path)
+        if path == changes.HEAD and not reads:
+            reads.append(path)
+            ref.get = lambda: stale_head
+        return ref
+
+    db.document = document
+    assert changes.record_changes(db, results) == 3
+    assert db.document(changes.entry_path(2)).get().to_dict() == other_entry
+    assert db.document(changes.HEAD).get().to_dict()["seq"] == 3
+
+
+def test_interrupted_sync_is_logged_by_the_next_one(db, monkeypatch):
+    def crash(*args, **kwargs):
+        raise SystemExit("killed after the data commits")
+
+    monkeypatch.setattr(changes, "record_changes", crash)
+    try:
+        seed_education.sync(db)
+    except SystemExit:
+        pass
+    monkeypatch.undo()
+    head = db.document(changes.HEAD).get().to_dict()
+    assert "seq" not in head and seed_education.COLLECTION in head[changes.PENDING_FIELD]
+    assert documents(db, changes.COLLECTION) == {}
+
+    # Nothing left to write, but the pending change still gets its entry.
+    results = seed_education.sync(db)
+    assert not results[seed_education.COLLECTION]["created"]
+    head = db.document(changes.HEAD).get().to_dict()
+    assert head == {"seq": 1, "updatedAt": head["updatedAt"]}
+    entry = db.document(changes.entry_path(1)).get().to_dict()
+    assert entry["collections"][seed_education.COLLECTION]["added"] == \
+        sorted(documents(db, seed_education.COLLECTION))
+
+
+def test_combine_keeps_each_ids_latest_change():
+    older = {"a": {"added": ["x", "y"], "modified": [], "removed": ["z"]}}
+    newer = {"a": {"added": ["z"], "modified": [], "removed": ["y"]},
+             "b": {"added": [], "modified": ["w"], "removed": []}}
+    assert changes.combine(older, newer) == {
+        "a": {"added": ["x", "z"], "modified": [], "removed": ["y"]},
+        "b": {"added": [], "modified": ["w"], "removed": []}}
+
+
+def test_dry_run_logs_nothing():
+    from seeding.dry_run import DryRunClient
+
+    db = DryRunClient(keep_documents=True)
+    seed_education.sync(db)
+    populate_self_care.sync_self_care(db)
+    assert not any(path.startswith((changes.COLLECTION + "/", changes.HEAD))
+                   for path in db.plan.documents)
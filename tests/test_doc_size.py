@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from seeding.bulk_writer import BulkWriter
+from seeding.doc_size import (MAX_DOCUMENT_BYTES, document_name_size, document_size, string_size,
+                              value_size)
+from seeding.dry_run import DryRunClient, index_entries
+
+# The worked example from Firestore's storage-size documentation.
+TASK_PATH = "users/jeff/tasks/my_task_id"
+TASK = {"type": "Personal", "done": False, "priority": 1, "description": "Learn Cloud Firestore"}
+
+
+def test_matches_the_documented_example():
+    assert document_name_size(TASK_PATH) == 44
+    assert document_name_size(f"/{TASK_PATH}/") == 44
+    assert document_size(TASK_PATH, TASK) == 147
+
+
+def test_value_sizes():
+    assert string_size("é") == 3
+    assert value_size(None) == value_size(True) == 1
+    assert value_size(7) == value_size(0.5) == value_size(datetime.now(timezone.utc)) == 8
+    assert value_size(b"\x00\x01") == 2
+    assert value_size(["ab", 1]) == 3 + 8
+    assert value_size({"a": {"b": "c"}}) == 2 + 2 + 2
+
+
+def test_unknown_values_are_rejected():
+    with pytest.raises(TypeError, match="Unsupported Firestore value"):
+        value_size(object())
+
+
+def test_dry_run_tallies_sizes_and_flags_large_documents():
+    db = DryRunClient()
+    writer = BulkWriter(db, workers=1)
+    writer.set(TASK_PATH, TASK)
+    writer.set("users/jeff/tasks/big", {"blob": "x" * MAX_DOCUMENT_BYTES})
+    writer.delete("users/jeff/tasks/old")
+    writer.close()
+
+    group = db.plan.groups["users/*/tasks"]
+    assert group["writes"] == 2 and group["deletes"] == 1
+    assert group["bytes"] == (document_size(TASK_PATH, TASK)
+                              + document_size("users/jeff/tasks/big", {"blob": "x" * MAX_DOCUMENT_BYTES})
+                              + document_name_size("users/jeff/tasks/old"))
+    assert group["index_entries"] == index_entries(TASK) + 2 == 10
+    assert [path for _, path in db.plan.near_limit] == ["users/jeff/tasks/big"]
+    assert "✗ over the 1 MiB document limit: users/jeff/tasks/big" in db.plan.report()
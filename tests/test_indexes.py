@@ -0,0 +1,82 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from seeding import indexes, synthetic
+
+
+def test_month_logs_binds_timestamps_that_match_seeded_logs(db):
+    generator = synthetic.Generator(synthetic.load_profile(None), until=datetime(2024, 3, 31).date())
+    for path, data in generator.documents(3):
+        db.document(path).set(data)
+    params = {**indexes.DEFAULT_PARAMS, "uid": indexes.first_user(db),
+              "month_start": indexes.PARAM_TYPES["month_start"]("2024-02-01"),
+              "month_end": indexes.PARAM_TYPES["month_end"]("2024-02-29")}
+    assert params["month_start"] == datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+    month = [query for query in indexes.QUERIES if query.name == "month-logs"]
+    results = indexes.run_queries(db, month, params, repeat=1)["month-logs"]
+    assert results["error"] is None
+    expected = sum(1 for snapshot in db.collection(f"users/{params['uid']}/logs/period/entries").stream()
+                   if params["month_start"] <= snapshot.to_dict()["date"] <= params["month_end"])
+    assert results["count"] == expected > 0
+
+
+def test_default_month_is_the_last_full_month():
+    start, end = indexes.DEFAULT_PARAMS["month_start"], indexes.DEFAULT_PARAMS["month_end"]
+    assert start.day == 1 and start.tzinfo is timezone.utc
+    assert (end.year, end.month) == (start.year, start.month) and end < datetime.now(timezone.utc)
+
+
+def test_committed_indexes_file_is_up_to_date():
+    planned, served = indexes.plan_indexes(indexes.QUERIES)
+    current = indexes.load_indexes()
+    with open(indexes.INDEXES_PATH, encoding="utf-8") as f:
+        assert f.read() == indexes.render_indexes(planned, current["fieldOverrides"])
+    assert current["indexes"] == planned
+    assert served["month-logs"] is None and served["education"] is not None
+
+
+def test_required_shape():
+    A, D, C = indexes.ASCENDING, indexes.DESCENDING, indexes.CONTAINS
+    shape = indexes.required_shape(indexes.Query(
+        "q", "items", where=[("tag", "array_contains", "x"), ("kind", "==", 1), ("age", ">", 3)],
+        order_by=[("kind", A), ("score", D), ("__name__", A)]))
+    assert shape.equality == {("tag", C), ("kind", A)}
+    # The range field leads, equality fields drop out and __name__ is implicit.
+    assert shape.ordered == (("age", A), ("score", D))
+
+    single_field = [
+        indexes.Query("q", "items", where=[("kind", "==", 1), ("tag", "array_contains", "x")]),
+        indexes.Query("q", "items", where=[("age", ">=", 1), ("age", "<=", 9)]),
+        indexes.Query("q", "items", where=[("age", ">", 1)], order_by=[("age", D)]),
+    ]
+    assert [indexes.required_shape(query) for query in single_field] == [None, None, None]
+    with pytest.raises(ValueError, match="unsupported operator"):
+        indexes.required_shape(indexes.Query("q", "items", where=[("age", "~", 1)]))
+
+
+def test_one_index_serves_a_prefix_query():
+    queries = [indexes.Query("by-x", "items", where=[("a", "==", 1)], order_by=["x"]),
+               indexes.Query("by-x-y", "items", where=[("a", "==", 1)], order_by=["x", "y"]),
+               indexes.Query("by-a", "items", where=[("a", "==", 1)])]
+    planned, served = indexes.plan_indexes(queries)
+    A = indexes.ASCENDING
+    assert [index["fields"] for index in planned] == [[("a", A), ("x", A), ("y", A)]]
+    assert served == {"by-x": 0, "by-x-y": 0, "by-a": None}
+
+    redundant = {"collectionGroup": "items", "queryScope": indexes.COLLECTION,
+                 "fields": [("a", A), ("x", A)]}
+    unused = {**redundant, "fields": [("b", A), ("x", A)]}
+    assert indexes.dropped_indexes(planned + [redundant, unused], planned, queries) == [
+        (redundant, "its queries are served by the planned indexes"),
+        (unused, "no catalogued query uses it"),
+    ]
+
+
+def test_indexes_file_round_trips(tmp_path):
+    planned, _ = indexes.plan_indexes(indexes.QUERIES)
+    path = tmp_path / "firestore.indexes.json"
+    path.write_text(indexes.render_indexes(planned), encoding="utf-8")
+    assert indexes.load_indexes(str(path)) == {"indexes": planned, "fieldOverrides": []}
+    assert indexes.load_indexes(str(tmp_path / "missing.json")) == {"indexes": [], "fieldOverrides": []}
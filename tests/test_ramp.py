@@ -0,0 +1,86 @@
+import pytest
+
+from seeding import ramp
+from seeding.bulk_writer import BulkWriter
+from seeding.memory import MemoryClient
+
+from conftest import documents
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def test_rate_grows_by_half_every_five_minutes(clock):
+    controller = ramp.RampController(clock=clock)
+    assert [controller.rate(t) for t in (0, 299, 300, 600)] == [500, 500, 750, 1125]
+    capped = ramp.RampController(max_rate=600, clock=clock)
+    assert capped.rate(300) == 600
+
+
+def test_reserve_paces_from_the_first_batch(clock):
+    controller = ramp.RampController(clock=clock)
+    # No initial burst: even the first batch waits for its ops to accrue.
+    assert controller.reserve(500) == pytest.approx(1.0)
+    assert controller.reserve(250) == pytest.approx(1.5)
+    clock.now = 1.0
+    assert controller.reserve(250) == pytest.approx(1.0)
+    clock.now = 10.0
+    assert controller.reserve(50) == pytest.approx(0.1)
+
+
+def test_throttling_halves_the_rate_once_per_event(clock):
+    controller = ramp.RampController(clock=clock)
+    clock.now = 600
+    controller.throttled()
+    clock.now = 600.5
+    controller.throttled()      # same overload event
+    assert controller.throttles == 1
+    assert controller.rate() == pytest.approx(562.5)
+    # The schedule restarts from the cut.
+    assert controller.rate(600 + 299) == pytest.approx(562.5)
+    assert controller.rate(600 + 300) == pytest.approx(843.75)
+
+    for _ in range(10):
+        clock.now += ramp.COOLDOWN_SECONDS
+        controller.throttled()
+    assert controller.rate() == ramp.MIN_RATE
+
+
+def test_report_buckets_writes_by_minute(clock):
+    controller = ramp.RampController(clock=clock)
+    clock.now = 5
+    controller.record(100)
+    clock.now = 65
+    controller.record(50)
+    clock.now = 90
+    lines = controller.report().splitlines()
+    assert lines[1].split()[:2] == ["0:00–1:00", "100"]
+    assert lines[2].split()[:2] == ["1:00–2:00", "50"]
+    assert lines[-1].startswith("  150 writes in 90.0s")
+
+
+def test_spread_key_scatters_sequential_paths():
+    ops = [("set", f"users/u{i:05d}", {}, False) for i in range(100)]
+    assert ramp.spread_key(ops[0]) == ramp.spread_key(("delete", "users/u00000", None, False))
+    assert sorted(ops, key=ramp.spread_key) != ops
+
+
+def test_writer_commits_everything_through_the_ramp():
+    db = MemoryClient(project="demo-metrustual")
+    controller = ramp.RampController(start=1_000_000)
+    writer = BulkWriter(db, workers=2, max_writes=10, ramp=controller)
+    for i in range(55):
+        writer.set(f"items/{i:03d}", {"n": i})
+    writer.close()
+    assert controller.writes == writer.writes == 55
+    assert len(documents(db, "items")) == 55
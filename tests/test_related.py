@@ -0,0 +1,75 @@
+import numpy as np
+
+from seeding import related
+
+
+def _article(title, body, tag="cycle", mode=("all",)):
+    return {"language": "en", "title": title, "keyPoints": [title], "body": body,
+            "tag": tag, "mode": list(mode), "isPublished": True}
+
+
+def _corpus(count):
+    rng = np.random.default_rng(7)
+    words = [f"word{i}" for i in range(60)]
+    tags = ["cycle", "nutrition", "sleep"]
+    modes = [("all",), ("track",), ("ttc",), ("track", "preg")]
+    return {f"a{i:03d}": _article(" ".join(rng.choice(words, 3)), " ".join(rng.choice(words, 25)),
+                                  tags[i % 3], modes[i % 4])
+            for i in range(count)}
+
+
+def _brute_force(ids, articles, k):
+    documents = [related._terms(article) for article in articles]
+    vocabulary = sorted({term for counts in documents for term in counts})
+    n = len(documents)
+    df = {term: sum(term in counts for counts in documents) for term in vocabulary}
+    vectors = np.array([[(1 + np.log(counts[term])) * (np.log((1 + n) / (1 + df[term])) + 1)
+                         if term in counts else 0.0 for term in vocabulary] for counts in documents])
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    modes = related._mode_matrix(articles).astype(float)
+    result = {}
+    for i, doc_id in enumerate(ids):
+        scored = []
+        for j, other in enumerate(ids):
+            if i == j:
+                continue
+            score = vectors[i] @ vectors[j]
+            score *= 1 + related.TAG_BONUS * (articles[i]["tag"] == articles[j]["tag"])
+            shared = modes[i] @ modes[j]
+            union = modes[i].sum() + modes[j].sum() - shared
+            score *= related.MODE_FLOOR + (1 - related.MODE_FLOOR) * (shared / union if union else 0)
+            scored.append((-round(score, 5), other, score))
+        result[doc_id] = [other for _, other, score in sorted(scored)[:k] if score > 0]
+    return result
+
+
+def test_matches_brute_force_across_blocks(monkeypatch):
+    by_id = _corpus(90)
+    ids = sorted(by_id)
+    expected = _brute_force(ids, [by_id[doc_id] for doc_id in ids], 3)
+    # Whole-corpus blocks, then blocks and chunks far smaller than the corpus.
+    assert related.top_related(ids, [by_id[doc_id] for doc_id in ids], 3) == expected
+    monkeypatch.setattr(related, "MAX_DENSE_CELLS", 400)
+    shuffled = ids[::-1]
+    assert related.top_related(shuffled, [by_id[doc_id] for doc_id in shuffled], 3) == expected
+
+
+def test_ties_go_to_the_lowest_id(monkeypatch):
+    monkeypatch.setattr(related, "MAX_DENSE_CELLS", 8)
+    twin = _article("iron levels", "iron rich food during the period")
+    ids = ["d", "b", "a", "c"]
+    articles = [twin, twin, twin, _article("sleep", "rest well at night", tag="sleep")]
+    result = related.top_related(ids, articles, k=2)
+    assert result["a"] == ["b", "d"]
+    assert result["d"] == ["a", "b"]
+    assert result["c"] == []
+
+
+def test_csr_keeps_only_shared_terms():
+    matrix = related.tfidf_matrix([{"iron": 2, "only": 1}, {"iron": 1, "rest": 1}, {"rest": 3}])
+    assert matrix.width == 2
+    assert list(np.diff(matrix.indptr)) == [1, 2, 1]
+    dense = related._dense(matrix, 0, 3)
+    # The unshared term still counts toward the first row's norm.
+    assert 0 < np.linalg.norm(dense[0]) < 1
+    assert np.allclose(np.linalg.norm(dense[1:], axis=1), 1)
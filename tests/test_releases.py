@@ -0,0 +1,83 @@
+import pytest
+
+import populate_firestore
+from seeding import releases
+
+
+@pytest.fixture
+def snapshot(bundle):
+    documents = populate_firestore.config_documents(bundle["data"]["config"])
+    documents.update({f"journeys/{mode}": {"mode": mode, "steps": steps}
+                      for mode, steps in bundle["data"]["journeys"].items()})
+    return documents
+
+
+def test_publish_writes_verifies_and_flips_the_pointer(db, snapshot):
+    version = releases.publish(db, snapshot)
+    assert version == releases.release_version(snapshot)
+    assert releases.verify_release(db, version, snapshot) == []
+    for path, data in snapshot.items():
+        assert db.document(releases.release_path(version, path)).get().to_dict() == data
+
+    release = releases.read_release(db, version)
+    assert release["status"] == releases.VERIFIED
+    assert release["documents"] == len(snapshot)
+    assert release["collections"] == ["config", "journeys"]
+    pointer = releases.read_pointer(db)
+    assert pointer["version"] == version
+    assert pointer["previous"] is None
+
+
+def test_republishing_the_same_content_only_keeps_the_pointer(db, snapshot):
+    version = releases.publish(db, snapshot)
+    commits = db.stats["commits"]
+    assert releases.publish(db, snapshot) == version
+    assert db.stats["commits"] == commits
+
+
+def test_verify_reports_missing_and_altered_documents(db, snapshot):
+    version = releases.publish(db, snapshot)
+    db.document(releases.release_path(version, "config/symptoms")).delete()
+    db.document(releases.release_path(version, "config/data")).set({"symptoms": []})
+    assert releases.verify_release(db, version, snapshot) == ["config/data", "config/symptoms"]
+
+
+def test_failed_verification_leaves_the_pointer(db, snapshot, monkeypatch):
+    live = releases.publish(db, snapshot)
+    changed = {**snapshot, "config/data": {"symptoms": []}}
+    monkeypatch.setattr(releases, "verify_release", lambda db, version, documents: ["config/data"])
+    with pytest.raises(RuntimeError, match="failed verification"):
+        releases.publish(db, changed)
+    assert releases.read_pointer(db)["version"] == live
+    assert releases.read_release(db, releases.release_version(changed)) is None
+
+
+def test_rollback_returns_to_the_previous_release(db, snapshot):
+    first = releases.publish(db, snapshot)
+    second = releases.publish(db, {**snapshot, "config/data": {"symptoms": []}})
+    assert releases.read_pointer(db)["previous"] == first
+
+    assert releases.rollback(db) == first
+    assert releases.read_pointer(db)["version"] == first
+    assert releases.rollback(db, second) == second
+    with pytest.raises(ValueError):
+        releases.rollback(db, "no-such-version")
+    assert [version for version, _ in releases.list_releases(db)] == [first, second]
+
+
+def test_repeated_rollbacks_keep_moving_back(db, snapshot):
+    versions = [releases.publish(db, {**snapshot, "config/data": {"symptoms": [str(i)]}})
+                for i in range(3)]
+    assert releases.read_pointer(db)["history"] == versions
+
+    assert releases.rollback(db) == versions[1]
+    assert releases.rollback(db) == versions[0]
+    pointer = releases.read_pointer(db)
+    assert pointer["history"] == versions[:1]
+    assert pointer["previous"] is None
+    with pytest.raises(ValueError, match="No previous release"):
+        releases.rollback(db)
+
+    # Republishing the bad release puts it back on top of the history.
+    assert releases.publish(db, {**snapshot, "config/data": {"symptoms": ["2"]}}) == versions[2]
+    assert releases.read_pointer(db)["history"] == [versions[0], versions[2]]
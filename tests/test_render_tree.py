@@ -0,0 +1,78 @@
+import shutil
+
+import pytest
+
+from seeding import content, render_tree
+
+
+BODY = """## Why it happens
+Cramps come from **prostaglandins**.
+
+> Heat helps.
+1. Rest
+- Drink *water*"""
+
+
+def test_blocks_and_spans():
+    tree = render_tree.render_tree(BODY)
+    assert tree["v"] == render_tree.RENDER_VERSION
+    assert tree["hash"] == render_tree.body_hash(BODY)
+    assert tree["blocks"] == [
+        {"t": "h2", "c": [{"s": "Why it happens"}]},
+        {"t": "p", "c": [{"s": "Cramps come from "}, {"s": "prostaglandins", "b": True}, {"s": "."}]},
+        {"t": "gap"},
+        {"t": "quote", "c": [{"s": "Heat helps."}]},
+        {"t": "li", "n": 1, "c": [{"s": "Rest"}]},
+        {"t": "li", "c": [{"s": "Drink *water*"}]},
+    ]
+
+
+@pytest.mark.parametrize("body, message", [
+    ("# Title", "line 1: only '##' and '###' headings"),
+    ("ok\n**bold", "line 2: unclosed '**'"),
+    ("## ", "line 1: empty heading"),
+    ("- ", "line 1: empty list item"),
+    (">", "line 1: empty quote"),
+    ("a ****", "line 1: empty '****' bold span"),
+])
+def test_unrenderable_markup_is_rejected(body, message):
+    with pytest.raises(render_tree.MarkupError, match=message.replace("*", r"\*")):
+        render_tree.render_tree(body)
+
+
+def test_reusable_trees_skip_other_versions():
+    tree = render_tree.render_tree(BODY)
+    stale = {**tree, "v": render_tree.RENDER_VERSION - 1, "hash": "old"}
+    assert render_tree.reusable_trees([tree, stale, None]) == {tree["hash"]: tree}
+
+
+def _copy_content(tmp_path):
+    content_dir = tmp_path / "content"
+    shutil.copytree(content.CONTENT_DIR, content_dir)
+    return str(content_dir)
+
+
+def test_compile_parses_each_body_once(tmp_path, monkeypatch):
+    content_dir = _copy_content(tmp_path)
+    out_path = str(tmp_path / "bundle.json")
+    parses = []
+    real_parse = render_tree._parse
+    monkeypatch.setattr(render_tree, "_parse", lambda body: parses.append(body) or real_parse(body))
+
+    bundle = content.compile_bundle(content_dir, out_path)
+    articles = bundle["data"]["education_articles"]
+    assert sorted(parses) == sorted(article["body"] for article in articles)
+    assert all(article["bodyTree"] == render_tree.render_tree(article["body"]) for article in articles)
+
+    # Recompiling unchanged bodies reuses the previous bundle's trees.
+    parses.clear()
+    content.compile_bundle(content_dir, out_path)
+    assert parses == []
+
+
+def test_bad_markup_names_the_file(tmp_path):
+    content_dir = _copy_content(tmp_path)
+    article = next((tmp_path / "content" / "education").rglob("*.md"))
+    article.write_text(article.read_text(encoding="utf-8") + "\n# Not rendered\n", encoding="utf-8")
+    with pytest.raises(content.ContentError, match=rf"{article.name}: line \d+: only '##'"):
+        content.compile_bundle(content_dir, None)
@@ -0,0 +1,95 @@
+import copy
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from seeding import schema
+from seeding.content import ROOT, article_id
+
+
+def _errors(check, value):
+    errors = []
+    check(value, "doc", errors)
+    return errors
+
+
+def test_shipped_content_and_test_data_are_valid(bundle):
+    assert schema.content_errors(bundle["data"], article_id) == []
+    with open(os.path.join(ROOT, "firebase_test_data.json"), encoding="utf-8") as f:
+        assert schema.test_data_errors(json.load(f)) == []
+
+
+@pytest.mark.parametrize("check, value, expected", [
+    (schema.string(), 3, "doc: expected string, got int"),
+    (schema.string(), "  ", "doc: must not be empty"),
+    (schema.string(pattern=r"\d+"), "x", "doc: 'x' does not match \\d+"),
+    (schema.integer(1, 5), True, "doc: expected integer, got bool"),
+    (schema.integer(1, 5), 6, "doc: 6 is above 5"),
+    (schema.number(0), -0.5, "doc: -0.5 is below 0"),
+    (schema.one_of("a", "b"), "c", "doc: 'c' is not one of a, b"),
+    (schema.timestamp(), "yesterday", "doc: expected timestamp, got 'yesterday'"),
+    (schema.list_of(schema.string(), min_items=1), [], "doc: needs at least 1 item(s)"),
+    (schema.map_of(schema.string(), keys=("a",)), {"b": "x"}, "doc.b: 'b' is not one of a"),
+])
+def test_combinators(check, value, expected):
+    assert _errors(check, value) == [expected]
+
+
+def test_timestamps_accept_datetimes_and_iso_strings():
+    check = schema.timestamp()
+    assert _errors(check, datetime(2024, 3, 1, tzinfo=timezone.utc)) == []
+    assert _errors(check, "2024-03-01T08:00:00Z") == []
+
+
+def test_record_reports_every_problem_in_one_pass():
+    check = schema.record({"name": schema.string(), "age": schema.integer(0)},
+                          optional={"tags": schema.list_of(schema.string(), unique_by="k")})
+    assert _errors(check, {"age": -1, "colour": "red"}) == [
+        "doc: missing required field 'name'",
+        "doc.age: -1 is below 0",
+        "doc: unexpected field 'colour'",
+    ]
+    keyed = schema.list_of(schema.record({"k": schema.string()}), unique_by="k")
+    assert _errors(keyed, [{"k": "a"}, {"k": "a"}]) == ["doc[1].k: duplicate 'a'"]
+
+
+def test_stepper_steps_need_consistent_bounds():
+    step = {"icon": "⏱", "q": "How long?", "sub": "Days", "type": "stepper", "key": "len",
+            "min": 1, "max": 10, "def": 12, "unit": "days"}
+    assert _errors(schema.JOURNEY_STEP, step) == ["doc: stepper needs min <= def <= max"]
+    chips = {**step, "type": "chips-single", "opts": [{"e": "🙂", "l": "Fine"}]}
+    for field in ("min", "max", "def", "unit"):
+        del chips[field]
+    assert _errors(schema.JOURNEY_STEP, chips) == [
+        "doc.opts[0]: single-choice option needs a value 'v'"]
+
+
+def test_content_errors_check_ids_and_references(bundle):
+    data = copy.deepcopy(bundle["data"])
+    articles = data["education_articles"]
+    articles.append(copy.deepcopy(articles[0]))
+    articles[1]["relatedIds"] = ["en-missing"]
+    last = len(articles) - 1
+    assert schema.content_errors(data, article_id) == [
+        f"education_articles[{last}]: ID '{article_id(articles[0])}' already used by education_articles[0]",
+        "education_articles[1].relatedIds: unknown article 'en-missing'",
+    ]
+
+
+def test_document_errors_pick_the_schema_by_path():
+    entry = {"date": "2024-03-01", "flow": "heavy", "painLevel": 9}
+    assert schema.document_errors("users/u1/logs/period/entries/2024-03-01", entry) == [
+        "users/u1/logs/period/entries/2024-03-01.painLevel: 9 is above 5"]
+    assert schema.document_errors("unknown/doc", {"anything": 1}) == []
+
+
+def test_validation_error_lists_the_first_twenty():
+    with pytest.raises(schema.ValidationError) as raised:
+        schema.validate_content({}, article_id)
+    error = raised.value
+    assert str(error).startswith(f"{len(error.errors)} schema error(s):")
+    many = schema.ValidationError([f"e{i}" for i in range(25)])
+    assert "e19" in str(many) and "e20" not in str(many)
+    assert str(many).endswith("… and 5 more")
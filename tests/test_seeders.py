@@ -0,0 +1,73 @@
+import populate_firestore
+import populate_self_care
+import seed_education
+from seeding import search
+from seeding.content import article_id
+from seeding.sync import HASH_FIELD
+
+from conftest import documents
+
+
+def test_journey_steps(db, bundle):
+    assert populate_firestore.populate_journey_steps(db) is True
+    journeys = documents(db, "journeys")
+    assert set(journeys) == set(bundle["data"]["journeys"])
+    for mode, steps in bundle["data"]["journeys"].items():
+        assert journeys[mode]["steps"] == steps
+        assert journeys[mode]["mode"] == mode
+        assert journeys[mode]["createdAt"] is not None
+
+
+def test_config_read_paths(db, bundle):
+    assert populate_firestore.populate_config_data(db) is True
+    config = bundle["data"]["config"]
+    for path, data in populate_firestore.config_documents(config).items():
+        assert db.document(path).get().to_dict() == data
+    assert db.document("config/symptoms").get().to_dict()["items"] == config["symptoms"]
+    assert db.document("config/insight_tips").get().to_dict()["tips"] == config["insight_tips"]
+
+
+def test_self_care_tree_and_views(db, bundle):
+    populate_self_care.populate_self_care(db)
+    for mode, phases in bundle["data"]["self_care"].items():
+        mode_path = f"config/self_care/{mode}"
+        assert set(documents(db, mode_path)) == set(phases)
+        for phase, data in phases.items():
+            rituals = documents(db, f"{mode_path}/{phase}/rituals")
+            assert [rituals[str(i + 1)] for i in range(len(rituals))] == data["rituals"]
+        view = db.document(f"{populate_self_care.VIEW_PATH}/{mode}").get().to_dict()
+        assert view == populate_self_care.self_care_view(mode, phases)
+
+
+def test_education_sync_is_idempotent(db, bundle):
+    articles = bundle["data"]["education_articles"]
+    first = seed_education.sync(db)
+    assert sorted(first[seed_education.COLLECTION]["created"]) == sorted(map(article_id, articles))
+    stored = documents(db, seed_education.COLLECTION)
+    assert {doc_id: data["title"] for doc_id, data in stored.items()} == \
+        {article_id(article): article["title"] for article in articles}
+    assert documents(db, seed_education.INDEX_COLLECTION)
+    assert documents(db, search.COLLECTION)
+
+    second = seed_education.sync(db)
+    for result in second.values():
+        assert not (result["created"] or result["changed"] or result["deleted"])
+    assert documents(db, seed_education.COLLECTION) == stored
+
+
+def test_education_sync_rewrites_stale_and_removes_stray(db):
+    seed_education.sync(db)
+    stale = sorted(documents(db, seed_education.COLLECTION))[0]
+    created_at = db.document(f"{seed_education.COLLECTION}/{stale}").get().to_dict()["createdAt"]
+    # An article seeded from older content: its stored hash no longer matches.
+    db.document(f"{seed_education.COLLECTION}/{stale}").update(
+        {"title": "Old title", HASH_FIELD: "outdated"})
+    db.document(f"{seed_education.COLLECTION}/stray").set({"title": "Not in content/"})
+
+    result = seed_education.sync(db)[seed_education.COLLECTION]
+    assert result["changed"] == [stale]
+    assert result["deleted"] == ["stray"]
+    assert not db.document(f"{seed_education.COLLECTION}/stray").get().exists
+    rewritten = db.document(f"{seed_education.COLLECTION}/{stale}").get().to_dict()
+    assert rewritten["title"] != "Old title"
+    assert rewritten["createdAt"] == created_at
@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+
+from seeding.bulk_writer import BulkWriter
+from seeding.sync import HASH_FIELD, content_hash, slugify, sync_collection
+
+from conftest import documents
+
+EARLY = datetime(2024, 1, 1, tzinfo=timezone.utc)
+LATER = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+
+def test_content_hash_ignores_bookkeeping_fields():
+    data = {"title": "Iron", "tags": ["food"]}
+    digest = content_hash(data)
+    assert content_hash({**data, "createdAt": EARLY, "updatedAt": LATER, HASH_FIELD: "x"}) == digest
+    assert content_hash({"tags": ["food"], "title": "Iron"}) == digest
+    assert content_hash({**data, "title": "Iron rich food"}) != digest
+
+
+def test_slugify():
+    assert slugify("What’s a Luteal Phase?") == "whats-a-luteal-phase"
+    assert slugify("Café crème") == "cafe-creme"
+
+
+def _sync(db, desired, now):
+    writer = BulkWriter(db, workers=1)
+    result = sync_collection(db, writer, "articles", desired, now=now)
+    writer.close()
+    return result
+
+
+def test_sync_writes_only_the_difference(db):
+    first = _sync(db, {"a": {"title": "A"}, "b": {"title": "B"}}, EARLY)
+    assert sorted(first["created"]) == ["a", "b"]
+
+    second = _sync(db, {"a": {"title": "A", "updatedAt": LATER}, "b": {"title": "B2"},
+                        "c": {"title": "C"}}, LATER)
+    assert second == {"created": ["c"], "changed": ["b"], "deleted": [], "unchanged": ["a"]}
+    stored = documents(db, "articles")
+    assert stored["a"]["updatedAt"] == EARLY
+    # A changed document keeps its original createdAt.
+    assert (stored["b"]["createdAt"], stored["b"]["updatedAt"]) == (EARLY, LATER)
+    assert stored["b"][HASH_FIELD] == content_hash({"title": "B2"})
+
+    third = _sync(db, {"c": {"title": "C"}}, LATER)
+    assert third["deleted"] == ["a", "b"]
+    assert set(documents(db, "articles")) == {"c"}
@@ -0,0 +1,39 @@
+from seeding import tracing
+
+
+def _traced(db):
+    tracer = tracing.Tracer()
+    return tracing.TracedClient(db, tracer), tracer
+
+
+def test_stopping_a_stream_early_is_not_an_error(db):
+    for i in range(5):
+        db.document(f"articles/{i}").set({"n": i})
+    traced, tracer = _traced(db)
+
+    stream = traced.collection("articles").stream()
+    next(stream)
+    stream.close()
+    for _ in traced.collection("articles").stream():
+        break
+
+    assert [span.name for span in tracer.spans] == ["firestore.query", "firestore.query"]
+    assert all(span.error is None for span in tracer.spans)
+    assert [span.attributes["documents"] for span in tracer.spans] == [1, 1]
+    statuses = [span["status"] for span in tracer.otlp()["resourceSpans"][0]["scopeSpans"][0]["spans"]]
+    assert statuses == [{"code": tracing.STATUS_OK}] * 2
+
+
+def test_failing_stream_is_an_error(db):
+    traced, tracer = _traced(db)
+
+    def broken():
+        yield db.document("articles/1")
+        raise RuntimeError("stream reset")
+
+    span = tracer.start("firestore.query", tracing.CLIENT)
+    try:
+        list(traced._drain(span, broken(), count=True))
+    except RuntimeError:
+        pass
+    assert tracer.spans[0].error == "RuntimeError: stream reset"
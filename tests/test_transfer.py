@@ -0,0 +1,56 @@
+import os
+
+import populate_firestore
+import populate_self_care
+import seed_education
+from seeding import transfer
+from seeding.bulk_writer import BulkWriter
+from seeding.memory import MemoryClient
+from seeding.synthetic import DEFAULT_PROFILE, Generator
+
+
+def all_documents(db):
+    """{path: data} for every document, via the same discovery as the exporter"""
+    found = {}
+    for group in transfer.discover_groups(db):
+        for snapshot in db.collection_group(group).stream():
+            found[snapshot.reference.path] = snapshot.to_dict()
+    return found
+
+
+def seed_everything(db):
+    populate_firestore.populate_journey_steps(db)
+    populate_firestore.populate_config_data(db)
+    populate_self_care.populate_self_care(db)
+    seed_education.sync(db)
+    writer = BulkWriter(db)
+    for path, data in Generator(DEFAULT_PROFILE, seed=1).documents(3):
+        writer.set(path, data)
+    writer.close()
+
+
+def test_export_import_round_trip(db, tmp_path):
+    seed_everything(db)
+    source = all_documents(db)
+    assert any(path.startswith("users/") and "/entries/" in path for path in source)
+
+    checkpoint = transfer.export_tree(db, str(tmp_path), page_size=50)
+    assert sum(state["count"] for state in checkpoint.state["groups"].values()) == len(source)
+
+    target = MemoryClient()
+    writer = transfer.import_tree(target, str(tmp_path))
+    assert writer.writes == len(source)
+    assert all_documents(target) == source
+
+
+def test_import_resumes_from_its_checkpoint(db, tmp_path):
+    seed_everything(db)
+    transfer.export_tree(db, str(tmp_path))
+    target = MemoryClient()
+    transfer.import_tree(target, str(tmp_path))
+
+    # A second run finds every group already imported and writes nothing.
+    again = transfer.import_tree(target, str(tmp_path))
+    assert again.writes == 0
+    os.remove(tmp_path / transfer.IMPORT_STATE)
+    assert transfer.import_tree(MemoryClient(), str(tmp_path)).writes == len(all_documents(db))